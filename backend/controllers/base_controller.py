@@ -1,23 +1,54 @@
 # backend/controllers/base_controller.py
+from backend.database_handlers.cross_db_query import RECORD_TABLES
+from backend.services.event_bus import publish_change, INSERT, UPDATE, DELETE
+
 class BaseController:
-    def __init__(self, db_handler, model_class):
+    def __init__(self, db_handler, model_class, entity: str = None):
         self.db = db_handler
         self.Model = model_class
+        # Record type published with every write (a RECORD_TABLES key)
+        self.entity = entity
 
     def create(self, data: dict):
         instance = self.Model(**data)
-        return self.db.insert(instance)
+        record_id = self.db.insert(instance)
+        self._publish(INSERT, record_id, data.get('pet_id'))
+        return record_id
+
+    def create_many(self, records: list):
+        """Inserts every record dict in one transaction and returns the new IDs."""
+        record_ids = self.db.insert_many([self.Model(**data) for data in records])
+        if record_ids and self.entity:
+            publish_change(self.entity, INSERT, record_ids, pet_ids=set(data.get('pet_id') for data in records))
+        return record_ids
 
     def update(self, record_id: int, data: dict):
         data['id'] = record_id
         instance = self.Model(**data)
-        return self.db.update(instance)
+        result = self.db.update(instance)
+        self._publish(UPDATE, record_id, data.get('pet_id'))
+        return result
 
     def delete(self, record_id: int):
-        return self.db.delete(record_id)
+        # Look the pet up first; the row is gone afterwards
+        pet_id = self._pet_id_of(record_id)
+        result = self.db.delete(record_id)
+        self._publish(DELETE, record_id, pet_id)
+        return result
 
     def get_by_id(self, record_id: int):
         return self.db.fetch_by_id(record_id)
 
     def get_all_by_pet(self, pet_id: int):
-        return self.db.fetch_all(pet_id=pet_id)
\ No newline at end of file
+        return self.db.fetch_all(pet_id=pet_id)
+
+    def _pet_id_of(self, record_id: int):
+        if self.entity not in RECORD_TABLES:
+            return None
+        table = RECORD_TABLES[self.entity][1]
+        row = self.db.connect().execute(f"SELECT pet_id FROM {table} WHERE id = ?", (record_id,)).fetchone()
+        return row[0] if row else None
+
+    def _publish(self, action: str, record_id: int, pet_id: int = None):
+        if self.entity:
+            publish_change(self.entity, action, [record_id], pet_ids=[pet_id])
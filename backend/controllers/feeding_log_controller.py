@@ -1,16 +1,21 @@
 # File: backend/controllers/feeding_log_controller.py
 from .base_controller import BaseController
+from backend.services.query_cache import cached_query
+from backend.database_handlers.query_trace import fallback_on_error
 from backend.models.feeding_log import FeedingLog
 from backend.database_handlers.feeding_logs_db_handler import FeedingLogDB
 
 class FeedingLogController(BaseController):
     def __init__(self):
-        super().__init__(FeedingLogDB(), FeedingLog)
+        super().__init__(FeedingLogDB(), FeedingLog, "feeding_logs")
         self.db_handler = FeedingLogDB()
 
+    @fallback_on_error(lambda pet_id: [])
+    @cached_query("feeding_logs", pet_arg="pet_id")
     def get_by_pet_id(self, pet_id: int) -> list[FeedingLog]:
-        try:
-            return self.db_handler.get_by_pet_id(pet_id)
-        except Exception as e:
-            print(f"Error fetching daycare enrollments: {e}")
-            return []
\ No newline at end of file
+        return self.db_handler.get_by_pet_id(pet_id)
+
+    @fallback_on_error(lambda pet_ids: {pet_id: [] for pet_id in pet_ids})
+    @cached_query("feeding_logs", pet_arg="pet_ids")
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[FeedingLog]]:
+        return self.db_handler.get_by_pet_ids(pet_ids)
\ No newline at end of file
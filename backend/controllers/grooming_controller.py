@@ -1,7 +1,11 @@
 ## File: backend/controllers/grooming_controller.py
-import sqlite3
-import os
+from backend.database_handlers.connection_manager import get_connection
+from backend.data.storage_config import get_db_path
+from backend.database_handlers.query_utils import fetch_grouped_by_pet_ids, insert_many
+from backend.database_handlers.write_retry import run_write
 from backend.models.grooming_log import GroomingLog  # Adjust path as needed
+from backend.services.event_bus import publish_change, INSERT
+from backend.services.query_cache import cached_query
 from typing import Optional
 
 class GroomingLogsController:
@@ -9,36 +13,57 @@ class GroomingLogsController:
     Controller for managing grooming log database interactions.
     """
 
+    PRICE_MAP = {
+        'basic': 1000.0,
+        'custom': 1500.0,
+        'premium': 1800.0
+    }
+
+    INSERT_SQL = '''
+        INSERT INTO grooming_logs (pet_id, groom_type, price, groomer_name, notes)
+        VALUES (?, ?, ?, ?, ?)
+    '''
+
     def __init__(self):
-        self.db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'grooming_logs.db')
+        self.db_path = get_db_path("grooming_logs")
+
+    @classmethod
+    def insert_params(cls, log: dict) -> tuple:
+        """``INSERT_SQL`` parameters for a dict of ``add_grooming_log`` arguments."""
+        return (log["pet_id"], log["groom_type"], cls.PRICE_MAP.get(log["groom_type"], 0.0),
+                log["groomer_name"], log.get("notes", ""))
 
     def add_grooming_log(self, pet_id: int, groom_type: str, groomer_name: str, notes: str = "", price: float = 0.0) -> Optional[int]:
         """
         Inserts a new grooming log into the database. Date is auto-generated. Price is based on grooming type.
         """
-        PRICE_MAP = {
-            'basic': 1000.0,
-            'custom': 1500.0,
-            'premium': 1800.0
-        }
+        price = self.PRICE_MAP.get(groom_type, 0.0)
 
-        price = PRICE_MAP.get(groom_type, 0.0)
+        log_id = run_write(get_connection(self.db_path), lambda cursor: cursor.execute(
+            self.INSERT_SQL, (pet_id, groom_type, price, groomer_name, notes)).lastrowid)
 
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO grooming_logs (pet_id, groom_type, price, groomer_name, notes)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (pet_id, groom_type, price, groomer_name, notes))
-            conn.commit()
-            return cursor.lastrowid
+        publish_change("grooming_logs", INSERT, [log_id], pet_ids=[pet_id])
+        return log_id
+
+    def insert_many(self, logs: list[dict]) -> list[int]:
+        """
+        Inserts many grooming logs in one transaction and returns their IDs.
+
+        Each dict takes the arguments of ``add_grooming_log`` (pet_id, groom_type,
+        groomer_name, notes); prices come from the grooming type as there.
+        """
+        log_ids = insert_many(get_connection(self.db_path), self.INSERT_SQL, [self.insert_params(log) for log in logs])
+        if log_ids:
+            publish_change("grooming_logs", INSERT, log_ids, pet_ids={log["pet_id"] for log in logs})
+        return log_ids
 
 
+    @cached_query("grooming_logs", pet_arg="pet_id")
     def get_grooming_logs_for_pet(self, pet_id: int):
         """
         Retrieves all grooming logs for a given pet.
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with get_connection(self.db_path) as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 SELECT id, pet_id, groom_date, groom_type, price, groomer_name, notes
@@ -48,4 +73,16 @@ class GroomingLogsController:
             ''', (pet_id,))
             rows = cursor.fetchall()
 
-        return [GroomingLog(*row) for row in rows]
\ No newline at end of file
+        return [GroomingLog(*row) for row in rows]
+
+    @cached_query("grooming_logs", pet_arg="pet_ids")
+    def get_grooming_logs_for_pets(self, pet_ids: list[int]) -> dict[int, list[GroomingLog]]:
+        """
+        Retrieves grooming logs for many pets with one chunked query, grouped by pet ID.
+        """
+        return fetch_grouped_by_pet_ids(get_connection(self.db_path), '''
+            SELECT id, pet_id, groom_date, groom_type, price, groomer_name, notes
+            FROM grooming_logs
+            WHERE pet_id IN ({placeholders})
+            ORDER BY groom_date DESC
+        ''', pet_ids, lambda row: GroomingLog(*row))
\ No newline at end of file
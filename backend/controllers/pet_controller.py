@@ -1,40 +1,44 @@
 import os
 import sqlite3
-import shutil
 import re
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 from datetime import datetime
 from backend.models.pet import Pet, Owner
+from backend.database_handlers.connection_manager import get_connection
+from backend.data.storage_config import get_db_path, get_storage_config
+from backend.database_handlers.cross_db_query import CrossDatabaseQuery, PET_OWNER_SELECT, pet_and_owner_from_row
+from backend.services.unit_of_work import UnitOfWork
+from backend.services.query_cache import cached_query
+
+# Orderings page_pets supports. Every one ends with p.id, so the last pet of a
+# page identifies where the next page starts.
+PET_SORTS = {
+    "id": "p.id",
+    "name": "p.name COLLATE NOCASE, p.id",
+}
 
 
 class PetController:
     """Handles all database operations for Pets and Owners following SOLID principles."""
     
     def __init__(self, db_path: str = None):
-        
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        self.data_dir = os.path.join(self.base_dir, 'data')
-        self.images_dir = os.path.join(self.data_dir, 'images')
-        self.db_path = db_path or os.path.join(self.data_dir, 'pets.db')
+        # Image paths are stored relative to the data directory
+        config = get_storage_config()
+        self.data_dir = config.data_dir
+        self.images_dir = config.images_dir
+        self.db_path = db_path or get_db_path("pets")
+        self._query = CrossDatabaseQuery(pets_db_path=self.db_path)
         
         self._initialize_directories()
-        self._enable_foreign_keys()
 
     def _initialize_directories(self) -> None:
         """Ensures required directories exist."""
         os.makedirs(self.images_dir, exist_ok=True)
         os.makedirs(self.data_dir, exist_ok=True)
 
-    def _enable_foreign_keys(self) -> None:
-        """Activates SQLite foreign key constraints."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("PRAGMA foreign_keys = ON")
-
     def _get_connection(self) -> sqlite3.Connection:
-        """Returns a database connection with foreign keys enabled."""
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("PRAGMA foreign_keys = ON")
-        return conn
+        """Returns the pooled database connection with foreign keys enabled."""
+        return get_connection(self.db_path, pragmas={"foreign_keys": "ON"})
 
     def add_pet_with_owner(self, pet: Pet, owner: Owner, image_path: Optional[str] = None) -> int:
         """
@@ -49,27 +53,24 @@ class PetController:
             ID of the newly created pet
             
         Raises:
-            sqlite3.Error: If database operation fails
-            IOError: If image file cannot be processed
+            RuntimeError: If the database write or the image copy fails; nothing
+                is saved in that case
         """
+        unit = self.unit_of_work()
+        staged = unit.add_pet(pet, owner, image_path)
         try:
-            with self._get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Transaction starts
-                owner_id = self._upsert_owner(cursor, owner)
-                pet_id = self._insert_pet(cursor, pet, owner_id)
-                
-                if image_path:
-                    stored_image_path = self._process_image(pet, pet_id, image_path)
-                    self._update_pet_image(cursor, pet_id, stored_image_path)
-                
-                conn.commit()
-                return pet_id
-                
+            # Rolls back and removes the copied image itself on failure
+            unit.commit()
         except (sqlite3.Error, IOError) as e:
-            conn.rollback()
             raise RuntimeError(f"Failed to add pet: {str(e)}") from e
+        return staged.id
+
+    def unit_of_work(self) -> UnitOfWork:
+        """
+        Starts a UnitOfWork that saves new pets, their owners, records and photos
+        in one transaction.
+        """
+        return UnitOfWork(self, self._query)
 
     def _upsert_owner(self, cursor: sqlite3.Cursor, owner: Owner) -> int:
         """Inserts or updates owner, returns owner ID."""
@@ -94,15 +95,11 @@ class PetController:
         
         return cursor.fetchone()[0]
 
-    def _process_image(self, pet: Pet, pet_id: int, src_path: str) -> str:
-        """Stores pet image and returns relative path."""
+    def _image_destination(self, pet: Pet, pet_id: int, src_path: str) -> str:
+        """Absolute path the pet's image is stored at."""
         ext = os.path.splitext(src_path)[1].lower()
         safe_name = re.sub(r'[^a-z0-9]', '_', pet.name.lower())
-        filename = f"{safe_name}_{pet_id}{ext}"
-        dest_path = os.path.join(self.images_dir, filename)
-        
-        shutil.copy2(src_path, dest_path)
-        return os.path.relpath(dest_path, start=self.data_dir)
+        return os.path.join(self.images_dir, f"{safe_name}_{pet_id}{ext}")
 
     def _update_pet_image(self, cursor: sqlite3.Cursor, pet_id: int, image_path: str) -> None:
         """Updates pet record with image path."""
@@ -110,6 +107,7 @@ class PetController:
             UPDATE pets SET image_path = ? WHERE id = ?
         ''', (image_path, pet_id))
 
+    @cached_query("pets", "owners", pet_arg="pet_id")
     def get_pet_by_id(self, pet_id: int) -> Tuple[Optional[Pet], Optional[Owner]]:
         """
         Retrieves a single pet by ID with its owner information.
@@ -121,40 +119,16 @@ class PetController:
             Tuple of (Pet, Owner) if found, (None, None) otherwise
         """
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT p.id AS pet_id, p.name AS pet_name, p.breed, p.birthdate, p.image_path,
-                    o.id AS owner_id, o.name AS owner_name, o.contact_number, o.address
-                FROM pets p
-                LEFT JOIN owner o ON p.owner_id = o.id
-                WHERE p.id = ?
-            ''', (pet_id,))
-            
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(PET_OWNER_SELECT + " WHERE p.id = ?", (pet_id,))
             row = cursor.fetchone()
             
             if not row:
                 return None, None
-                
-            pet = Pet(
-                id=row['pet_id'],
-                name=row['pet_name'],
-                breed=row['breed'],
-                birthdate=row['birthdate'],
-                image_path=row['image_path'],
-                owner_id=row['owner_id']
-            )
-            
-            owner = Owner(
-                id=row['owner_id'],
-                name=row['owner_name'],
-                contact_number=row['contact_number'],
-                address=row['address']
-            ) if row['owner_id'] else None
-            
-            return pet, owner
+            return pet_and_owner_from_row(row)
 
+    @cached_query("pets", "owners")
     def get_pets_with_owners(self) -> Tuple[List[Pet], List[Optional[Owner]]]:
         """
         Retrieves all pets with their associated owner information.
@@ -162,47 +136,100 @@ class PetController:
         Returns:
             Tuple of (list of Pets, list of corresponding Owners)
         """
-        with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                SELECT p.id AS pet_id, p.name AS pet_name, p.breed, p.birthdate, p.image_path,
-                    o.id AS owner_id, o.name AS owner_name, o.contact_number, o.address
-                FROM pets p
-                LEFT JOIN owner o ON p.owner_id = o.id
-            ''')
-            
-            pets = []
-            owners = []
-            
-            for row in cursor.fetchall():
-                pet = Pet(
-                    id=row['pet_id'],
-                    name=row['pet_name'],  # Changed to pet_name
-                    breed=row['breed'],
-                    birthdate=row['birthdate'],
-                    image_path=row['image_path'],
-                    owner_id=row['owner_id']
-                )
-                
-                owner = Owner(
-                    id=row['owner_id'],
-                    name=row['owner_name'],  # Changed to owner_name
-                    contact_number=row['contact_number'],
-                    address=row['address']
-                ) if row['owner_id'] else None
-                
-                pets.append(pet)
-                owners.append(owner)
-            
-            return pets, owners
+        return self._query.pets_with_owners()
 
+    def page_pets(self, after_id: Optional[int] = None, limit: int = 100,
+                  sort: str = "id") -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """
+        Retrieves one page of pets with their owners, using keyset pagination.
+
+        Args:
+            after_id: ID of the last pet of the previous page; None for the first page.
+                When sorting by name that pet must still exist, or the page is empty
+            limit: Maximum number of pets to return
+            sort: Ordering, a ``PET_SORTS`` key
+
+        Returns:
+            Tuple of (list of Pets, list of corresponding Owners); fewer than
+            ``limit`` pets means this is the last page
+
+        Raises:
+            ValueError: If ``sort`` is unknown
+        """
+        if sort not in PET_SORTS:
+            raise ValueError(f"Unknown pet sort: {sort!r}")
+        # Seeks straight to the previous page's last pet through the index,
+        # however deep into the list the page is, instead of skipping OFFSET rows
+        sql, params = PET_OWNER_SELECT, {"after_id": after_id, "limit": limit}
+        if after_id is not None and sort == "id":
+            sql += " WHERE p.id > :after_id"
+        elif after_id is not None:
+            # Spelled out rather than as a row value, which SQLite would not seek on
+            sql += '''
+                WHERE p.name >= (SELECT name FROM pets WHERE id = :after_id) COLLATE NOCASE
+                AND (p.name > (SELECT name FROM pets WHERE id = :after_id) COLLATE NOCASE OR p.id > :after_id)
+            '''
+        sql += f" ORDER BY {PET_SORTS[sort]} LIMIT :limit"
+
+        cursor = self._get_connection().cursor()
+        cursor.row_factory = sqlite3.Row
+        pets, owners = [], []
+        for row in cursor.execute(sql, params):
+            pet, owner = pet_and_owner_from_row(row)
+            pets.append(pet)
+            owners.append(owner)
+        return pets, owners
+
+    def page_pets_at(self, position: int, limit: int = 100,
+                     sort: str = "id") -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """
+        Retrieves the page of pets starting at ``position`` (0-based) in ``sort`` order.
+
+        For a jump into the middle of the list, e.g. a dragged scrollbar. The pet
+        before ``position`` is found by counting ids in sort order (through
+        ``idx_pets_name`` when sorting by name), without joining any owner, and
+        the page is read from there like ``page_pets``.
+
+        Raises:
+            ValueError: If ``sort`` is unknown
+        """
+        if sort not in PET_SORTS:
+            raise ValueError(f"Unknown pet sort: {sort!r}")
+        if position <= 0:
+            return self.page_pets(None, limit, sort)
+        row = self._get_connection().execute(
+            f"SELECT p.id FROM pets p ORDER BY {PET_SORTS[sort]} LIMIT 1 OFFSET ?", (position - 1,)
+        ).fetchone()
+        if row is None:
+            return [], []
+        return self.page_pets(row[0], limit, sort)
+
+    def iter_pets_with_owners(self, batch_size: int = 500, sort: str = "id") -> Iterator[Tuple[Pet, Optional[Owner]]]:
+        """
+        Yields every (Pet, Owner) pair, reading ``batch_size`` pets at a time.
+
+        Each batch is its own ``page_pets`` query, so no cursor or read lock is
+        held while the caller works on the pets yielded so far.
+        """
+        after_id = None
+        while True:
+            pets, owners = self.page_pets(after_id, batch_size, sort)
+            yield from zip(pets, owners)
+            if len(pets) < batch_size:
+                return
+            after_id = pets[-1].id
+
+    @cached_query("pets")
+    def count_pets(self) -> int:
+        """Returns the number of pets."""
+        return self._get_connection().execute("SELECT COUNT(*) FROM pets").fetchone()[0]
+
+    @cached_query("owners")
     def get_owner_by_id(self, owner_id: int) -> Optional[Owner]:
         """Retrieves a single owner by ID."""
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT id, name, contact_number, address 
@@ -213,11 +240,12 @@ class PetController:
             row = cursor.fetchone()
             return Owner(**dict(row)) if row else None
 
+    @cached_query("owners")
     def get_all_owners(self) -> List[Owner]:
         """Retrieves all owners from the database."""
         with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT id, name, contact_number, address 
@@ -226,73 +254,32 @@ class PetController:
             
             return [Owner(**dict(row)) for row in cursor.fetchall()]
 
+    @cached_query("pets", "vaccinations", "vet_visits")
     def get_pets_with_vacc_and_vet_records(self):
         """
         Returns pets that have at least one vaccination AND at least one vet visit record.
         """
-        with self._get_connection() as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT p.*
-                FROM pets p
-                INNER JOIN vaccinations vax ON p.id = vax.pet_id
-                INNER JOIN vet_visits vv ON p.id = vv.pet_id
-            """)
-            pets = [self._row_to_pet(row) for row in cursor.fetchall()]
-            return pets
-
-    def _row_to_pet(self, row: sqlite3.Row) -> Pet:
-        """Converts a database row to a Pet object."""
-        return Pet(
-            id=row['id'],
-            name=row['name'],
-            breed=row['breed'],
-            birthdate=row['birthdate'],
-            owner_id=row['owner_id'],
-            image_path=row.get('image_path')  # image_path may not always be present
-        )
+        pets, _ = self._query.pets_with_all(["vaccinations", "vet_visits"])
+        return pets
 
+    @cached_query("pets", "owners", "vaccinations", "vet_visits")
     def get_pets_with_vacc_or_vet_records(self):
         """
         Returns pets (with owners) that have at least one vaccination OR at least one vet visit record.
         Works even if vaccinations and vet_visits are in separate DB files.
         """
-        from backend.controllers.vaccination_controller import VaccinationController
-        from backend.controllers.vet_visit_controller import VetVisitController
-
-        pets, owners = self.get_pets_with_owners()
-        pets_with_records = []
-        owners_with_records = []
-
-        vax_ctrl = VaccinationController()
-        visit_ctrl = VetVisitController()
-
-        for pet, owner in zip(pets, owners):
-            has_vax = vax_ctrl.get_by_pet_id(pet.id)
-            has_visit = visit_ctrl.get_by_pet_id(pet.id)
-            if has_vax or has_visit:
-                pets_with_records.append(pet)
-                owners_with_records.append(owner)
-
-        return pets_with_records, owners_with_records
+        return self._query.pets_with_any(["vaccinations", "vet_visits"])
 
+    @cached_query("pets", "owners", "feeding_logs")
     def get_pets_with_feeding_logs(self):
         """
         Returns pets (with owners) that have at least one feeding log.
         """
-        from backend.controllers.feeding_log_controller import FeedingLogController
-
-        pets, owners = self.get_pets_with_owners()
-        pets_with_logs = []
-        owners_with_logs = []
-
-        feeding_ctrl = FeedingLogController()
+        return self._query.pets_with_any(["feeding_logs"])
 
-        for pet, owner in zip(pets, owners):
-            logs = feeding_ctrl.get_by_pet_id(pet.id)
-            if logs:
-                pets_with_logs.append(pet)
-                owners_with_logs.append(owner)
-
-        return pets_with_logs, owners_with_logs
\ No newline at end of file
+    @cached_query("pets", "owners", "grooming_logs")
+    def get_pets_with_grooming_logs(self):
+        """
+        Returns pets (with owners) that have at least one grooming log.
+        """
+        return self._query.pets_with_any(["grooming_logs"])
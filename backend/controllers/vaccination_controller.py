@@ -1,16 +1,21 @@
 # backend/controllers/vaccination_controller.py
 from .base_controller import BaseController
+from backend.services.query_cache import cached_query
+from backend.database_handlers.query_trace import fallback_on_error
 from backend.models.vaccination import Vaccination
 from backend.database_handlers.vaccinations_db_handler import VaccinationDB
 
 class VaccinationController(BaseController):
     def __init__(self):
-        super().__init__(VaccinationDB(), Vaccination)
+        super().__init__(VaccinationDB(), Vaccination, "vaccinations")
         self.db_handler = VaccinationDB()
 
+    @fallback_on_error(lambda pet_id: [])
+    @cached_query("vaccinations", pet_arg="pet_id")
     def get_by_pet_id(self, pet_id: int) -> list[Vaccination]:
-        try:
-            return self.db_handler.get_by_pet_id(pet_id)
-        except Exception as e:
-            print(f"Error fetching vaccinations: {e}")
-            return []
\ No newline at end of file
+        return self.db_handler.get_by_pet_id(pet_id)
+
+    @fallback_on_error(lambda pet_ids: {pet_id: [] for pet_id in pet_ids})
+    @cached_query("vaccinations", pet_arg="pet_ids")
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[Vaccination]]:
+        return self.db_handler.get_by_pet_ids(pet_ids)
\ No newline at end of file
@@ -1,16 +1,21 @@
 # backend/controllers/vet_visit_controller.py
 from .base_controller import BaseController
+from backend.services.query_cache import cached_query
+from backend.database_handlers.query_trace import fallback_on_error
 from backend.models.vet_visit import VetVisit
 from backend.database_handlers.vet_visits_db_handler import VetVisitDB 
 
 class VetVisitController(BaseController):
     def __init__(self):
-        super().__init__(VetVisitDB(), VetVisit)
+        super().__init__(VetVisitDB(), VetVisit, "vet_visits")
         self.db_handler = VetVisitDB()
     
+    @fallback_on_error(lambda pet_id: [])
+    @cached_query("vet_visits", pet_arg="pet_id")
     def get_by_pet_id(self, pet_id: int) -> list[VetVisit]:
-        try:
-            return self.db_handler.get_by_pet_id(pet_id)
-        except Exception as e:
-            print(f"Error fetching vet visits: {e}")
-            return []
\ No newline at end of file
+        return self.db_handler.get_by_pet_id(pet_id)
+
+    @fallback_on_error(lambda pet_ids: {pet_id: [] for pet_id in pet_ids})
+    @cached_query("vet_visits", pet_arg="pet_ids")
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[VetVisit]]:
+        return self.db_handler.get_by_pet_ids(pet_ids)
\ No newline at end of file
@@ -0,0 +1,129 @@
+# File: backend/data/consolidate_databases.py
+import argparse
+import os
+import sqlite3
+from typing import Dict, Optional
+
+from backend.data.storage_config import (
+    DATABASE_FILES, DATABASE_TABLES, LAYOUT_SINGLE, LAYOUT_SPLIT,
+    StorageConfig, get_storage_config, save_settings,
+)
+from backend.data.migrations import INITIALIZERS, MigrationRunner
+from backend.database_handlers.connection_manager import close_connection
+
+
+def consolidate_databases(source_paths: Optional[Dict[str, str]] = None,
+                          target_path: Optional[str] = None,
+                          overwrite: bool = False) -> dict:
+    """
+    Copies the split-layout database files into one single-file database.
+
+    Rows keep their IDs, so every ``pet_id`` still points at the same pet. The copy
+    runs in one transaction; on any error the half-built target file is removed.
+
+    Args:
+        source_paths: Logical database name -> source file. Defaults to the split
+            layout files in the configured data directory.
+        target_path: File to create. Defaults to the configured single-file path.
+        overwrite: Replace ``target_path`` if it already exists.
+
+    Returns:
+        Dict with the number of rows copied per table and any foreign key violations
+        (records whose pet or owner no longer exists).
+    """
+    config = get_storage_config()
+    split = StorageConfig(layout=LAYOUT_SPLIT, data_dir=config.data_dir)
+    source_paths = source_paths or split.db_paths()
+    target_path = target_path or StorageConfig(layout=LAYOUT_SINGLE, data_dir=config.data_dir).single_file_path
+
+    if os.path.exists(target_path):
+        if not overwrite:
+            raise FileExistsError(f"{target_path} already exists; pass overwrite=True to replace it")
+        os.remove(target_path)
+
+    # Create the full schema (tables plus migrated indexes) in the target file
+    for initializer in INITIALIZERS.values():
+        initializer(db_path=target_path).initialize()
+    MigrationRunner(db_paths={name: target_path for name in DATABASE_FILES}).run()
+    close_connection(target_path)
+
+    copied = {}
+    conn = sqlite3.connect(target_path)
+    try:
+        attached = []
+        for name, path in source_paths.items():
+            if not os.path.exists(path):
+                continue
+            alias = f"src_{name}"
+            conn.execute("ATTACH DATABASE ? AS " + alias, (path,))
+            attached.append((name, alias))
+
+        conn.execute("BEGIN")
+        for name, alias in attached:
+            for table in DATABASE_TABLES[name]:
+                columns = [row[1] for row in conn.execute(f"PRAGMA {alias}.table_info({table})")]
+                if not columns:
+                    continue
+                column_list = ", ".join(columns)
+                cursor = conn.execute(
+                    f"INSERT INTO main.{table} ({column_list}) SELECT {column_list} FROM {alias}.{table}"
+                )
+                copied[table] = cursor.rowcount
+            # Carry AUTOINCREMENT counters over so deleted IDs are never reused.
+            # sqlite_sequence has no unique key: the copy above already wrote a
+            # counter for each table (its max id), which has to be replaced.
+            if _has_sequence(conn, alias):
+                conn.execute(f"""
+                    DELETE FROM main.sqlite_sequence
+                    WHERE name IN (SELECT name FROM {alias}.sqlite_sequence)
+                """)
+                conn.execute(f"""
+                    INSERT INTO main.sqlite_sequence (name, seq)
+                    SELECT name, seq FROM {alias}.sqlite_sequence
+                """)
+        conn.commit()
+
+        violations = conn.execute("PRAGMA foreign_key_check").fetchall()
+    except Exception:
+        conn.rollback()
+        conn.close()
+        os.remove(target_path)
+        raise
+    conn.close()
+
+    return {"target_path": target_path, "copied": copied, "foreign_key_violations": violations}
+
+
+def _has_sequence(conn: sqlite3.Connection, alias: str) -> bool:
+    return conn.execute(
+        f"SELECT 1 FROM {alias}.sqlite_master WHERE name = 'sqlite_sequence'"
+    ).fetchone() is not None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Copy the per-record-type databases into one file.")
+    parser.add_argument("--target", help="Path of the single-file database to create")
+    parser.add_argument("--overwrite", action="store_true", help="Replace the target if it exists")
+    parser.add_argument("--activate", action="store_true",
+                        help="Switch storage.json to the single-file layout after copying")
+    args = parser.parse_args()
+
+    result = consolidate_databases(target_path=args.target, overwrite=args.overwrite)
+    print(f"📦 Created {result['target_path']}")
+    for table, count in result["copied"].items():
+        print(f"    {table}: {count} row(s)")
+    if result["foreign_key_violations"]:
+        print(f"⚠️ {len(result['foreign_key_violations'])} record(s) reference missing pets or owners "
+              "(PRAGMA foreign_key_check)")
+
+    if args.activate:
+        save_settings({
+            "layout": LAYOUT_SINGLE,
+            "data_dir": os.path.dirname(os.path.abspath(result["target_path"])),
+            "single_file_name": os.path.basename(result["target_path"]),
+        })
+        print("✅ Single-file layout activated in storage.json")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# File: backend/data/memory_store.py
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+
+class MemorySnapshotter:
+    """
+    Keeps shared-cache in-memory databases alive and checkpoints them to disk.
+
+    An in-memory database disappears with its last connection, so one keeper
+    connection per database stays open for as long as the store runs, whatever
+    the connection pool closes. ``open()`` copies each snapshot file into memory
+    with the SQLite backup API; ``snapshot()`` copies memory back into the file.
+    A backup waits for a write in progress to commit, so a snapshot never holds
+    half a transaction, and the target file is written in a transaction of its
+    own, so a crash mid-snapshot leaves the previous snapshot intact.
+    """
+
+    def __init__(self, databases: Dict[str, str], interval: float = 60.0):
+        """
+        Args:
+            databases: In-memory database URI -> snapshot file.
+            interval: Seconds between snapshots; 0 snapshots only on ``close()``.
+        """
+        self.databases = dict(databases)
+        self.interval = interval
+        self._keepers: Dict[str, sqlite3.Connection] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.snapshots = 0
+        self.failures = 0
+        self.last_snapshot: Optional[float] = None
+        self.last_snapshot_seconds: Optional[float] = None
+
+    def open(self) -> "MemorySnapshotter":
+        for uri, path in self.databases.items():
+            keeper = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            if os.path.exists(path):
+                with sqlite3.connect(path) as source:
+                    source.backup(keeper)
+            self._keepers[uri] = keeper
+        if self.interval > 0:
+            self._thread = threading.Thread(target=self._run, name="pettrackr-snapshot", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.snapshot()
+
+    def snapshot(self) -> bool:
+        """Writes every in-memory database to its file. Returns False if one of them failed."""
+        ok = True
+        started = time.perf_counter()
+        with self._lock:
+            for uri, keeper in self._keepers.items():
+                path = self.databases[uri]
+                try:
+                    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+                    target = sqlite3.connect(path)
+                    try:
+                        keeper.backup(target)
+                    finally:
+                        target.close()
+                except (sqlite3.Error, OSError) as e:
+                    ok = False
+                    self.failures += 1
+                    print(f"⚠️ Could not snapshot {os.path.basename(path)}: {e}")
+            self.snapshots += ok
+            self.last_snapshot = time.time()
+            self.last_snapshot_seconds = time.perf_counter() - started
+        return ok
+
+    def close(self, snapshot: bool = True) -> None:
+        """Stops the periodic snapshots, takes a last one and drops the in-memory databases."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if snapshot and self._keepers:
+            self.snapshot()
+        with self._lock:
+            for keeper in self._keepers.values():
+                keeper.close()
+            self._keepers.clear()
+
+    def stats(self) -> dict:
+        return {
+            "databases": len(self.databases),
+            "interval_seconds": self.interval,
+            "snapshots": self.snapshots,
+            "failures": self.failures,
+            "last_snapshot": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.last_snapshot))
+            if self.last_snapshot else None,
+            "last_snapshot_ms": round(self.last_snapshot_seconds * 1000, 1)
+            if self.last_snapshot_seconds is not None else None,
+        }
+
+
+_store: Optional[MemorySnapshotter] = None
+
+
+def start_memory_store(databases: Dict[str, str], interval: float = 60.0) -> MemorySnapshotter:
+    """Loads the snapshots into memory and starts the periodic snapshots."""
+    global _store
+    stop_memory_store()
+    _store = MemorySnapshotter(databases, interval).open()
+    return _store
+
+
+def get_memory_store() -> Optional[MemorySnapshotter]:
+    return _store
+
+
+def stop_memory_store(snapshot: bool = True) -> None:
+    """Shutdown hook: takes a last snapshot and drops the in-memory databases, if any."""
+    global _store
+    if _store is not None:
+        _store.close(snapshot)
+        _store = None
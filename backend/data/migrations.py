@@ -0,0 +1,185 @@
+# File: backend/data/migrations.py
+import os
+import time
+from typing import Dict, List, Optional
+
+from backend.data.pets_db import PetDatabaseInitializer
+from backend.data.vaccinations_db import VaccinationsDatabaseInitializer
+from backend.data.vet_visits_db import VetVisitsDatabaseInitializer
+from backend.data.feeding_logs_db import FeedingLogsDatabaseInitializer
+from backend.data.grooming_logs_db import GroomingLogsDatabaseInitializer
+from backend.data.storage_config import open_storage
+from backend.database_handlers.connection_manager import get_connection, is_uri
+from backend.database_handlers.write_retry import run_write
+
+
+class Migration:
+    """
+    One schema change, identified by a version number shared by every database file.
+
+    ``statements`` maps a logical database name ("pets", "vaccinations", ...) to the
+    SQL to run against the file that holds that database.
+    """
+
+    def __init__(self, version: int, description: str, statements: Dict[str, List[str]]):
+        self.version = version
+        self.description = description
+        self.statements = statements
+
+    def statements_for(self, db_names) -> List[str]:
+        return [sql for name in db_names for sql in self.statements.get(name, [])]
+
+
+# Ordered list of migrations. Append new ones with the next version number;
+# never edit a migration that has already shipped.
+MIGRATIONS = [
+    Migration(1, "Add pet_id, owner_id and date indexes", {
+        "pets": [
+            "CREATE INDEX IF NOT EXISTS idx_pets_owner_id ON pets(owner_id)",
+        ],
+        "vaccinations": [
+            "CREATE INDEX IF NOT EXISTS idx_vaccinations_pet_id ON vaccinations(pet_id, date_administered)",
+            "CREATE INDEX IF NOT EXISTS idx_vaccinations_next_due ON vaccinations(next_due)",
+        ],
+        "vet_visits": [
+            "CREATE INDEX IF NOT EXISTS idx_vet_visits_pet_id ON vet_visits(pet_id, visit_date)",
+            "CREATE INDEX IF NOT EXISTS idx_vet_visits_visit_date ON vet_visits(visit_date)",
+        ],
+        "feeding_logs": [
+            "CREATE INDEX IF NOT EXISTS idx_daycare_enrollments_pet_id ON daycare_enrollments(pet_id)",
+        ],
+        "grooming_logs": [
+            "CREATE INDEX IF NOT EXISTS idx_grooming_logs_pet_id ON grooming_logs(pet_id, groom_date)",
+        ],
+    }),
+    Migration(2, "Add pets name index for paging by name", {
+        "pets": [
+            "CREATE INDEX IF NOT EXISTS idx_pets_name ON pets(name COLLATE NOCASE, id)",
+        ],
+    }),
+]
+
+INITIALIZERS = {
+    "pets": PetDatabaseInitializer,
+    "vaccinations": VaccinationsDatabaseInitializer,
+    "vet_visits": VetVisitsDatabaseInitializer,
+    "feeding_logs": FeedingLogsDatabaseInitializer,
+    "grooming_logs": GroomingLogsDatabaseInitializer,
+}
+
+
+def default_database_paths() -> Dict[str, str]:
+    """Returns the database file used for each logical database name."""
+    return {name: initializer().db_path for name, initializer in INITIALIZERS.items()}
+
+
+class MigrationRunner:
+    """
+    Applies ``MIGRATIONS`` in order, tracking progress with ``PRAGMA user_version``.
+
+    Each physical database file stores the highest migration version applied to it,
+    so files are migrated independently and a migration is never applied twice.
+    """
+
+    def __init__(self, db_paths: Optional[Dict[str, str]] = None, migrations: Optional[List[Migration]] = None):
+        self.db_paths = db_paths or default_database_paths()
+        self.migrations = sorted(migrations or MIGRATIONS, key=lambda m: m.version)
+
+    @property
+    def latest_version(self) -> int:
+        return self.migrations[-1].version if self.migrations else 0
+
+    def _files(self) -> Dict[str, List[str]]:
+        """Groups logical database names by the file that stores them."""
+        files = {}
+        for name, path in self.db_paths.items():
+            files.setdefault(path if is_uri(path) else os.path.abspath(path), []).append(name)
+        return files
+
+    @staticmethod
+    def current_version(db_path: str) -> int:
+        return get_connection(db_path).execute("PRAGMA user_version").fetchone()[0]
+
+    def status(self) -> List[dict]:
+        """Reports the applied and pending migrations of every database file."""
+        report = []
+        for path, names in self._files().items():
+            version = self.current_version(path)
+            report.append({
+                "db_path": path,
+                "databases": names,
+                "version": version,
+                "latest": self.latest_version,
+                "pending": [m.version for m in self.migrations if m.version > version],
+            })
+        return report
+
+    def run(self) -> List[dict]:
+        """
+        Applies every pending migration and returns one entry per migration applied,
+        including how long it took.
+        """
+        applied = []
+        for path, names in self._files().items():
+            version = self.current_version(path)
+            for migration in self.migrations:
+                if migration.version <= version:
+                    continue
+                duration = self._apply(path, migration, migration.statements_for(names))
+                if duration is None:
+                    continue
+                applied.append({
+                    "db_path": path,
+                    "version": migration.version,
+                    "description": migration.description,
+                    "seconds": duration,
+                })
+        return applied
+
+    @staticmethod
+    def _apply(db_path: str, migration: Migration, statements: List[str]) -> Optional[float]:
+        """Returns how long the migration took, or None if another process applied it first."""
+        conn = get_connection(db_path)
+        started = time.perf_counter()
+
+        def write(cursor):
+            # Another workstation may have migrated the file while we waited for the lock
+            if cursor.execute("PRAGMA user_version").fetchone()[0] >= migration.version:
+                return False
+            for sql in statements:
+                cursor.execute(sql)
+            # Version numbers are bumped even when a file has nothing to run,
+            # so every file reports the same schema version.
+            cursor.execute(f"PRAGMA user_version = {int(migration.version)}")
+            return True
+
+        if not run_write(conn, write):
+            return None
+        return time.perf_counter() - started
+
+def initialize_databases(verbose: bool = True) -> List[dict]:
+    """Creates missing tables and applies pending migrations. Called at startup."""
+    # In the memory mode the snapshots are loaded first, so they are what gets migrated
+    open_storage()
+    for initializer in INITIALIZERS.values():
+        initializer().initialize()
+
+    applied = MigrationRunner().run()
+    if verbose:
+        for entry in applied:
+            print(f"🛠️ Migration {entry['version']} ({entry['description']}) applied to "
+                  f"{os.path.basename(entry['db_path'])} in {entry['seconds'] * 1000:.1f} ms")
+    return applied
+
+
+def print_migration_status() -> None:
+    for entry in MigrationRunner().status():
+        pending = ", ".join(str(v) for v in entry["pending"]) or "none"
+        print(f"📁 {os.path.basename(entry['db_path'])}: version {entry['version']}/{entry['latest']} "
+              f"(pending: {pending})")
+
+
+# Optional standalone run
+if __name__ == "__main__":
+    initialize_databases()
+    print_migration_status()
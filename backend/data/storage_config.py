@@ -0,0 +1,291 @@
+# File: backend/data/storage_config.py
+import itertools
+import json
+import os
+import sqlite3
+from typing import Dict, List, Optional
+
+from backend.data.memory_store import MemorySnapshotter, get_memory_store, start_memory_store, stop_memory_store
+from backend.database_handlers.connection_manager import connection_manager, is_uri
+
+LAYOUT_SPLIT = "split"    # one SQLite file per record type (the original layout)
+LAYOUT_SINGLE = "single"  # every table in one file, so foreign keys and joins work
+
+MODE_DISK = "disk"      # the databases are files in the data directory
+MODE_MEMORY = "memory"  # shared-cache in-memory databases, loaded from and snapshotted to the files
+DEFAULT_SNAPSHOT_SECONDS = 60.0
+
+DEFAULT_DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+SETTINGS_FILE = os.path.join(DEFAULT_DATA_DIR, "storage.json")
+SINGLE_FILE_NAME = "pettrackr.db"
+
+# Logical database name -> file used in the split layout
+DATABASE_FILES = {
+    "pets": "pets.db",
+    "vaccinations": "vaccinations.db",
+    "vet_visits": "vet_visits.db",
+    "feeding_logs": "feeding_logs.db",
+    "grooming_logs": "grooming_logs.db",
+}
+
+# Pragmas of each storage profile. journal_mode is stored in the file and set by
+# the initializers; the rest are per connection and applied by the connection manager.
+#   durable:  rollback journal, fsync on every commit. Safe on network shares, and
+#             commits spanning ATTACHed files stay atomic. The default.
+#   balanced: WAL (readers never block the writer), fsync at checkpoints only.
+#             WAL coordinates through shared memory, so it only works when every
+#             process runs on the same machine: a data directory shared by several
+#             workstations over the network must use durable. Opt in for
+#             single-machine installs (storage.json or PETTRACKR_STORAGE_PROFILE).
+#   fast:     WAL without fsync; a power loss can drop the latest commits.
+STORAGE_PROFILES = {
+    "durable": {"journal_mode": "DELETE", "synchronous": "FULL", "cache_size": -2000,
+                "mmap_size": 0, "temp_store": "DEFAULT"},
+    "balanced": {"journal_mode": "WAL", "synchronous": "NORMAL", "cache_size": -16000,
+                 "mmap_size": 64 * 1024 * 1024, "temp_store": "MEMORY"},
+    "fast": {"journal_mode": "WAL", "synchronous": "OFF", "cache_size": -64000,
+             "mmap_size": 256 * 1024 * 1024, "temp_store": "MEMORY"},
+}
+DEFAULT_PROFILE = "durable"
+
+# Logical database name -> tables it holds
+DATABASE_TABLES = {
+    "pets": ["owner", "pets"],
+    "vaccinations": ["vaccinations"],
+    "vet_visits": ["vet_visits"],
+    "feeding_logs": ["daycare_enrollments"],
+    "grooming_logs": ["grooming_logs"],
+}
+
+
+# Tells the in-memory databases of successive configurations apart
+_memory_generation = itertools.count(1)
+
+
+class StorageConfig:
+    """
+    Describes where the databases live.
+
+    Settings are read, in increasing priority, from ``backend/data/storage.json``
+    and the ``PETTRACKR_DATA_DIR`` / ``PETTRACKR_STORAGE_LAYOUT`` /
+    ``PETTRACKR_STORAGE_PROFILE`` / ``PETTRACKR_STORAGE_MODE`` environment
+    variables. ``db_files`` moves single databases elsewhere (e.g. onto a
+    tmpfs); relative paths are taken from ``data_dir``.
+
+    In the memory mode every database is a shared-cache ``:memory:`` database
+    that all pooled connections of the process share. The files in
+    ``data_dir`` only hold snapshots: they are loaded at startup and written
+    every ``snapshot_seconds`` and at shutdown (see ``MemorySnapshotter``).
+    Only one process can use the data in this mode.
+    """
+
+    def __init__(self, layout: str = LAYOUT_SPLIT, data_dir: str = DEFAULT_DATA_DIR,
+                 single_file_name: str = SINGLE_FILE_NAME, profile: str = DEFAULT_PROFILE,
+                 mode: str = MODE_DISK, db_files: Optional[Dict[str, str]] = None,
+                 snapshot_seconds: float = DEFAULT_SNAPSHOT_SECONDS):
+        if layout not in (LAYOUT_SPLIT, LAYOUT_SINGLE):
+            raise ValueError(f"Unknown storage layout: {layout!r}")
+        if profile not in STORAGE_PROFILES:
+            raise ValueError(f"Unknown storage profile: {profile!r}")
+        if mode not in (MODE_DISK, MODE_MEMORY):
+            raise ValueError(f"Unknown storage mode: {mode!r}")
+        unknown = set(db_files or {}) - set(DATABASE_FILES)
+        if unknown:
+            raise ValueError(f"Unknown database(s) in db_files: {', '.join(sorted(unknown))}")
+        self.layout = layout
+        self.data_dir = data_dir
+        self.single_file_name = single_file_name
+        self.profile = profile
+        self.mode = mode
+        self.db_files = dict(db_files or {})
+        self.snapshot_seconds = snapshot_seconds
+        self._memory_prefix = f"pettrackr-{os.getpid()}-{next(_memory_generation)}"
+
+    @classmethod
+    def load(cls, settings_file: str = SETTINGS_FILE) -> "StorageConfig":
+        settings = {}
+        if os.path.exists(settings_file):
+            with open(settings_file, "r", encoding="utf-8") as f:
+                settings = json.load(f)
+        layout = os.environ.get("PETTRACKR_STORAGE_LAYOUT") or settings.get("layout", LAYOUT_SPLIT)
+        return cls(
+            layout=layout,
+            data_dir=os.environ.get("PETTRACKR_DATA_DIR") or settings.get("data_dir", DEFAULT_DATA_DIR),
+            single_file_name=settings.get("single_file_name", SINGLE_FILE_NAME),
+            profile=os.environ.get("PETTRACKR_STORAGE_PROFILE") or settings.get("profile", DEFAULT_PROFILE),
+            mode=os.environ.get("PETTRACKR_STORAGE_MODE") or settings.get("mode", MODE_DISK),
+            db_files=settings.get("db_files"),
+            snapshot_seconds=float(settings.get("snapshot_seconds", DEFAULT_SNAPSHOT_SECONDS)),
+        )
+
+    @property
+    def is_single_file(self) -> bool:
+        return self.layout == LAYOUT_SINGLE
+
+    @property
+    def is_memory(self) -> bool:
+        return self.mode == MODE_MEMORY
+
+    @property
+    def single_file_path(self) -> str:
+        return os.path.join(self.data_dir, self.single_file_name)
+
+    def file_path(self, name: str) -> str:
+        """Returns the file holding the logical database ``name`` (its snapshot in the memory mode)."""
+        if name not in DATABASE_FILES:
+            raise KeyError(f"Unknown database: {name!r}")
+        if self.is_single_file:
+            return self.single_file_path
+        return os.path.join(self.data_dir, self.db_files.get(name, DATABASE_FILES[name]))
+
+    def file_paths(self) -> Dict[str, str]:
+        return {name: self.file_path(name) for name in DATABASE_FILES}
+
+    def db_path(self, name: str) -> str:
+        """Returns what to open for the logical database ``name``: a file path, or a URI in the memory mode."""
+        if not self.is_memory:
+            return self.file_path(name)
+        file_name = os.path.splitext(os.path.basename(self.file_path(name)))[0]
+        return f"file:{self._memory_prefix}-{file_name}?mode=memory&cache=shared"
+
+    def db_paths(self) -> Dict[str, str]:
+        return {name: self.db_path(name) for name in DATABASE_FILES}
+
+    @property
+    def images_dir(self) -> str:
+        return os.path.join(self.data_dir, "images")
+
+    def image_path(self, stored_path: str) -> str:
+        """Returns the file of a pet photo; the pets table stores it relative to ``data_dir``."""
+        return os.path.join(self.data_dir, stored_path)
+
+    def profile_pragmas(self) -> Dict[str, object]:
+        return dict(STORAGE_PROFILES[self.profile])
+
+    def connection_pragmas(self) -> Dict[str, object]:
+        """Profile pragmas that must be set on every connection (all but journal_mode)."""
+        pragmas = self.profile_pragmas()
+        pragmas.pop("journal_mode")
+        if self.is_memory:
+            # busy_timeout does not cover shared-cache table locks: without this a
+            # read fails outright while a write is in progress. Readers may see a
+            # write that is later rolled back; writers still retry on the lock.
+            pragmas["read_uncommitted"] = "ON"
+        return pragmas
+
+    def register_pragmas(self) -> None:
+        """
+        Registers the profile pragmas for every database file, and turns on
+        foreign keys wherever the parent tables are reachable: always for pets.db,
+        and for the shared file in the single-file layout.
+        """
+        for path in set(self.db_paths().values()):
+            connection_manager.register_pragmas(path, self.connection_pragmas())
+        paths: List[str] = [self.db_path("pets")]
+        if self.is_single_file:
+            paths = [self.single_file_path]
+        for path in paths:
+            connection_manager.register_pragmas(path, {"foreign_keys": "ON"})
+
+
+_config: Optional[StorageConfig] = None
+
+
+def get_storage_config() -> StorageConfig:
+    global _config
+    if _config is None:
+        _config = StorageConfig.load()
+        _config.register_pragmas()
+    return _config
+
+
+def configure(**kwargs) -> StorageConfig:
+    """
+    Replaces the active configuration, e.g. ``configure(layout="single")``.
+    In-memory databases of the previous configuration are snapshotted and dropped.
+    """
+    global _config
+    stop_memory_store()
+    _config = StorageConfig(**kwargs)
+    _config.register_pragmas()
+    return _config
+
+
+def open_storage(config: Optional[StorageConfig] = None) -> Optional[MemorySnapshotter]:
+    """
+    Called at startup, before the databases are initialized. In the memory
+    mode, loads the snapshot files into memory and starts the periodic
+    snapshots; does nothing otherwise.
+    """
+    config = config or get_storage_config()
+    if not config.is_memory:
+        return None
+    store = get_memory_store()
+    if store is None:
+        pairs = {config.db_path(name): config.file_path(name) for name in DATABASE_FILES}
+        store = start_memory_store(pairs, config.snapshot_seconds)
+    return store
+
+
+def open_database(db_path: str) -> sqlite3.Connection:
+    """
+    Opens an unpooled connection, as the initializers use, to a database file
+    (creating its directory) or to an in-memory database URI.
+    """
+    if is_uri(db_path):
+        return sqlite3.connect(db_path, uri=True)
+    os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+    return sqlite3.connect(db_path)
+
+
+def get_db_path(name: str) -> str:
+    """Shortcut for ``get_storage_config().db_path(name)``."""
+    return get_storage_config().db_path(name)
+
+
+def get_image_path(stored_path: str) -> str:
+    """Shortcut for ``get_storage_config().image_path(stored_path)``."""
+    return get_storage_config().image_path(stored_path)
+
+
+def apply_storage_profile(conn: sqlite3.Connection, config: Optional[StorageConfig] = None) -> None:
+    """
+    Applies the active profile, journal mode included, to a connection the
+    initializers opened themselves.
+
+    Raises:
+        RuntimeError: If the journal mode cannot be switched, e.g. because
+            another process has the file open. Carrying on would leave the
+            files of one installation in different journal modes.
+    """
+    config = config or get_storage_config()
+    pragmas = config.profile_pragmas()
+    journal_mode = pragmas.pop("journal_mode")
+    # In-memory databases always keep their journal in memory
+    if not config.is_memory:
+        _set_journal_mode(conn, journal_mode)
+    for name, value in pragmas.items():
+        try:
+            conn.execute(f"PRAGMA {name} = {value}")
+        except sqlite3.OperationalError as e:
+            print(f"⚠️ Could not set {name} = {value}: {e}")
+
+
+def _set_journal_mode(conn: sqlite3.Connection, journal_mode: str) -> None:
+    # Switching needs the file to ourselves. SQLite reports a refused switch
+    # either as an error or by returning the mode the file stays in.
+    try:
+        row = conn.execute(f"PRAGMA journal_mode = {journal_mode}").fetchone()
+    except sqlite3.OperationalError as e:
+        raise RuntimeError(f"Could not set journal_mode = {journal_mode}: {e}. "
+                           "Close every other PetTrackr window using this data directory and retry.") from e
+    if not row or row[0].lower() != journal_mode.lower():
+        raise RuntimeError(f"Could not set journal_mode = {journal_mode}: the database stays in "
+                           f"{row[0] if row else 'an unknown'} mode. Close every other PetTrackr window "
+                           "using this data directory and retry.")
+
+
+def save_settings(settings: dict, settings_file: str = SETTINGS_FILE) -> None:
+    """Persists layout settings so the next start picks them up."""
+    with open(settings_file, "w", encoding="utf-8") as f:
+        json.dump(settings, f, indent=2)
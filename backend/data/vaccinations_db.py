@@ -1,22 +1,18 @@
 # File: backend/data/vaccinations_db.py
-import sqlite3
-import os
+from backend.data.storage_config import get_db_path, apply_storage_profile, open_database
 
 class VaccinationsDatabaseInitializer:
     """
     Handles initialization of the vaccinations.db database and creation of the vaccinations table.
     """
 
-    def __init__(self):
-        self.base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.data_dir = os.path.join(self.base_dir, '..', 'data')
-        self.db_path = os.path.join(self.data_dir, 'vaccinations.db')
+    def __init__(self, db_path: str = None):
+        self.db_path = db_path or get_db_path("vaccinations")
 
     def initialize(self):
         """Creates the vaccinations table if it does not already exist."""
-        os.makedirs(self.data_dir, exist_ok=True)
-
-        with sqlite3.connect(self.db_path) as conn:
+        with open_database(self.db_path) as conn:
+            apply_storage_profile(conn)
             cursor = conn.cursor()
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS vaccinations (
@@ -0,0 +1,164 @@
+# File: backend/database_handlers/connection_manager.py
+import os
+import sqlite3
+import threading
+from typing import Dict, Optional
+
+from backend.database_handlers.query_trace import connection_factory
+from backend.database_handlers.write_retry import BUSY_TIMEOUT_MS
+
+
+# Pragmas that apply to one schema; ATTACHed files get them prefixed with their alias
+SCHEMA_PRAGMAS = ("synchronous", "cache_size", "mmap_size")
+
+
+def is_uri(db_path: str) -> bool:
+    """True for ``file:`` URIs, such as the shared-cache in-memory databases."""
+    return db_path.startswith("file:")
+
+
+class ConnectionManager:
+    """
+    Hands out long-lived SQLite connections, one per database file per thread.
+
+    Every handler and controller asks the manager for its connection instead of
+    calling ``sqlite3.connect()`` itself, so a tab that renders hundreds of pets
+    reuses a handful of open connections. Pragmas are applied once, when a
+    connection is first opened (or the first time a new pragma is requested
+    for an already open connection). While query tracing is on, connections are
+    TracedConnections, so every statement shows up in the query tracer.
+    """
+
+    def __init__(self, default_pragmas: Optional[Dict[str, str]] = None):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all_connections = []
+        self._generation = 0
+        self._path_pragmas = {}
+        self.default_pragmas = dict(default_pragmas or {})
+
+    @staticmethod
+    def _normalize(db_path: str) -> str:
+        if is_uri(db_path):
+            return db_path
+        return os.path.normcase(os.path.abspath(db_path))
+
+    def _thread_connections(self) -> dict:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        return connections
+
+    def configure(self, **pragmas) -> None:
+        """Sets pragmas applied to every connection opened from now on."""
+        self.default_pragmas.update(pragmas)
+
+    def register_pragmas(self, db_path: str, pragmas: Dict[str, str]) -> None:
+        """Sets pragmas applied to every connection to ``db_path``, whoever opens it."""
+        self._path_pragmas.setdefault(self._normalize(db_path), {}).update(pragmas)
+
+    def get_connection(self, db_path: str, pragmas: Optional[Dict[str, str]] = None,
+                       attach: Optional[Dict[str, str]] = None) -> sqlite3.Connection:
+        """
+        Returns this thread's connection to ``db_path``, opening it on first use.
+
+        Args:
+            db_path: Path to the SQLite database file, or a ``file:`` URI.
+            pragmas: Extra pragmas this caller needs (e.g. ``{"foreign_keys": "ON"}``).
+            attach: Schema alias -> database file to ATTACH to the connection.
+        """
+        key = self._normalize(db_path)
+        connections = self._thread_connections()
+        entry = connections.get(key)
+
+        # Connections closed by close_all() are left behind in other threads' maps
+        if entry is None or entry["generation"] != self._generation:
+            conn = sqlite3.connect(db_path, check_same_thread=False, factory=connection_factory(),
+                                   uri=is_uri(db_path))
+            entry = connections[key] = {"conn": conn, "pragmas": {}, "attached": {}, "generation": self._generation}
+            with self._lock:
+                self._all_connections.append(conn)
+            self._apply_pragmas(entry, self.default_pragmas)
+
+        if key in self._path_pragmas:
+            self._apply_pragmas(entry, self._path_pragmas[key])
+        if pragmas:
+            self._apply_pragmas(entry, pragmas)
+        if attach:
+            self._attach(entry, attach)
+        return entry["conn"]
+
+    @staticmethod
+    def _apply_pragmas(entry: dict, pragmas: Dict[str, str]) -> None:
+        applied = entry["pragmas"]
+        for name, value in pragmas.items():
+            if applied.get(name) == str(value):
+                continue
+            entry["conn"].execute(f"PRAGMA {name} = {value}")
+            applied[name] = str(value)
+
+    def _attach(self, entry: dict, attachments: Dict[str, str]) -> None:
+        attached = entry["attached"]
+        for alias, path in attachments.items():
+            target = self._normalize(path)
+            if attached.get(alias) == target:
+                continue
+            if alias in attached:
+                entry["conn"].execute(f"DETACH DATABASE {alias}")
+            entry["conn"].execute(f"ATTACH DATABASE ? AS {alias}", (path,))
+            attached[alias] = target
+            registered = self._path_pragmas.get(target, {})
+            for name in SCHEMA_PRAGMAS:
+                if name in registered:
+                    entry["conn"].execute(f"PRAGMA {alias}.{name} = {registered[name]}")
+
+    def close_connection(self, db_path: str) -> None:
+        """Closes the calling thread's connection to ``db_path``, if open."""
+        entry = self._thread_connections().pop(self._normalize(db_path), None)
+        if entry is not None:
+            self._close(entry["conn"])
+
+    def close_thread_connections(self) -> None:
+        """Closes the connections opened by the calling thread."""
+        connections = self._thread_connections()
+        for entry in connections.values():
+            self._close(entry["conn"])
+        connections.clear()
+
+    def close_all(self) -> None:
+        """Closes every connection handed out by the manager, in every thread."""
+        with self._lock:
+            all_connections, self._all_connections = self._all_connections, []
+            self._generation += 1
+        for conn in all_connections:
+            self._close(conn)
+        self._thread_connections().clear()
+
+    def _close(self, conn: sqlite3.Connection) -> None:
+        with self._lock:
+            if conn in self._all_connections:
+                self._all_connections.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+
+# Wait for another workstation's write instead of failing straight away
+connection_manager = ConnectionManager(default_pragmas={"busy_timeout": BUSY_TIMEOUT_MS})
+
+
+def get_connection(db_path: str, pragmas: Optional[Dict[str, str]] = None,
+                   attach: Optional[Dict[str, str]] = None) -> sqlite3.Connection:
+    """Shortcut for ``connection_manager.get_connection``."""
+    return connection_manager.get_connection(db_path, pragmas, attach)
+
+
+def close_connection(db_path: str) -> None:
+    """Shortcut for ``connection_manager.close_connection``."""
+    connection_manager.close_connection(db_path)
+
+
+def close_all_connections() -> None:
+    """Shutdown hook: closes every pooled connection."""
+    connection_manager.close_all()
@@ -0,0 +1,106 @@
+# File: backend/database_handlers/cross_db_query.py
+import sqlite3
+from typing import Iterable, List, Optional, Tuple
+
+from backend.database_handlers.connection_manager import get_connection
+from backend.data.storage_config import StorageConfig, get_storage_config
+from backend.models.pet import Pet, Owner
+
+# Record type -> (logical database name, table)
+RECORD_TABLES = {
+    "vaccinations": ("vaccinations", "vaccinations"),
+    "vet_visits": ("vet_visits", "vet_visits"),
+    "feeding_logs": ("feeding_logs", "daycare_enrollments"),
+    "grooming_logs": ("grooming_logs", "grooming_logs"),
+}
+
+PET_OWNER_SELECT = '''
+    SELECT p.id AS pet_id, p.name AS pet_name, p.breed, p.birthdate, p.image_path,
+        o.id AS owner_id, o.name AS owner_name, o.contact_number, o.address
+    FROM pets p
+    LEFT JOIN owner o ON p.owner_id = o.id
+'''
+
+
+def pet_and_owner_from_row(row: sqlite3.Row) -> Tuple[Pet, Optional[Owner]]:
+    """Builds the Pet and its Owner (or None) from a ``PET_OWNER_SELECT`` row."""
+    pet = Pet(
+        id=row['pet_id'],
+        name=row['pet_name'],
+        breed=row['breed'],
+        birthdate=row['birthdate'],
+        image_path=row['image_path'],
+        owner_id=row['owner_id']
+    )
+    owner = Owner(
+        id=row['owner_id'],
+        name=row['owner_name'],
+        contact_number=row['contact_number'],
+        address=row['address']
+    ) if row['owner_id'] else None
+    return pet, owner
+
+
+class CrossDatabaseQuery:
+    """
+    Set-based queries across the pet and record databases.
+
+    In the split layout the record databases are ATTACHed to the pooled pets.db
+    connection, so "which pets have records" becomes one ``EXISTS`` semi-join
+    instead of one query per pet. Table names are unique across the files, so the
+    same SQL runs unchanged in the single-file layout.
+    """
+
+    def __init__(self, config: Optional[StorageConfig] = None, pets_db_path: Optional[str] = None):
+        self.config = config or get_storage_config()
+        self.pets_db_path = pets_db_path or self.config.db_path("pets")
+
+    def attachments(self) -> dict:
+        """Schema alias -> file for every record database not stored in pets.db."""
+        attachments = {}
+        for db_name, _ in RECORD_TABLES.values():
+            path = self.config.db_path(db_name)
+            if path != self.pets_db_path:
+                attachments[f"{db_name}_db"] = path
+        return attachments
+
+    def connect(self) -> sqlite3.Connection:
+        """Returns this thread's pets connection with the record databases attached."""
+        return get_connection(
+            self.pets_db_path,
+            pragmas={"foreign_keys": "ON"},
+            attach=self.attachments()
+        )
+
+    @staticmethod
+    def exists_clause(record_type: str, pet_alias: str = "p") -> str:
+        """SQL condition that is true when the pet has at least one record of ``record_type``."""
+        if record_type not in RECORD_TABLES:
+            raise ValueError(f"Unknown record type: {record_type!r}")
+        table = RECORD_TABLES[record_type][1]
+        return f"EXISTS (SELECT 1 FROM {table} r WHERE r.pet_id = {pet_alias}.id)"
+
+    def pets_with_owners(self, condition: Optional[str] = None, params: Iterable = ()) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """Runs the pet/owner join, optionally filtered by an SQL condition on ``p``."""
+        conn = self.connect()
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        sql = PET_OWNER_SELECT + (f" WHERE {condition}" if condition else "") + " ORDER BY p.id"
+        cursor.execute(sql, tuple(params))
+
+        pets, owners = [], []
+        for row in cursor.fetchall():
+            pet, owner = pet_and_owner_from_row(row)
+            pets.append(pet)
+            owners.append(owner)
+        return pets, owners
+
+    def pets_with_any(self, record_types: Iterable[str]) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """Pets (with owners) having at least one record of any of ``record_types``."""
+        clauses = [self.exists_clause(record_type) for record_type in record_types]
+        return self.pets_with_owners(" OR ".join(clauses) if clauses else "0")
+
+    def pets_with_all(self, record_types: Iterable[str]) -> Tuple[List[Pet], List[Optional[Owner]]]:
+        """Pets (with owners) having at least one record of every type in ``record_types``."""
+        clauses = [self.exists_clause(record_type) for record_type in record_types]
+        return self.pets_with_owners(" AND ".join(clauses) if clauses else None)
@@ -1,38 +1,45 @@
 # File: backend/database/feeding_logs_db_handler.py
-import sqlite3
-import os
+from backend.database_handlers.connection_manager import get_connection
+from backend.data.storage_config import get_db_path
 from backend.models.feeding_log import FeedingLog
+from backend.database_handlers.query_utils import fetch_grouped_by_pet_ids, insert_many
+from backend.database_handlers.write_retry import run_write
 
 class FeedingLogDB:
     def __init__(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_path = os.path.join(base_dir, '..', 'data', 'feeding_logs.db')
+        self.db_path = get_db_path("feeding_logs")
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        return get_connection(self.db_path)
+
+    INSERT_SQL = """
+        INSERT INTO daycare_enrollments 
+        (pet_id, start_date, num_days, feed_once, feed_twice, feed_thrice, notes)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def insert_params(log: FeedingLog) -> tuple:
+        return (
+            log.pet_id,
+            log.start_date,
+            log.num_days,
+            int(log.feed_once),
+            int(log.feed_twice),
+            int(log.feed_thrice),
+            log.notes
+        )
 
     def insert(self, log: FeedingLog):
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO daycare_enrollments 
-                (pet_id, start_date, num_days, feed_once, feed_twice, feed_thrice, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                log.pet_id,
-                log.start_date,
-                log.num_days,
-                int(log.feed_once),
-                int(log.feed_twice),
-                int(log.feed_thrice),
-                log.notes
-            ))
-            conn.commit()
-            return cursor.lastrowid
+        return run_write(self.connect(),
+                         lambda cursor: cursor.execute(self.INSERT_SQL, self.insert_params(log)).lastrowid)
+
+    def insert_many(self, logs: list[FeedingLog]) -> list[int]:
+        """Insert many daycare enrollments in one transaction and return their IDs"""
+        return insert_many(self.connect(), self.INSERT_SQL, [self.insert_params(log) for log in logs])
 
     def update(self, record_id: int, log: FeedingLog):
-        with self.connect() as conn:
-            cursor = conn.cursor()
+        def write(cursor):
             cursor.execute("""
                 UPDATE daycare_enrollments
                 SET pet_id = ?, start_date = ?, num_days = ?, 
@@ -48,7 +55,7 @@ class FeedingLogDB:
                 log.notes,
                 record_id
             ))
-            conn.commit()
+        run_write(self.connect(), write)
 
     def get_by_pet_id(self, pet_id: int) -> list[FeedingLog]:
         with self.connect() as conn:
@@ -60,11 +67,17 @@ class FeedingLogDB:
             """, (pet_id,))
             return [FeedingLog(*row) for row in cursor.fetchall()]
 
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[FeedingLog]]:
+        """Get feeding logs for many pets at once, grouped by pet ID"""
+        return fetch_grouped_by_pet_ids(self.connect(), """
+            SELECT pet_id, start_date, num_days, feed_once, feed_twice, feed_thrice, notes
+            FROM daycare_enrollments
+            WHERE pet_id IN ({placeholders})
+        """, pet_ids, lambda row: FeedingLog(*row))
+
     def delete(self, record_id: int):
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM daycare_enrollments WHERE id = ?", (record_id,))
-            conn.commit()
+        run_write(self.connect(),
+                  lambda cursor: cursor.execute("DELETE FROM daycare_enrollments WHERE id = ?", (record_id,)))
 
     def fetch_by_id(self, record_id: int):
         with self.connect() as conn:
@@ -0,0 +1,344 @@
+# File: backend/database_handlers/query_trace.py
+import functools
+import os
+import re
+import sqlite3
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+# Upper bounds (ms) of the duration histogram buckets; a last bucket takes the rest
+HISTOGRAM_BOUNDS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+# Tracing costs time on every statement, so it is off unless this is set to 1
+TRACE_ENV = "PETTRACKR_TRACE_QUERIES"
+
+DEFAULT_SLOW_QUERY_MS = 100.0
+DEFAULT_SLOW_LOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "logs", "slow_queries.log"
+)
+
+_WHITESPACE = re.compile(r"\s+")
+# Statements the sqlite3 module also issues on its own, which only the trace callback sees
+_TRANSACTION_CONTROL = re.compile(r"\s*(BEGIN|COMMIT|END|ROLLBACK|SAVEPOINT|RELEASE)\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_sql(sql: str) -> str:
+    """One-line statement text, the key statements are grouped under."""
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class StatementStats:
+    """Duration histogram and totals of one statement against one database file."""
+
+    def __init__(self, db_path: str, sql: str):
+        self.db_path = db_path
+        self.sql = sql
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def add(self, seconds: float, rows: int, failed: bool) -> None:
+        self.count += 1
+        self.rows += rows
+        self.errors += failed
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        ms = seconds * 1000
+        index = next((i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if ms <= bound), len(HISTOGRAM_BOUNDS_MS))
+        self.buckets[index] += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "db": os.path.basename(self.db_path),
+            "sql": self.sql,
+            "count": self.count,
+            "errors": self.errors,
+            "rows": self.rows,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds * 1000 / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "histogram": dict(zip([f"<={b}ms" for b in HISTOGRAM_BOUNDS_MS] + ["slower"], self.buckets)),
+        }
+
+
+class QueryTracer:
+    """
+    Collects what SQL the pooled connections run.
+
+    The cursor wrappers of ``TracedConnection`` time every statement and
+    count its rows (kept as per-statement histograms) and add it to a short
+    "recent" list. The SQLite trace callback adds the BEGIN/COMMIT the sqlite3
+    module issues on its own to that list. Statements are kept and logged
+    without their parameters, so owner names and phone numbers never end up
+    in the recent list, the slow-query log or a diagnostics dump. Statements
+    slower than ``slow_threshold_ms`` are appended to the slow-query log.
+    Controller errors that are turned into empty results are recorded here too.
+    """
+
+    def __init__(self, slow_threshold_ms: float = DEFAULT_SLOW_QUERY_MS,
+                 slow_log_path: Optional[str] = DEFAULT_SLOW_LOG_PATH, recent_size: int = 200,
+                 enabled: bool = False):
+        self.slow_threshold_ms = slow_threshold_ms
+        self.slow_log_path = slow_log_path
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._recent_size = recent_size
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements: Dict[tuple, StatementStats] = {}
+            self.recent = deque(maxlen=self._recent_size)
+            self.errors = deque(maxlen=50)
+            self.slow_queries = 0
+
+    # Recording
+
+    def on_statement(self, db_path: str, sql: str) -> None:
+        """SQLite trace callback: remembers transaction control statements."""
+        # Anything else arrives through remember(), where the parameters are still placeholders
+        if self.enabled and _TRANSACTION_CONTROL.match(sql):
+            self._remember(db_path, sql)
+
+    def remember(self, db_path: str, sql: str) -> None:
+        """Called by the cursor wrappers when a statement starts."""
+        if not _TRANSACTION_CONTROL.match(sql):
+            self._remember(db_path, sql)
+
+    def _remember(self, db_path: str, sql: str) -> None:
+        # Appended under the lock: snapshot() iterates the deque from other threads
+        with self._lock:
+            self.recent.append((time.time(), os.path.basename(db_path), sql))
+
+    def record(self, db_path: str, sql: str, seconds: float, rows: int, error: Optional[Exception] = None) -> None:
+        """Called by the cursor wrappers once a statement finished (or failed)."""
+        sql = normalize_sql(sql)
+        with self._lock:
+            stats = self._statements.get((db_path, sql))
+            if stats is None:
+                stats = self._statements[(db_path, sql)] = StatementStats(db_path, sql)
+            stats.add(seconds, rows, error is not None)
+            slow = seconds * 1000 >= self.slow_threshold_ms
+            if slow:
+                self.slow_queries += 1
+        if slow:
+            self._log_slow(db_path, sql, seconds, rows)
+
+    def record_error(self, where: str, error: BaseException) -> None:
+        """Keeps an error a caller recovered from, with its traceback, and prints it."""
+        with self._lock:
+            self.errors.append({
+                "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                "where": where,
+                "error": f"{type(error).__name__}: {error}",
+                "traceback": "".join(traceback.format_exception(type(error), error, error.__traceback__)),
+            })
+        print(f"❌ {where} failed: {error}")
+
+    def _log_slow(self, db_path: str, sql: str, seconds: float, rows: int) -> None:
+        if not self.slow_log_path:
+            return
+        line = (f"{time.strftime('%Y-%m-%d %H:%M:%S')}\t{seconds * 1000:.1f} ms\t{rows} rows\t"
+                f"{os.path.basename(db_path)}\t{sql}\n")
+        try:
+            os.makedirs(os.path.dirname(self.slow_log_path), exist_ok=True)
+            with self._lock, open(self.slow_log_path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            print(f"⚠️ Could not write slow-query log: {e}")
+
+    # Reporting
+
+    def snapshot(self, top: Optional[int] = None) -> dict:
+        """Statements by total time spent, recent statements and recorded errors."""
+        with self._lock:
+            statements = sorted(self._statements.values(), key=lambda s: s.total_seconds, reverse=True)
+            return {
+                "enabled": self.enabled,
+                "slow_threshold_ms": self.slow_threshold_ms,
+                "slow_log_path": self.slow_log_path,
+                "slow_queries": self.slow_queries,
+                "statements": [s.to_dict() for s in statements[:top]],
+                "recent": [
+                    {"time": time.strftime("%H:%M:%S", time.localtime(t)), "db": db, "sql": normalize_sql(sql)}
+                    for t, db, sql in self.recent
+                ],
+                "errors": list(self.errors),
+            }
+
+
+query_tracer = QueryTracer(
+    slow_threshold_ms=float(os.environ.get("PETTRACKR_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS)),
+    enabled=os.environ.get(TRACE_ENV) == "1",
+)
+
+
+def configure_tracing(**settings) -> QueryTracer:
+    """
+    Changes the tracer settings, e.g. ``configure_tracing(enabled=True, slow_threshold_ms=20)``.
+
+    Turning tracing on only affects connections opened afterwards (see
+    ``connection_factory``); call it before the first query, or close the
+    pooled connections.
+    """
+    for name, value in settings.items():
+        if not hasattr(query_tracer, name):
+            raise AttributeError(f"Unknown tracing setting: {name!r}")
+        setattr(query_tracer, name, value)
+    return query_tracer
+
+
+class TracedCursor(sqlite3.Cursor):
+    """
+    Cursor that times its statements. A query is recorded once its rows are
+    exhausted (or the cursor runs the next statement or is closed), so the time
+    spent fetching and the number of rows read are included.
+    """
+
+    _pending: Optional[list] = None
+
+    def execute(self, sql, parameters=()):
+        return self._traced(super().execute, sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self._traced(super().executemany, sql, seq_of_parameters)
+
+    def _traced(self, run: Callable, sql: str, parameters):
+        self._finish()
+        if not query_tracer.enabled:
+            return run(sql, parameters)
+        query_tracer.remember(self.connection.db_path, sql)
+        started = time.perf_counter()
+        try:
+            run(sql, parameters)
+        except sqlite3.Error as e:
+            query_tracer.record(self.connection.db_path, sql, time.perf_counter() - started, 0, error=e)
+            raise
+        elapsed = time.perf_counter() - started
+        if self.description is None:
+            query_tracer.record(self.connection.db_path, sql, elapsed, max(self.rowcount, 0))
+        else:
+            self._pending = [sql, elapsed, 0]
+        return self
+
+    def _fetched(self, started: float, rows: int, exhausted: bool) -> None:
+        pending = self._pending
+        pending[1] += time.perf_counter() - started
+        pending[2] += rows
+        if exhausted:
+            self._finish()
+
+    def _finish(self) -> None:
+        if self._pending is not None:
+            sql, elapsed, rows = self._pending
+            self._pending = None
+            query_tracer.record(self.connection.db_path, sql, elapsed, rows)
+
+    def fetchone(self):
+        if self._pending is None:
+            return super().fetchone()
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(started, row is not None, row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        if self._pending is None:
+            return super().fetchmany(size)
+        started = time.perf_counter()
+        rows = super().fetchmany(size)
+        self._fetched(started, len(rows), len(rows) < size)
+        return rows
+
+    def fetchall(self):
+        if self._pending is None:
+            return super().fetchall()
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(started, len(rows), True)
+        return rows
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        row = self.fetchone()
+        if row is None:
+            raise StopIteration
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+
+class TracedConnection(sqlite3.Connection):
+    """``sqlite3.connect`` factory handing out TracedCursors and feeding the trace callback."""
+
+    def __init__(self, database, *args, **kwargs):
+        super().__init__(database, *args, **kwargs)
+        self.db_path = os.fspath(database)
+        self.set_trace_callback(functools.partial(query_tracer.on_statement, self.db_path))
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    # The built-in shortcuts create their cursor in C, bypassing cursor() above
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connection_factory() -> type:
+    """
+    Connection class for new connections: TracedConnection while tracing is on,
+    otherwise the plain sqlite3.Connection, with no trace callback or cursor
+    wrapper slowing down every statement.
+    """
+    return TracedConnection if query_tracer.enabled else sqlite3.Connection
+
+
+def get_query_trace(top: Optional[int] = None) -> dict:
+    """Shortcut for ``query_tracer.snapshot(top)``."""
+    return query_tracer.snapshot(top)
+
+
+def fallback_on_error(fallback: Callable):
+    """
+    For read methods that keep the UI working when a query fails: the error is
+    recorded with the tracer and ``fallback(*args, **kwargs)`` is returned
+    instead. Put it above ``cached_query`` so fallback results are not cached.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                query_tracer.record_error(f"{type(self).__name__}.{method.__name__}", e)
+                return fallback(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def tail_slow_log(limit: int = 20, path: Optional[str] = None) -> List[str]:
+    """The last ``limit`` lines of the slow-query log."""
+    path = path or query_tracer.slow_log_path
+    if not path or not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in deque(f, maxlen=limit)]
@@ -0,0 +1,72 @@
+# File: backend/database_handlers/query_utils.py
+from typing import Callable, Iterable, Iterator, List
+
+from backend.database_handlers.write_retry import run_write
+
+# SQLite builds older than 3.32 cap bound parameters at 999 per statement
+MAX_SQL_PARAMS = 900
+
+
+def chunked(items: Iterable, size: int = MAX_SQL_PARAMS) -> Iterator[List]:
+    """Yields successive lists of at most ``size`` items."""
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def fetch_grouped_by_pet_ids(conn, sql: str, pet_ids: Iterable[int], row_to_model: Callable) -> dict:
+    """
+    Runs ``sql`` once per chunk of pet IDs and groups the models by ``pet_id``.
+
+    Args:
+        conn: Open SQLite connection.
+        sql: SELECT statement containing a ``{placeholders}`` marker inside its
+            ``WHERE pet_id IN (...)`` clause.
+        pet_ids: Pet IDs to fetch records for.
+        row_to_model: Converts one result row into a model with a ``pet_id``.
+
+    Returns:
+        Dict mapping every requested pet ID to its (possibly empty) list of models,
+        in the order produced by the query.
+    """
+    unique_ids = list(dict.fromkeys(pet_ids))
+    grouped = {pet_id: [] for pet_id in unique_ids}
+
+    cursor = conn.cursor()
+    for chunk in chunked(unique_ids):
+        placeholders = ", ".join("?" for _ in chunk)
+        cursor.execute(sql.format(placeholders=placeholders), chunk)
+        for row in cursor.fetchall():
+            model = row_to_model(row)
+            grouped.setdefault(model.pet_id, []).append(model)
+    return grouped
+
+
+def insert_many(conn, sql: str, rows: Iterable[tuple]) -> List[int]:
+    """
+    Inserts every row with one ``executemany`` in a single write transaction.
+
+    Args:
+        conn: Open SQLite connection.
+        sql: INSERT statement with one ``?`` per column.
+        rows: Parameter tuples, one per new row.
+
+    Returns:
+        The new row ids, in the order of ``rows``. The write lock is held for the
+        whole statement, so the ids of one batch are consecutive.
+    """
+    rows = list(rows)
+    if not rows:
+        return []
+
+    def write(cursor):
+        cursor.executemany(sql, rows)
+        return cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+    last_id = run_write(conn, write)
+    return list(range(last_id - len(rows) + 1, last_id + 1))
@@ -1,32 +1,36 @@
 # File: backend/database/vaccinations_db_handler.py
-import sqlite3
-import os
+from backend.database_handlers.connection_manager import get_connection
+from backend.data.storage_config import get_db_path
 from backend.models.vaccination import Vaccination
+from backend.database_handlers.query_utils import fetch_grouped_by_pet_ids, insert_many
+from backend.database_handlers.write_retry import run_write
 
 class VaccinationDB:
     def __init__(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_path = os.path.join(base_dir, '..', 'data', 'vaccinations.db')
+        self.db_path = get_db_path("vaccinations")
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        return get_connection(self.db_path)
+
+    INSERT_SQL = """
+        INSERT INTO vaccinations (pet_id, vaccine_name, date_administered, next_due, price, notes)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def insert_params(vax: Vaccination) -> tuple:
+        return (vax.pet_id, vax.vaccine_name, vax.date_administered, vax.next_due, vax.price, vax.notes)
 
     def insert(self, vax: Vaccination):
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO vaccinations (pet_id, vaccine_name, date_administered, next_due, price, notes)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (vax.pet_id, vax.vaccine_name, vax.date_administered, vax.next_due, vax.price, vax.notes)
-            )
-            conn.commit()
-            return cursor.lastrowid
+        return run_write(self.connect(),
+                         lambda cursor: cursor.execute(self.INSERT_SQL, self.insert_params(vax)).lastrowid)
+
+    def insert_many(self, vaxes: list[Vaccination]) -> list[int]:
+        """Insert many vaccinations in one transaction and return their IDs"""
+        return insert_many(self.connect(), self.INSERT_SQL, [self.insert_params(vax) for vax in vaxes])
 
     def update(self, vax: Vaccination):
-        with self.connect() as conn:
-            cursor = conn.cursor()
+        def write(cursor):
             cursor.execute(
                 """
                 UPDATE vaccinations
@@ -35,7 +39,7 @@ class VaccinationDB:
                 """,
                 (vax.pet_id, vax.vaccine_name, vax.date_administered, vax.next_due, vax.price, vax.notes)
             )
-            conn.commit()
+        run_write(self.connect(), write)
 
     def get_by_pet_id(self, pet_id: int) -> list[Vaccination]:
         """Get all vaccinations for a specific pet ID"""
@@ -49,11 +53,18 @@ class VaccinationDB:
             """, (pet_id,))
             return [Vaccination(*row) for row in cursor.fetchall()]
 
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[Vaccination]]:
+        """Get vaccinations for many pets at once, grouped by pet ID"""
+        return fetch_grouped_by_pet_ids(self.connect(), """
+            SELECT pet_id, vaccine_name, date_administered, next_due, price, notes
+            FROM vaccinations
+            WHERE pet_id IN ({placeholders})
+            ORDER BY date_administered DESC
+        """, pet_ids, lambda row: Vaccination(*row))
+
     def delete(self, record_id: int):
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM vaccinations WHERE id = ?", (record_id,))
-            conn.commit()
+        run_write(self.connect(),
+                  lambda cursor: cursor.execute("DELETE FROM vaccinations WHERE id = ?", (record_id,)))
 
     def fetch_by_id(self, record_id: int):
         with self.connect() as conn:
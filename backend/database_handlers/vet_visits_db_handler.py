@@ -1,32 +1,36 @@
 # File: backend/db/vet_visit_db_handler.py
-import sqlite3
-import os
+from backend.database_handlers.connection_manager import get_connection
+from backend.data.storage_config import get_db_path
 from backend.models.vet_visit import VetVisit
+from backend.database_handlers.query_utils import fetch_grouped_by_pet_ids, insert_many
+from backend.database_handlers.write_retry import run_write
 
 class VetVisitDB:
     def __init__(self):
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        self.db_path = os.path.join(base_dir, '..', 'data', 'vet_visits.db')
+        self.db_path = get_db_path("vet_visits")
 
     def connect(self):
-        return sqlite3.connect(self.db_path)
+        return get_connection(self.db_path)
+
+    INSERT_SQL = """
+        INSERT INTO vet_visits (pet_id, visit_date, reason, notes, cost)
+        VALUES (?, ?, ?, ?, ?)
+    """
+
+    @staticmethod
+    def insert_params(visit: VetVisit) -> tuple:
+        return (visit.pet_id, visit.visit_date, visit.reason, visit.notes, visit.cost)
 
     def insert(self, visit: VetVisit):
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO vet_visits (pet_id, visit_date, reason, notes, cost)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (visit.pet_id, visit.visit_date, visit.reason, visit.notes, visit.cost)
-            )
-            conn.commit()
-            return cursor.lastrowid
+        return run_write(self.connect(),
+                         lambda cursor: cursor.execute(self.INSERT_SQL, self.insert_params(visit)).lastrowid)
+
+    def insert_many(self, visits: list[VetVisit]) -> list[int]:
+        """Insert many vet visits in one transaction and return their IDs"""
+        return insert_many(self.connect(), self.INSERT_SQL, [self.insert_params(visit) for visit in visits])
 
     def update(self, visit: VetVisit):
-        with self.connect() as conn:
-            cursor = conn.cursor()
+        def write(cursor):
             cursor.execute(
                 """
                 UPDATE vet_visits
@@ -35,7 +39,7 @@ class VetVisitDB:
                 """,
                 (visit.pet_id, visit.visit_date, visit.reason, visit.notes, visit.cost)
             )
-            conn.commit()
+        run_write(self.connect(), write)
 
     def get_by_pet_id(self, pet_id: int) -> list[VetVisit]:
         """Get all vet visits for a specific pet ID"""
@@ -50,11 +54,18 @@ class VetVisitDB:
             """, (pet_id,))
             return [VetVisit(*row) for row in cursor.fetchall()]
 
+    def get_by_pet_ids(self, pet_ids: list[int]) -> dict[int, list[VetVisit]]:
+        """Get vet visits for many pets at once, grouped by pet ID"""
+        return fetch_grouped_by_pet_ids(self.connect(), """
+            SELECT pet_id, visit_date, reason, notes, cost
+            FROM vet_visits
+            WHERE pet_id IN ({placeholders})
+            ORDER BY visit_date DESC
+        """, pet_ids, lambda row: VetVisit(*row))
+
     def delete(self, record_id: int):
-        with self.connect() as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM vet_visits WHERE id = ?", (record_id,))
-            conn.commit()
+        run_write(self.connect(),
+                  lambda cursor: cursor.execute("DELETE FROM vet_visits WHERE id = ?", (record_id,)))
 
     def fetch_by_id(self, record_id: int):
         with self.connect() as conn:
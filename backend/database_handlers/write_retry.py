@@ -0,0 +1,135 @@
+# File: backend/database_handlers/write_retry.py
+import random
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+# How long SQLite itself waits for a lock before reporting "database is locked"
+BUSY_TIMEOUT_MS = 5000
+
+# A BEGIN IMMEDIATE slower than this was waiting for another writer
+LOCK_WAIT_THRESHOLD = 0.01
+
+
+def is_lock_error(error: BaseException) -> bool:
+    """True for the errors another connection holding a lock produces."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return "locked" in message or "busy" in message
+
+
+class RetryPolicy:
+    """
+    Jittered exponential backoff for writes that still find the database locked
+    once ``busy_timeout`` ran out.
+
+    Attempt ``n`` (from 0) sleeps a random time up to ``base_delay * 2**n``,
+    capped at ``max_delay``. Full jitter keeps two workstations that collided
+    once from retrying in lockstep.
+    """
+
+    def __init__(self, attempts: int = 6, base_delay: float = 0.05, max_delay: float = 2.0):
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delays(self) -> Iterator[float]:
+        """Sleep before each retry; there are ``attempts - 1`` of them."""
+        for attempt in range(self.attempts - 1):
+            yield random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class LockStats:
+    """Lock-contention counters of this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.transactions = 0
+            self.lock_waits = 0        # writes that had to wait for a lock at least once
+            self.retries = 0           # backoff sleeps taken
+            self.failures = 0          # writes that gave up
+            self.wait_seconds = 0.0    # time spent in BEGIN IMMEDIATE and backoff sleeps
+            self.max_wait_seconds = 0.0
+
+    def record(self, waited: float, retries: int, failed: bool = False) -> None:
+        with self._lock:
+            self.transactions += 1
+            self.retries += retries
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+            if retries or failed or waited >= LOCK_WAIT_THRESHOLD:
+                self.lock_waits += 1
+            if failed:
+                self.failures += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "transactions": self.transactions,
+                "lock_waits": self.lock_waits,
+                "retries": self.retries,
+                "failures": self.failures,
+                "wait_seconds": round(self.wait_seconds, 4),
+                "max_wait_seconds": round(self.max_wait_seconds, 4),
+            }
+
+
+default_policy = RetryPolicy()
+lock_stats = LockStats()
+
+
+def run_write(conn: sqlite3.Connection, work: Callable[[sqlite3.Cursor], T],
+              policy: Optional[RetryPolicy] = None) -> T:
+    """
+    Runs ``work(cursor)`` in a ``BEGIN IMMEDIATE`` transaction and commits it,
+    retrying the whole transaction with backoff while the database is locked.
+
+    Taking the write lock up front matters: a deferred transaction that read
+    first and then tries to write cannot wait for the lock (SQLite would risk a
+    deadlock) and fails at once with "database is locked", busy_timeout or not.
+    ``work`` may therefore run more than once and must only touch the database.
+
+    Raises:
+        sqlite3.OperationalError: When the database stayed locked through every attempt.
+    """
+    policy = policy or default_policy
+    delays = policy.delays()
+    retries = 0
+    waited = 0.0
+    while True:
+        try:
+            begin = time.perf_counter()
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+            finally:
+                waited += time.perf_counter() - begin
+            result = work(conn.cursor())
+            conn.commit()
+        except BaseException as e:
+            if conn.in_transaction:
+                conn.rollback()
+            if not is_lock_error(e):
+                raise
+            delay = next(delays, None)
+            if delay is None:
+                lock_stats.record(waited, retries, failed=True)
+                raise
+            retries += 1
+            time.sleep(delay)
+            waited += delay
+            continue
+        lock_stats.record(waited, retries)
+        return result
+
+
+def get_lock_stats() -> dict:
+    """Shortcut for ``lock_stats.snapshot()``."""
+    return lock_stats.snapshot()
@@ -1,5 +1,6 @@
-import sqlite3
 import os
+from backend.data.storage_config import get_db_path
+from backend.database_handlers.connection_manager import get_connection
 
 def export_pets_to_txt(pets, filename="export-import/pets_export.txt"):
     os.makedirs(os.path.dirname(filename), exist_ok=True)
@@ -11,18 +12,13 @@ def export_pets_to_txt(pets, filename="export-import/pets_export.txt"):
             f.write("-" * 20 + "\n")
 
 def export_pets_to_txt_from_db(
-    db_path="backend/data/pets.db",
+    db_path=None,
     output_path="export-import/pets_export.txt"
-
-    
 ):
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    # Connect to the SQLite database
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    cursor.execute("SELECT id, name, breed, birthdate, image_path FROM pets")
-    pets = cursor.fetchall()
-    conn.close()
+    # The pooled connection also reaches the in-memory databases
+    conn = get_connection(db_path or get_db_path("pets"))
+    pets = conn.execute("SELECT id, name, breed, birthdate, image_path FROM pets").fetchall()
 
     # Write to text file
     with open(output_path, "w", encoding="utf-8") as f:
@@ -1,35 +1,26 @@
 # backend/services/db_service.py
 
-import sqlite3
 import os
 
-DATA_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data'))
+from backend.data.storage_config import get_storage_config, open_database
 
-def test_db_connection(db_filename):
-    db_path = f'/{db_filename}'
+def test_db_connection(db_path):
+    name = os.path.basename(db_path)
     try:
-        conn = sqlite3.connect(db_path)
+        conn = open_database(db_path)
         cursor = conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
         tables = cursor.fetchall()
-        print(f"🟢 Connected to {db_filename}")
+        print(f"🟢 Connected to {name}")
         print("    Tables:", tables)
         conn.close()
     except Exception as e:
-        print(f"🔴 Failed to connect to {db_filename}:", e)
+        print(f"🔴 Failed to connect to {name}:", e)
 
 def test_all_connections():
-    db_files = [
-        'pets.db',
-        'vet_visits.db',
-        'vaccinations.db',
-        'feeding_logs.db',
-        'grooming_logs.db',
-        'health_notes.db'
-    ]
     print("📁 Testing all database connections:\n")
-    for db_file in db_files:
-        test_db_connection(db_file)
+    for db_path in sorted(set(get_storage_config().db_paths().values())):
+        test_db_connection(db_path)
     print("\n✅ Database connectivity check complete.")
 
 if __name__ == "__main__":
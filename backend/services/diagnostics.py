@@ -0,0 +1,160 @@
+# File: backend/services/diagnostics.py
+import argparse
+import json
+import os
+from typing import Callable, Dict, List, Optional
+
+from backend.data.memory_store import get_memory_store
+from backend.data.storage_config import get_storage_config
+from backend.database_handlers.connection_manager import get_connection
+from backend.database_handlers.write_retry import get_lock_stats
+from backend.database_handlers.query_trace import TRACE_ENV, get_query_trace, tail_slow_log
+from backend.services.query_cache import get_query_cache
+
+# Pragmas reported for every database file
+REPORTED_PRAGMAS = ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "foreign_keys",
+                    "busy_timeout")
+
+# Extra report sections, name -> function returning the section, registered by
+# modules the backend does not import (the frontend's caches and renderers)
+_providers: Dict[str, Callable[[], object]] = {}
+
+SYNCHRONOUS_NAMES = {0: "OFF", 1: "NORMAL", 2: "FULL", 3: "EXTRA"}
+TEMP_STORE_NAMES = {0: "DEFAULT", 1: "FILE", 2: "MEMORY"}
+
+
+def storage_diagnostics() -> Dict[str, object]:
+    """Active layout, profile and mode, plus the pragmas each database really uses."""
+    config = get_storage_config()
+    files: List[dict] = []
+    for path in sorted(set(config.db_paths().values())):
+        conn = get_connection(path)
+        # In-memory databases return no row for mmap_size
+        values = {name: (conn.execute(f"PRAGMA {name}").fetchone() or (None,))[0] for name in REPORTED_PRAGMAS}
+        values["synchronous"] = SYNCHRONOUS_NAMES.get(values["synchronous"], values["synchronous"])
+        values["temp_store"] = TEMP_STORE_NAMES.get(values["temp_store"], values["temp_store"])
+        if config.is_memory:
+            size = conn.execute("PRAGMA page_count").fetchone()[0] * conn.execute("PRAGMA page_size").fetchone()[0]
+        else:
+            size = os.path.getsize(path) if os.path.exists(path) else None
+        files.append({
+            "db_path": path,
+            "size_bytes": size,
+            "pragmas": values,
+        })
+    store = get_memory_store()
+    return {
+        "layout": config.layout,
+        "profile": config.profile,
+        "mode": config.mode,
+        "profile_pragmas": config.profile_pragmas(),
+        "data_dir": config.data_dir,
+        "files": files,
+        "snapshots": store.stats() if store else None,
+    }
+
+
+def register_diagnostics_provider(name: str, provider: Callable[[], object]) -> None:
+    """Adds ``provider()`` to every report as section ``name``; called from a worker thread."""
+    _providers[name] = provider
+
+
+def collect_diagnostics(top: Optional[int] = 15) -> Dict[str, object]:
+    """Everything the diagnostics view and CLI report."""
+    cache = get_query_cache()
+    report = {
+        "storage": storage_diagnostics(),
+        "query_cache": cache.stats() if cache else None,
+        "locks": get_lock_stats(),
+        "queries": get_query_trace(top),
+        "slow_log": tail_slow_log(),
+    }
+    for name, provider in list(_providers.items()):
+        report[name] = provider()
+    return report
+
+
+def format_diagnostics(report: Dict[str, object]) -> str:
+    lines = []
+    storage = report["storage"]
+    lines.append(f"🗄️ Storage: {storage['layout']} layout, \"{storage['profile']}\" profile, "
+                 f"{storage['mode']} mode ({storage['data_dir']})")
+    snapshots = storage["snapshots"]
+    if snapshots:
+        lines.append(f"   📸 Snapshots every {snapshots['interval_seconds']:g}s: {snapshots['snapshots']} taken, "
+                     f"{snapshots['failures']} failed, last "
+                     + (f"{snapshots['last_snapshot']} ({snapshots['last_snapshot_ms']} ms)"
+                        if snapshots["last_snapshot"] else "never"))
+    for entry in storage["files"]:
+        pragmas = ", ".join(f"{name}={value}" for name, value in entry["pragmas"].items())
+        lines.append(f"   📁 {os.path.basename(entry['db_path'])}: {pragmas}")
+    cache = report["query_cache"]
+    if cache:
+        lines.append(f"🧠 Query cache: {cache['entries']}/{cache['max_entries']} entries, "
+                     f"hit rate {cache['hit_rate']:.0%}")
+    else:
+        lines.append("🧠 Query cache: off")
+    images = report.get("image_cache")
+    if images:
+        lines.append(f"🖼️ Image cache: {images['entries']}/{images['max_entries']} entries, "
+                     f"{images['hits']} hits, {images['misses']} misses, {images['evictions']} evictions, "
+                     f"hit rate {images['hit_rate']:.0%}")
+    locks = report["locks"]
+    lines.append(f"🔒 Writes: {locks['transactions']} transactions, {locks['lock_waits']} waited for a lock, "
+                 f"{locks['retries']} retries, {locks['failures']} gave up "
+                 f"(longest wait {locks['max_wait_seconds']:.2f}s)")
+
+    queries = report["queries"]
+    if not queries["enabled"]:
+        lines.append(f"⏱️ Query tracing off (start with {TRACE_ENV}=1 to time statements)")
+    lines.append(f"⏱️ Queries (slowest total first; {queries['slow_queries']} over "
+                 f"{queries['slow_threshold_ms']:g} ms):")
+    for stats in queries["statements"]:
+        lines.append(f"   {stats['count']:>6}x  total {stats['total_ms']:>9.1f} ms  mean {stats['mean_ms']:>7.2f} ms  "
+                     f"max {stats['max_ms']:>7.1f} ms  {stats['rows']:>7} rows  {stats['db']}")
+        lines.append(f"          {stats['sql'][:160]}")
+        buckets = "  ".join(f"{bound}:{count}" for bound, count in stats["histogram"].items() if count)
+        lines.append(f"          {buckets}")
+    if not queries["statements"]:
+        lines.append("   (none yet)")
+    for error in queries["errors"]:
+        lines.append(f"❌ {error['time']} {error['where']}: {error['error']}")
+    if report["slow_log"]:
+        lines.append(f"🐢 Slow-query log ({queries['slow_log_path']}):")
+        lines.extend(f"   {line}" for line in report["slow_log"])
+    timings = report.get("render_timings")
+    if timings:
+        lines.append("🎨 Progressive rendering (last run per view):")
+        for name, entry in sorted(timings.items()):
+            if not entry["items"]:
+                lines.append(f"   {name}: no cards")
+                continue
+            lines.append(f"   {name}: first card {entry['time_to_first_ms']:.1f} ms, "
+                         f"last card {entry['time_to_last_ms']:.1f} ms "
+                         f"({entry['items']} cards, {entry['chunks']} chunks)")
+    return "\n".join(lines)
+
+
+def print_diagnostics(top: Optional[int] = 15) -> None:
+    print(format_diagnostics(collect_diagnostics(top)))
+
+
+def write_diagnostics(path: str) -> str:
+    """
+    Writes the full report, every traced statement included, as JSON. Statements
+    are recorded without their parameter values.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(collect_diagnostics(top=None), f, indent=2, default=str)
+    return path
+
+
+# Optional standalone run: python -m backend.services.diagnostics [--dump report.json]
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PetTrackr storage and query diagnostics")
+    parser.add_argument("--dump", metavar="PATH", help="also write the full report as JSON")
+    parser.add_argument("--top", type=int, default=15, help="statements to list")
+    args = parser.parse_args()
+    print_diagnostics(args.top)
+    if args.dump:
+        print(f"💾 Report written to {write_diagnostics(args.dump)}")
@@ -0,0 +1,113 @@
+# File: backend/services/event_bus.py
+import threading
+from typing import Callable, Dict, Iterable, List, Optional
+
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+# Entities published by the controllers: "pets", "owners" and the record types
+# of RECORD_TABLES ("vaccinations", "vet_visits", "feeding_logs", "grooming_logs")
+
+
+class ChangeEvent:
+    """
+    One committed write: what kind of row changed, how, and which rows.
+
+    ``pet_ids`` names the pets whose data changed (the pets themselves for pet
+    events, the owning pets for record events), so listeners can patch just
+    the cards of those pets. ``details`` carries extra context such as the
+    owner id or stored image path of a new pet.
+    """
+
+    def __init__(self, entity: str, action: str, ids: Iterable[int],
+                 pet_ids: Iterable[int] = (), details: Optional[dict] = None):
+        self.entity = entity
+        self.action = action
+        self.ids = tuple(i for i in ids if i is not None)
+        self.pet_ids = tuple(i for i in pet_ids if i is not None)
+        self.details = details or {}
+
+    def touches_pet(self, pet_id: int, owner_id: Optional[int] = None) -> bool:
+        """True if this change affects what is shown for the pet (or its owner)."""
+        if pet_id in self.pet_ids:
+            return True
+        return self.entity == "owners" and owner_id is not None and owner_id in self.ids
+
+    def __repr__(self):
+        return f"ChangeEvent({self.entity!r}, {self.action!r}, ids={self.ids}, pet_ids={self.pet_ids})"
+
+
+class EventBus:
+    """
+    In-process publish/subscribe for database changes.
+
+    Controllers publish after they commit; subscribers are called synchronously
+    on the publishing thread, so anything touching Tk widgets must hand the event
+    over to the main thread (see ``frontend/change_dispatcher.py``). A failing
+    subscriber is reported and does not stop the others.
+    """
+
+    def __init__(self):
+        self._subscribers: Dict[int, tuple] = {}
+        self._next_token = 0
+        self._lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None],
+                  entities: Optional[Iterable[str]] = None) -> Callable[[], None]:
+        """
+        Calls ``callback(event)`` for every change, or only for ``entities``.
+
+        Returns:
+            A function that removes the subscription.
+        """
+        entities = frozenset(entities) if entities is not None else None
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscribers[token] = (callback, entities)
+        return lambda: self.unsubscribe(token)
+
+    def unsubscribe(self, token: int) -> None:
+        with self._lock:
+            self._subscribers.pop(token, None)
+
+    def publish(self, entity: str, action: str, ids: Iterable[int],
+                pet_ids: Iterable[int] = (), details: Optional[dict] = None) -> ChangeEvent:
+        event = ChangeEvent(entity, action, ids, pet_ids, details)
+        with self._lock:
+            self.published += 1
+            subscribers = list(self._subscribers.values())
+        for callback, entities in subscribers:
+            if entities is not None and entity not in entities:
+                continue
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"⚠️ Change listener failed for {event}: {e}")
+        return event
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+
+event_bus = EventBus()
+
+
+def publish_change(entity: str, action: str, ids: Iterable[int],
+                   pet_ids: Iterable[int] = (), details: Optional[dict] = None) -> ChangeEvent:
+    """Shortcut for ``event_bus.publish(...)``."""
+    return event_bus.publish(entity, action, ids, pet_ids, details)
+
+
+def subscribe_changes(callback: Callable[[ChangeEvent], None],
+                      entities: Optional[Iterable[str]] = None) -> Callable[[], None]:
+    """Shortcut for ``event_bus.subscribe(...)``."""
+    return event_bus.subscribe(callback, entities)
+
+
+def pets_touched(events: List[ChangeEvent]) -> set:
+    """Ids of every pet whose data changed in ``events``."""
+    return {pet_id for event in events for pet_id in event.pet_ids}
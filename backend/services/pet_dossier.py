@@ -0,0 +1,160 @@
+# File: backend/services/pet_dossier.py
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+
+from backend.controllers.feeding_log_controller import FeedingLogController
+from backend.controllers.grooming_controller import GroomingLogsController
+from backend.controllers.vaccination_controller import VaccinationController
+from backend.controllers.vet_visit_controller import VetVisitController
+from backend.database_handlers.cross_db_query import CrossDatabaseQuery, PET_OWNER_SELECT, pet_and_owner_from_row
+from backend.database_handlers.query_utils import chunked
+from backend.models.pet import Pet, Owner
+from backend.models.vet_visit import VetVisit
+from backend.models.vaccination import Vaccination
+from backend.models.feeding_log import FeedingLog
+from backend.models.grooming_log import GroomingLog
+from backend.services.daycare_prices import compute_total_fee
+
+# Record list -> (query for one pet, model built from each row). Column order and
+# sorting match the per-pet queries of the handlers and GroomingLogsController.
+RECORD_QUERIES = {
+    "vet_visits": ("""
+        SELECT pet_id, visit_date, reason, notes, cost
+        FROM vet_visits WHERE pet_id = ? ORDER BY visit_date DESC
+    """, VetVisit),
+    "vaccinations": ("""
+        SELECT pet_id, vaccine_name, date_administered, next_due, price, notes
+        FROM vaccinations WHERE pet_id = ? ORDER BY date_administered DESC
+    """, Vaccination),
+    "feeding_logs": ("""
+        SELECT pet_id, start_date, num_days, feed_once, feed_twice, feed_thrice, notes
+        FROM daycare_enrollments WHERE pet_id = ?
+    """, FeedingLog),
+    "grooming_logs": ("""
+        SELECT id, pet_id, groom_date, groom_type, price, groomer_name, notes
+        FROM grooming_logs WHERE pet_id = ? ORDER BY groom_date DESC
+    """, GroomingLog),
+}
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=len(RECORD_QUERIES), thread_name_prefix="pet-dossier")
+    return _executor
+
+
+class PetDossier:
+    """
+    Everything the pet profile shows: the pet, its owner, the four record lists
+    and their totals.
+
+    Use ``PetDossier.load(pet_id)`` to read it from the databases,
+    ``PetDossier.load_many(pet_ids)`` for several pets at once, or build one
+    directly from records a view has already fetched.
+    """
+
+    def __init__(self, pet: Pet, owner: Optional[Owner] = None,
+                 vet_visits: Optional[List[VetVisit]] = None,
+                 vaccinations: Optional[List[Vaccination]] = None,
+                 feeding_logs: Optional[List[FeedingLog]] = None,
+                 grooming_logs: Optional[List[GroomingLog]] = None):
+        self.pet = pet
+        self.owner = owner
+        self.vet_visits = vet_visits or []
+        self.vaccinations = vaccinations or []
+        self.feeding_logs = feeding_logs or []
+        self.grooming_logs = grooming_logs or []
+        self.totals = self._compute_totals()
+
+    @classmethod
+    def load(cls, pet_id: int, concurrent: bool = False,
+             query: Optional[CrossDatabaseQuery] = None) -> Optional["PetDossier"]:
+        """
+        Loads a pet's dossier, or returns None if the pet does not exist.
+
+        By default all five queries run on this thread's pets connection with the
+        record databases ATTACHed. With ``concurrent=True`` the four record types are
+        fetched in parallel on a shared thread pool, each worker using its own pooled
+        connection.
+        """
+        query = query or CrossDatabaseQuery()
+        cursor = query.connect().cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute(PET_OWNER_SELECT + " WHERE p.id = ?", (pet_id,))
+        row = cursor.fetchone()
+        if not row:
+            return None
+        pet, owner = pet_and_owner_from_row(row)
+
+        if concurrent:
+            futures = {
+                name: _get_executor().submit(_fetch_records, query, name, pet_id)
+                for name in RECORD_QUERIES
+            }
+            records = {name: future.result() for name, future in futures.items()}
+        else:
+            records = {name: _fetch_records(query, name, pet_id) for name in RECORD_QUERIES}
+
+        return cls(pet, owner, **records)
+
+    @classmethod
+    def load_many(cls, pet_ids: Iterable[int],
+                  query: Optional[CrossDatabaseQuery] = None) -> Dict[int, Optional["PetDossier"]]:
+        """
+        Loads the dossiers of many pets with one query per table (per chunk of
+        ids) instead of five per pet.
+
+        Returns:
+            Dict mapping every requested pet ID to its dossier, or to None if the
+            pet does not exist.
+        """
+        pet_ids = list(dict.fromkeys(pet_ids))
+        query = query or CrossDatabaseQuery()
+        found = {}
+        for chunk in chunked(pet_ids):
+            placeholders = ", ".join("?" for _ in chunk)
+            pets, owners = query.pets_with_owners(f"p.id IN ({placeholders})", chunk)
+            found.update((pet.id, (pet, owner)) for pet, owner in zip(pets, owners))
+        if not found:
+            return {pet_id: None for pet_id in pet_ids}
+
+        ids = list(found)
+        records = {
+            "vet_visits": VetVisitController().get_by_pet_ids(ids),
+            "vaccinations": VaccinationController().get_by_pet_ids(ids),
+            "feeding_logs": FeedingLogController().get_by_pet_ids(ids),
+            "grooming_logs": GroomingLogsController().get_grooming_logs_for_pets(ids),
+        }
+        dossiers = {pet_id: None for pet_id in pet_ids}
+        for pet_id, (pet, owner) in found.items():
+            dossiers[pet_id] = cls(pet, owner, **{name: by_pet.get(pet_id, []) for name, by_pet in records.items()})
+        return dossiers
+
+    def _compute_totals(self) -> dict:
+        vet_visits = sum(visit.cost or 0 for visit in self.vet_visits)
+        vaccinations = sum(vax.price or 0 for vax in self.vaccinations)
+        feeding_logs = sum(
+            compute_total_fee(log.num_days or 0, log.feed_once, log.feed_twice, log.feed_thrice)
+            for log in self.feeding_logs
+        )
+        grooming_logs = sum(groom.price or 0 for groom in self.grooming_logs)
+        return {
+            "vet_visits": vet_visits,
+            "vaccinations": vaccinations,
+            "feeding_logs": feeding_logs,
+            "grooming_logs": grooming_logs,
+            "overall": vet_visits + vaccinations + feeding_logs + grooming_logs,
+            "record_count": (len(self.vet_visits) + len(self.vaccinations)
+                             + len(self.feeding_logs) + len(self.grooming_logs)),
+        }
+
+
+def _fetch_records(query: CrossDatabaseQuery, name: str, pet_id: int) -> list:
+    sql, model = RECORD_QUERIES[name]
+    cursor = query.connect().cursor()
+    cursor.execute(sql, (pet_id,))
+    return [model(*row) for row in cursor.fetchall()]
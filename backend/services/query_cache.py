@@ -0,0 +1,244 @@
+# File: backend/services/query_cache.py
+import functools
+import inspect
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, FrozenSet, Hashable, Iterable, Optional, Tuple
+
+from backend.data.storage_config import get_db_path
+from backend.database_handlers.connection_manager import is_uri
+from backend.database_handlers.cross_db_query import RECORD_TABLES
+from backend.services.event_bus import ChangeEvent, DELETE, subscribe_changes
+
+# Entity published on the event bus -> logical database holding it
+ENTITY_DATABASES = {"pets": "pets", "owners": "pets"}
+ENTITY_DATABASES.update({record_type: db for record_type, (db, _) in RECORD_TABLES.items()})
+
+# A tag says what a cached result was read from: (entity, pet id), or
+# (entity, None) when the result depends on every row of the entity
+Tag = Tuple[str, Optional[int]]
+
+
+class CacheEntry:
+    def __init__(self, value, tags: FrozenSet[Tag], expires_at: float):
+        self.value = value
+        self.tags = tags
+        self.expires_at = expires_at
+
+
+class QueryCache:
+    """
+    Read-through cache for controller query results, with a TTL and LRU eviction.
+
+    Entries are tagged with the entities (and pets) they were read from. Writes
+    made through the controllers arrive on the event bus and drop exactly the
+    entries whose tags they touch. Writes from other processes are detected
+    with ``PRAGMA data_version`` on a private connection per database file: when
+    it moves without a matching event, every entry read from that file is
+    dropped.
+
+    Cached values are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, max_entries: int = 512, ttl: float = 30.0, subscribe: bool = True):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._watchers: Dict[str, sqlite3.Connection] = {}
+        self._versions: Dict[str, int] = {}
+        # Bumped by every invalidation, so a load that raced with a write is not stored
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.external_invalidations = 0
+        self._unsubscribe = subscribe_changes(self.on_change) if subscribe else None
+
+    # Lookups
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], object], tags: Iterable[Tag]):
+        """Returns the cached result for ``key``, calling ``loader()`` on a miss."""
+        tags = frozenset(tags)
+        self._check_external_changes({entity for entity, _ in tags})
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            generation = self._generation
+
+        value = loader()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = CacheEntry(value, tags, time.monotonic() + self.ttl)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    # Invalidation
+
+    def on_change(self, event: ChangeEvent) -> None:
+        """Event-bus listener: drops the entries a committed write made stale."""
+        entities = {event.entity}
+        if event.entity == "pets" and event.action == DELETE:
+            # Deleting a pet cascades to its records
+            entities.update(ENTITY_DATABASES)
+        pet_ids = set(event.pet_ids)
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key for key, entry in self._entries.items()
+                if any(entity in entities and (pet_id is None or not pet_ids or pet_id in pet_ids)
+                       for entity, pet_id in entry.tags)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            # This write moved data_version; it must not count as an external change
+            for path in {self._db_path(entity) for entity in entities}:
+                if path in self._versions:
+                    self._versions[path] = self._read_version(path)
+
+    def invalidate_all(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def _check_external_changes(self, entities: Iterable[str]) -> None:
+        paths = {self._db_path(entity) for entity in entities}
+        with self._lock:
+            for path in paths:
+                version = self._read_version(path)
+                seen = self._versions.get(path)
+                self._versions[path] = version
+                if seen is None or seen == version:
+                    continue
+                stale = [
+                    key for key, entry in self._entries.items()
+                    if any(self._db_path(entity) == path for entity, _ in entry.tags)
+                ]
+                for key in stale:
+                    del self._entries[key]
+                self._generation += 1
+                self.external_invalidations += len(stale)
+
+    @staticmethod
+    def _db_path(entity: str) -> str:
+        return get_db_path(ENTITY_DATABASES[entity])
+
+    def _read_version(self, path: str) -> int:
+        conn = self._watchers.get(path)
+        if conn is None:
+            # Memory-mode URIs need uri=True wherever SQLite does not parse URIs by default
+            conn = sqlite3.connect(path, check_same_thread=False, uri=is_uri(path))
+            self._watchers[path] = conn
+        return conn.execute("PRAGMA data_version").fetchone()[0]
+
+    # Housekeeping
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "external_invalidations": self.external_invalidations,
+            }
+
+    def close(self) -> None:
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+        with self._lock:
+            self._entries.clear()
+            for conn in self._watchers.values():
+                conn.close()
+            self._watchers.clear()
+            self._versions.clear()
+
+
+_query_cache: Optional[QueryCache] = None
+
+
+def enable_query_cache(**kwargs) -> QueryCache:
+    """Turns on result caching for every controller in this process."""
+    global _query_cache
+    if _query_cache is None:
+        _query_cache = QueryCache(**kwargs)
+    return _query_cache
+
+
+def disable_query_cache() -> None:
+    global _query_cache
+    if _query_cache is not None:
+        _query_cache.close()
+        _query_cache = None
+
+
+def get_query_cache() -> Optional[QueryCache]:
+    """The process-wide cache, or None while caching is off (the default)."""
+    return _query_cache
+
+
+def _freeze(value):
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    return value
+
+
+def cached_query(*entities: str, pet_arg: Optional[str] = None):
+    """
+    Caches a controller read method in the process-wide QueryCache, if enabled.
+
+    Args:
+        entities: Entities the result is read from.
+        pet_arg: Name of the argument holding the pet id (or list of pet ids) the
+            result is limited to; writes to other pets then leave it cached.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            cache = get_query_cache()
+            if cache is None:
+                return method(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            arguments.pop("self", None)
+            key = (type(self).__name__, method.__name__, getattr(self, "db_path", None), _freeze(arguments))
+            if pet_arg is not None:
+                pet_ids = arguments[pet_arg]
+                pet_ids = pet_ids if isinstance(pet_ids, (list, tuple, set, frozenset)) else [pet_ids]
+                tags = [(entity, pet_id) for entity in entities for pet_id in pet_ids]
+            else:
+                tags = [(entity, None) for entity in entities]
+            return cache.get_or_load(key, lambda: method(self, *args, **kwargs), tags)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,98 @@
+# File: backend/services/thumbnail_service.py
+import hashlib
+import os
+import threading
+from typing import Optional, Tuple
+
+from PIL import Image
+
+THUMBS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'thumbs'))
+
+
+class ThumbnailService:
+    """
+    Stores fixed-size copies of pet photos so cards never decode the original.
+
+    A thumbnail's file name combines a hash of the source path with a hash of its
+    modification time and byte size, so replacing a photo produces a new name and
+    the stale derivative is deleted the next time it is requested.
+    """
+
+    def __init__(self, thumbs_dir: str = THUMBS_DIR):
+        self.thumbs_dir = thumbs_dir
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _source_key(source_path: str) -> str:
+        return hashlib.sha1(os.path.normcase(os.path.abspath(source_path)).encode("utf-8")).hexdigest()[:16]
+
+    def thumbnail_path(self, source_path: str, size: Tuple[int, int]) -> Optional[str]:
+        """
+        Returns the path of the ``size`` thumbnail for ``source_path``, generating it
+        if it is missing or out of date. Returns None if the source does not exist.
+        """
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+
+        width, height = size
+        source_key = self._source_key(source_path)
+        version = hashlib.sha1(f"{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8")).hexdigest()[:10]
+        path = os.path.join(self.thumbs_dir, f"{source_key}_{version}_{width}x{height}.png")
+        if os.path.exists(path):
+            return path
+
+        with self._lock:
+            if os.path.exists(path):
+                return path
+            os.makedirs(self.thumbs_dir, exist_ok=True)
+            self._remove_stale(source_key, version, size)
+            with Image.open(source_path) as original:
+                thumb = original.convert("RGBA" if original.mode in ("RGBA", "LA", "P") else "RGB").resize(size)
+            # Write under a temporary name so readers never see a partial file
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            thumb.save(tmp_path, format="PNG")
+            os.replace(tmp_path, path)
+        return path
+
+    def load(self, source_path: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+        """Opens the thumbnail for ``source_path`` as a loaded PIL image, or None."""
+        path = self.thumbnail_path(source_path, size)
+        if path is None:
+            return None
+        with Image.open(path) as image:
+            image.load()
+            return image.copy()
+
+    def _remove_stale(self, source_key: str, version: str, size: Tuple[int, int]) -> None:
+        suffix = f"_{size[0]}x{size[1]}.png"
+        for name in os.listdir(self.thumbs_dir):
+            if name.startswith(source_key + "_") and name.endswith(suffix) and f"_{version}_" not in name:
+                try:
+                    os.remove(os.path.join(self.thumbs_dir, name))
+                except OSError:
+                    pass
+
+    def invalidate(self, source_path: str) -> int:
+        """Deletes every thumbnail of ``source_path``; returns how many were removed."""
+        if not os.path.isdir(self.thumbs_dir):
+            return 0
+        prefix = self._source_key(source_path) + "_"
+        removed = 0
+        for name in os.listdir(self.thumbs_dir):
+            if name.startswith(prefix):
+                try:
+                    os.remove(os.path.join(self.thumbs_dir, name))
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+
+thumbnail_service = ThumbnailService()
+
+
+def load_thumbnail(source_path: str, size: Tuple[int, int]) -> Optional[Image.Image]:
+    """Shortcut for ``thumbnail_service.load(source_path, size)``."""
+    return thumbnail_service.load(source_path, size)
@@ -0,0 +1,230 @@
+# File: backend/services/unit_of_work.py
+import os
+import shutil
+from typing import Dict, List, Optional, Union
+
+from backend.models.pet import Pet, Owner
+from backend.models.vet_visit import VetVisit
+from backend.models.vaccination import Vaccination
+from backend.models.feeding_log import FeedingLog
+from backend.database_handlers.cross_db_query import CrossDatabaseQuery
+from backend.database_handlers.write_retry import run_write
+from backend.database_handlers.vet_visits_db_handler import VetVisitDB
+from backend.database_handlers.vaccinations_db_handler import VaccinationDB
+from backend.database_handlers.feeding_logs_db_handler import FeedingLogDB
+from backend.controllers.grooming_controller import GroomingLogsController
+from backend.services.thumbnail_service import thumbnail_service
+from backend.services.event_bus import publish_change, INSERT, UPDATE
+
+# Record type -> (model built from each staged dict, handler providing the INSERT)
+RECORD_WRITERS = {
+    "vet_visits": (VetVisit, VetVisitDB),
+    "vaccinations": (Vaccination, VaccinationDB),
+    "feeding_logs": (FeedingLog, FeedingLogDB),
+}
+
+
+class StagedPet:
+    """A pet waiting in a UnitOfWork. ``id`` is set once the work is committed."""
+
+    def __init__(self, pet: Pet, owner: Owner, image_path: Optional[str] = None):
+        self.pet = pet
+        self.owner = owner
+        self.image_path = image_path
+        self.id: Optional[int] = None
+        self.owner_id: Optional[int] = None
+        self.stored_image_path: Optional[str] = None
+
+
+class UnitOfWork:
+    """
+    Stages a save (new pets, their owners, records of every type and photos) and
+    writes it in one transaction.
+
+    The transaction runs on the pets connection with the record databases
+    ATTACHed, so either every row is written or none is. Photos are copied into
+    place during the transaction and removed again (restoring any file they
+    replaced) if it rolls back. In the single-file layout the save costs one
+    commit. In the split layout SQLite commits the files together through a
+    super-journal under the default "durable" storage profile; with WAL
+    ("balanced", "fast") each file commits atomically but a crash mid-commit can
+    leave the files out of step.
+
+    Foreign keys cannot reference tables in another file, so in the split layout
+    they are switched off for the transaction; the records only reference pets
+    staged in the same unit of work or ids the caller passes in.
+    """
+
+    def __init__(self, pet_controller, query: Optional[CrossDatabaseQuery] = None):
+        """
+        Args:
+            pet_controller: The PetController whose owner/pet/image helpers write the pets.
+            query: Supplies the connection with the record databases attached.
+        """
+        self.pet_controller = pet_controller
+        self.query = query or CrossDatabaseQuery(pets_db_path=pet_controller.db_path)
+        self._pets: List[StagedPet] = []
+        self._records: Dict[str, List[tuple]] = {}
+        self._placed_images: List[tuple] = []
+        self._inserted: Dict[str, List[tuple]] = {}
+        self.committed = False
+
+    # Staging
+
+    def add_pet(self, pet: Pet, owner: Owner, image_path: Optional[str] = None) -> StagedPet:
+        """Stages a new pet, the upsert of its owner and an optional photo to copy."""
+        staged = StagedPet(pet, owner, image_path)
+        self._pets.append(staged)
+        return staged
+
+    def add_records(self, record_type: str, records: List[dict], pet: Union[StagedPet, int]) -> None:
+        """
+        Stages records for a staged pet or an existing pet id.
+
+        Args:
+            record_type: "vet_visits", "vaccinations", "feeding_logs" or "grooming_logs".
+            records: Model fields without ``pet_id`` (grooming logs take the
+                ``add_grooming_log`` arguments).
+            pet: The StagedPet returned by ``add_pet``, or the id of a saved pet.
+        """
+        if record_type not in RECORD_WRITERS and record_type != "grooming_logs":
+            raise ValueError(f"Unknown record type: {record_type!r}")
+        self._records.setdefault(record_type, []).extend((pet, record) for record in records)
+
+    # Commit
+
+    def commit(self) -> List[int]:
+        """
+        Writes everything staged and returns the new pet ids.
+
+        The transaction takes the write lock up front and is retried with
+        backoff while another workstation holds it.
+
+        Raises:
+            sqlite3.Error, OSError: After the transaction was rolled back and the
+                copied photos removed.
+        """
+        if self.committed:
+            raise RuntimeError("Unit of work already committed")
+        conn = self.query.connect()
+        split_layout = bool(self.query.attachments())
+        if split_layout:
+            # Must be set outside a transaction
+            conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            run_write(conn, self.apply)
+        except BaseException:
+            self.undo()
+            raise
+        finally:
+            if split_layout:
+                conn.execute("PRAGMA foreign_keys = ON")
+        return self.finish()
+
+    # Steps of a commit, also driven by the write queue to share one transaction
+
+    def apply(self, cursor) -> List[int]:
+        """Writes everything staged inside the caller's transaction; returns the new pet ids."""
+        if self.committed:
+            raise RuntimeError("Unit of work already committed")
+        # A retry after a lock timeout starts from a clean slate
+        self.undo()
+        for staged in self._pets:
+            self._write_pet(cursor, staged)
+        self._inserted = {
+            record_type: self._write_records(cursor, record_type, entries)
+            for record_type, entries in self._records.items()
+        }
+        return [staged.id for staged in self._pets]
+
+    def undo(self) -> None:
+        """Reverts ``apply`` outside the database after its transaction rolled back."""
+        self._remove_placed_images()
+        self._inserted = {}
+        for staged in self._pets:
+            staged.id = staged.owner_id = staged.stored_image_path = None
+
+    def finish(self) -> List[int]:
+        """Completes ``apply`` once its transaction committed: drops backups, publishes events."""
+        self.committed = True
+        self._discard_backups()
+        self._publish(self._inserted)
+        return [staged.id for staged in self._pets]
+
+    def _write_pet(self, cursor, staged: StagedPet) -> None:
+        controller = self.pet_controller
+        staged.owner_id = controller._upsert_owner(cursor, staged.owner)
+        staged.id = controller._insert_pet(cursor, staged.pet, staged.owner_id)
+        if staged.image_path:
+            dest_path = controller._image_destination(staged.pet, staged.id, staged.image_path)
+            self._place_image(staged.image_path, dest_path)
+            staged.stored_image_path = os.path.relpath(dest_path, start=controller.data_dir)
+            controller._update_pet_image(cursor, staged.id, staged.stored_image_path)
+
+    @staticmethod
+    def _pet_id(pet: Union[StagedPet, int]) -> int:
+        return pet.id if isinstance(pet, StagedPet) else pet
+
+    def _write_records(self, cursor, record_type: str, entries: List[tuple]) -> List[tuple]:
+        """Inserts one record type with a single executemany; returns (record id, pet id) pairs."""
+        if record_type == "grooming_logs":
+            sql = GroomingLogsController.INSERT_SQL
+            params = [GroomingLogsController.insert_params(dict(record, pet_id=self._pet_id(pet)))
+                      for pet, record in entries]
+        else:
+            model, handler = RECORD_WRITERS[record_type]
+            sql = handler.INSERT_SQL
+            params = [handler.insert_params(model(**dict(record, pet_id=self._pet_id(pet))))
+                      for pet, record in entries]
+        if not params:
+            return []
+        cursor.executemany(sql, params)
+        last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+        first_id = last_id - len(params) + 1
+        return [(first_id + i, self._pet_id(pet)) for i, (pet, _) in enumerate(entries)]
+
+    # Photos
+
+    def _place_image(self, src_path: str, dest_path: str) -> None:
+        backup_path = None
+        if os.path.exists(dest_path):
+            backup_path = dest_path + ".bak"
+            os.replace(dest_path, backup_path)
+        # Recorded before copying so a failed copy still restores the backup
+        self._placed_images.append((dest_path, backup_path))
+        shutil.copy2(src_path, dest_path)
+
+    def _remove_placed_images(self) -> None:
+        for dest_path, backup_path in reversed(self._placed_images):
+            try:
+                if os.path.exists(dest_path):
+                    os.remove(dest_path)
+                if backup_path:
+                    os.replace(backup_path, dest_path)
+            except OSError as e:
+                print(f"⚠️ Could not roll back image {dest_path}: {e}")
+        self._placed_images = []
+
+    def _discard_backups(self) -> None:
+        for dest_path, backup_path in self._placed_images:
+            if backup_path and os.path.exists(backup_path):
+                os.remove(backup_path)
+            # copy2 keeps the source mtime, so drop cached thumbnails explicitly
+            thumbnail_service.invalidate(dest_path)
+        self._placed_images = []
+
+    # Notifications
+
+    def _publish(self, inserted: Dict[str, List[tuple]]) -> None:
+        for staged in self._pets:
+            # The upsert may have created the owner or refreshed an existing one
+            publish_change("owners", UPDATE, [staged.owner_id])
+            publish_change("pets", INSERT, [staged.id], pet_ids=[staged.id], details={
+                "owner_id": staged.owner_id,
+                "image_path": os.path.join(self.pet_controller.data_dir, staged.stored_image_path)
+                if staged.stored_image_path else None,
+            })
+        for record_type, rows in inserted.items():
+            if rows:
+                publish_change(record_type, INSERT, [record_id for record_id, _ in rows],
+                               pet_ids={pet_id for _, pet_id in rows})
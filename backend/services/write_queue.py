@@ -0,0 +1,199 @@
+# File: backend/services/write_queue.py
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from backend.database_handlers.connection_manager import connection_manager
+from backend.database_handlers.cross_db_query import CrossDatabaseQuery
+from backend.database_handlers.write_retry import is_lock_error, run_write
+
+# Put on the queue by close() to stop the writer once everything before it is written
+_STOP = object()
+
+
+class WriteQueue:
+    """
+    Write-behind queue: one writer thread commits the work other threads submit.
+
+    Commands are objects with ``apply(cursor)``, ``undo()`` and ``finish()``, the
+    steps of a ``UnitOfWork`` commit (pets with their owners, records and photos).
+    The writer waits ``coalesce_window`` seconds after the first command for
+    more to arrive and writes up to ``max_batch`` of them in one transaction,
+    each inside its own SAVEPOINT: a command that fails is rolled back alone
+    and the rest of the batch still commits.
+
+    ``submit`` returns a ``concurrent.futures.Future`` resolved with the result
+    of ``finish()`` (a UnitOfWork's new pet ids) or the command's exception. The
+    queue is bounded; ``submit`` waits up to ``submit_timeout`` for room.
+    """
+
+    def __init__(self, query: Optional[CrossDatabaseQuery] = None, max_pending: int = 256,
+                 max_batch: int = 32, coalesce_window: float = 0.05, submit_timeout: float = 5.0):
+        self.query = query
+        self.max_batch = max_batch
+        self.coalesce_window = coalesce_window
+        self.submit_timeout = submit_timeout
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+        self._closed = False
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.commands = 0
+        self.failures = 0
+        self._thread = threading.Thread(target=self._run, name="pettrackr-writer", daemon=True)
+        self._thread.start()
+
+    # Submitting
+
+    def submit(self, command) -> Future:
+        """
+        Queues ``command`` for the writer thread.
+
+        Raises:
+            RuntimeError: If the queue is closed, or still full after ``submit_timeout``.
+        """
+        future: Future = Future()
+        # Checked and queued under one lock, so no command can land behind the
+        # _STOP close() queues, where the writer would never pick it up
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Write queue is closed")
+            try:
+                self._queue.put((command, future), timeout=self.submit_timeout)
+            except queue.Full:
+                raise RuntimeError("Too many unsaved changes are waiting; try again in a moment") from None
+        return future
+
+    def flush(self) -> None:
+        """Blocks until every command submitted so far is written (or failed)."""
+        self._queue.join()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Refuses new commands, writes the queued ones and stops the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._queue.qsize(),
+            "batches": self.batches,
+            "commands": self.commands,
+            "failures": self.failures,
+        }
+
+    # Writer thread
+
+    def _run(self) -> None:
+        try:
+            while True:
+                batch, stop = self._next_batch()
+                if batch:
+                    self._write_batch(batch)
+                for _ in range(len(batch) + stop):
+                    self._queue.task_done()
+                if stop:
+                    return
+        finally:
+            connection_manager.close_thread_connections()
+
+    def _next_batch(self) -> Tuple[List[tuple], bool]:
+        """Waits for a command, then gathers whatever follows within the coalescing window."""
+        item = self._queue.get()
+        if item is _STOP:
+            return [], True
+        batch = [item]
+        deadline = time.monotonic() + self.coalesce_window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _write_batch(self, batch: List[tuple]) -> None:
+        # Cancelled futures (the caller went away) are not written
+        batch = [(command, future) for command, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        query = self.query or CrossDatabaseQuery()
+        conn = query.connect()
+        split_layout = bool(query.attachments())
+        errors = {}
+
+        def write(cursor):
+            errors.clear()
+            for index, (command, _) in enumerate(batch):
+                cursor.execute("SAVEPOINT write_command")
+                try:
+                    command.apply(cursor)
+                except Exception as e:
+                    if is_lock_error(e):
+                        # Retry the whole batch
+                        raise
+                    cursor.execute("ROLLBACK TO write_command")
+                    command.undo()
+                    errors[index] = e
+                cursor.execute("RELEASE write_command")
+
+        if split_layout:
+            # Foreign keys cannot reach across the attached files (see UnitOfWork)
+            conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            run_write(conn, write)
+        except Exception as e:
+            for command, future in batch:
+                command.undo()
+                future.set_exception(e)
+            self.failures += len(batch)
+            return
+        finally:
+            if split_layout:
+                conn.execute("PRAGMA foreign_keys = ON")
+            self.batches += 1
+            self.commands += len(batch)
+
+        for index, (command, future) in enumerate(batch):
+            if index in errors:
+                self.failures += 1
+                future.set_exception(errors[index])
+                continue
+            try:
+                future.set_result(command.finish())
+            except Exception as e:
+                future.set_exception(e)
+
+
+_write_queue: Optional[WriteQueue] = None
+_write_queue_lock = threading.Lock()
+
+
+def get_write_queue() -> WriteQueue:
+    """The process-wide queue, started on first use."""
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is None:
+            _write_queue = WriteQueue()
+        return _write_queue
+
+
+def submit_write(command) -> Future:
+    """Shortcut for ``get_write_queue().submit(command)``."""
+    return get_write_queue().submit(command)
+
+
+def close_write_queue(timeout: Optional[float] = None) -> None:
+    """Shutdown hook: writes everything still queued, then stops the writer thread."""
+    global _write_queue
+    with _write_queue_lock:
+        write_queue, _write_queue = _write_queue, None
+    if write_queue is not None:
+        write_queue.close(timeout)
@@ -0,0 +1,155 @@
+# File: benchmarks/backend_benchmark.py
+#   python -m benchmarks.backend_benchmark --volume medium --output bench.json --baseline benchmarks/baseline_backend.json
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+from benchmarks.bench_utils import add_common_arguments, environment, finish_run, measure
+from benchmarks.synthetic_data import VOLUMES, SyntheticDataset
+from backend.data import storage_config
+from backend.database_handlers.query_trace import configure_tracing
+from backend.services.query_cache import disable_query_cache
+
+
+def _save_units(controller, first: int, count: int) -> None:
+    """``AddPetView.save_pet`` without the form: a pet, a new owner and a typical set of records."""
+    for i in range(first, first + count):
+        _stage_save(controller.unit_of_work(), i).commit()
+
+
+def _stage_save(unit, i: int):
+    from backend.models.pet import Pet, Owner
+    staged = unit.add_pet(Pet(0, f"Bench {i}", "Aspin", "2020-05-01"),
+                          Owner(0, f"Bench Owner {i}", f"08{i:09d}", "Benchmark Rd."))
+    unit.add_records("vet_visits", [{"visit_date": "2024-01-10", "reason": "Checkup", "cost": 500.0},
+                                    {"visit_date": "2024-02-10", "reason": "Other", "cost": 300.0}], staged)
+    unit.add_records("vaccinations", [{"vaccine_name": "Rabies", "date_administered": "2024-01-10",
+                                       "next_due": "2025-01-10"}], staged)
+    unit.add_records("feeding_logs", [{"start_date": "2024-03-01", "num_days": 3, "feed_twice": True}], staged)
+    unit.add_records("grooming_logs", [{"groom_type": "basic", "groomer_name": "Liza"}], staged)
+    return unit
+
+
+def run_benchmarks(dataset: SyntheticDataset, repeat: int = 5, sample_size: int = 200, saves: int = 50) -> dict:
+    """Times the key read, export/import and write paths against ``dataset``."""
+    # Imported here so every handler picks up the dataset's storage configuration
+    from backend.controllers.pet_controller import PetController
+    from backend.controllers.vaccination_controller import VaccinationController
+    from backend.controllers.vet_visit_controller import VetVisitController
+    from backend.controllers.feeding_log_controller import FeedingLogController
+    from backend.controllers.grooming_controller import GroomingLogsController
+    from backend.services.pet_dossier import PetDossier
+    from backend.services.data_export import export_pets_to_txt_from_db
+    from backend.services.data_import import import_pets_from_txt
+    from backend.services.write_queue import WriteQueue
+
+    pets = PetController()
+    results = {}
+
+    # Whole-list reads behind the tabs
+    for name in ("get_pets_with_owners", "get_pets_with_vacc_or_vet_records",
+                 "get_pets_with_vacc_and_vet_records", "get_pets_with_feeding_logs",
+                 "get_pets_with_grooming_logs"):
+        results[name] = measure(getattr(pets, name), repeat)
+
+    # Streaming and keyset pages, the last one as deep into the list as it gets
+    results["iter_pets_with_owners"] = measure(lambda: sum(1 for _ in pets.iter_pets_with_owners()), repeat)
+    last_id = dataset.pets - 50
+    for sort in ("id", "name"):
+        results[f"page_pets.{sort}.first"] = measure(lambda: pets.page_pets(None, 50, sort), repeat)
+        results[f"page_pets.{sort}.deep"] = measure(lambda: pets.page_pets(last_id, 50, sort), repeat)
+        # A scrollbar jump to the end of the list
+        results[f"page_pets_at.{sort}.deep"] = measure(lambda: pets.page_pets_at(dataset.pets - 50, 50, sort),
+                                                       repeat)
+
+    # Per-pet record fetches for a fixed sample of pets
+    sample = random.Random(dataset.seed).sample(range(1, dataset.pets + 1), min(sample_size, dataset.pets))
+    grooming = GroomingLogsController()
+    per_pet = {
+        "vaccinations": VaccinationController().get_by_pet_id,
+        "vet_visits": VetVisitController().get_by_pet_id,
+        "feeding_logs": FeedingLogController().get_by_pet_id,
+        "grooming_logs": grooming.get_grooming_logs_for_pet,
+        "dossier": PetDossier.load,
+    }
+    for name, fetch in per_pet.items():
+        results[f"per_pet.{name}"] = dict(measure(lambda: [fetch(pet_id) for pet_id in sample], repeat),
+                                          pets=len(sample))
+    results["batch.vaccinations_by_pet_ids"] = dict(
+        measure(lambda: VaccinationController().get_by_pet_ids(sample), repeat), pets=len(sample))
+
+    # Export/import of the pets table, before the writes below grow it
+    export_path = os.path.join(dataset.data_dir, "pets_export.txt")
+    with contextlib.redirect_stdout(io.StringIO()):
+        results["export_pets_txt"] = measure(
+            lambda: export_pets_to_txt_from_db(db_path=dataset.config.db_path("pets"), output_path=export_path), repeat)
+    results["import_pets_txt"] = measure(lambda: import_pets_from_txt(export_path), repeat)
+
+    # Saves, one transaction each and batched through the write-behind queue
+    counter = iter(range(1, 10 ** 9, saves))
+    results["save_pet"] = dict(measure(lambda: _save_units(pets, next(counter), saves), repeat), saves=saves)
+
+    def queued_saves():
+        write_queue = WriteQueue()
+        first = next(counter)
+        futures = [write_queue.submit(_stage_save(pets.unit_of_work(), i)) for i in range(first, first + saves)]
+        write_queue.close()
+        for future in futures:
+            future.result()
+
+    results["save_pet.write_queue"] = dict(measure(queued_saves, repeat), saves=saves)
+    return results
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="PetTrackr backend benchmarks on synthetic data")
+    parser.add_argument("--volume", choices=sorted(VOLUMES), default="small", help="dataset size preset")
+    parser.add_argument("--owners", type=int, help="override the preset's owner count")
+    parser.add_argument("--pets", type=int, help="override the preset's pet count")
+    parser.add_argument("--records", type=int, help="override the preset's record count")
+    parser.add_argument("--layout", choices=[storage_config.LAYOUT_SPLIT, storage_config.LAYOUT_SINGLE],
+                        default=storage_config.LAYOUT_SPLIT)
+    parser.add_argument("--profile", choices=sorted(storage_config.STORAGE_PROFILES),
+                        default=storage_config.DEFAULT_PROFILE)
+    parser.add_argument("--mode", choices=[storage_config.MODE_DISK, storage_config.MODE_MEMORY],
+                        default=storage_config.MODE_DISK, help="databases on disk or in shared-cache memory")
+    parser.add_argument("--sample", type=int, default=200, help="pets used for the per-pet fetches")
+    parser.add_argument("--saves", type=int, default=50, help="saves per timed write run")
+    parser.add_argument("--trace", action="store_true", help="measure with query tracing on")
+    add_common_arguments(parser)
+    args = parser.parse_args(argv)
+
+    owners, pets, records = VOLUMES[args.volume]
+    dataset = SyntheticDataset(args.owners or owners, args.pets or pets, args.records or records,
+                               seed=args.seed, layout=args.layout, profile=args.profile, mode=args.mode)
+    disable_query_cache()
+    configure_tracing(enabled=args.trace, slow_log_path=None)
+
+    print(f"🧪 Generating {dataset.owners} owners, {dataset.pets} pets, {dataset.records} records "
+          f"(seed {dataset.seed}, {dataset.layout}/{dataset.profile}/{dataset.mode})...")
+    started = time.perf_counter()
+    dataset.create()
+    try:
+        report = {
+            "benchmark": "backend",
+            "dataset": dataset.describe(),
+            "db_size_bytes": dataset.size_bytes(),
+            "generate_seconds": round(time.perf_counter() - started, 2),
+            "environment": environment(),
+            "query_tracing": args.trace,
+            "results": run_benchmarks(dataset, args.repeat, args.sample, args.saves),
+        }
+    finally:
+        dataset.cleanup()
+
+    for name, result in report["results"].items():
+        print(f"   {name:<40} median {result['median_ms']:>10.2f} ms   min {result['min_ms']:>10.2f} ms")
+    return finish_run(report, args.output, args.baseline, args.save_baseline, args.tolerance)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,138 @@
+# File: benchmarks/bench_utils.py
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import time
+from typing import Callable, Dict, List, Optional
+
+# A result slower than baseline * (1 + tolerance) is a regression, unless the
+# difference is below the noise floor. The fastest run is compared by default:
+# it moves far less than the median when the machine is busy.
+DEFAULT_TOLERANCE = 0.25
+NOISE_FLOOR_MS = 2.0
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, warmup: int = 1, setup: Optional[Callable] = None) -> dict:
+    """
+    Times ``fn()`` ``repeat`` times after ``warmup`` untimed calls. ``setup()``
+    runs untimed before every call.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+    samples: List[float] = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def summarize(samples_ms: List[float]) -> dict:
+    return {
+        "runs": len(samples_ms),
+        "min_ms": round(min(samples_ms), 3),
+        "median_ms": round(statistics.median(samples_ms), 3),
+        "mean_ms": round(statistics.fmean(samples_ms), 3),
+        "max_ms": round(max(samples_ms), 3),
+    }
+
+
+def environment() -> dict:
+    """Where the numbers were taken; baselines only compare well on the same machine."""
+    return {
+        "python": platform.python_version(),
+        "sqlite": sqlite3.sqlite_version,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def compare_to_baseline(results: Dict[str, dict], baseline: Dict[str, dict], metric: str = "min_ms",
+                        tolerance: float = DEFAULT_TOLERANCE, noise_floor: float = NOISE_FLOOR_MS) -> List[dict]:
+    """
+    Compares ``metric`` of every result present in both runs.
+
+    Returns one entry per compared result with its ratio to the baseline and
+    whether it counts as a regression.
+    """
+    comparison = []
+    for name, result in results.items():
+        if name not in baseline or metric not in result or metric not in baseline[name]:
+            continue
+        current, previous = result[metric], baseline[name][metric]
+        ratio = current / previous if previous else float("inf")
+        comparison.append({
+            "name": name,
+            "baseline": previous,
+            "current": current,
+            "ratio": round(ratio, 3),
+            "regression": current > previous * (1 + tolerance) and current - previous > noise_floor,
+        })
+    return comparison
+
+
+def print_comparison(comparison: List[dict], metric: str = "min_ms") -> None:
+    for entry in comparison:
+        mark = "❌" if entry["regression"] else "✅"
+        print(f"{mark} {entry['name']}: {entry['current']:.2f} vs {entry['baseline']:.2f} "
+              f"({metric}, {entry['ratio']:.2f}x)")
+
+
+def load_json(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_json(data: dict, path: str) -> str:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    return path
+
+
+def finish_run(report: dict, output: Optional[str], baseline_path: Optional[str], save_baseline: bool,
+               tolerance: float, metric: str = "min_ms") -> int:
+    """
+    Writes the report, compares it with the baseline and returns the exit code:
+    1 when something regressed, 0 otherwise.
+    """
+    if output:
+        print(f"💾 Results written to {save_json(report, output)}")
+    if baseline_path and save_baseline:
+        print(f"📌 Baseline saved to {save_json(report, baseline_path)}")
+        return 0
+    if not baseline_path or not os.path.exists(baseline_path):
+        if baseline_path:
+            print(f"ℹ️ No baseline at {baseline_path}; run with --save-baseline to record one")
+        return 0
+    baseline = load_json(baseline_path)
+    if baseline.get("dataset") != report.get("dataset"):
+        print("⚠️ Baseline was recorded with a different dataset; the comparison may not be meaningful")
+    comparison = compare_to_baseline(report["results"], baseline["results"], metric, tolerance)
+    print_comparison(comparison, metric)
+    regressions = [entry["name"] for entry in comparison if entry["regression"]]
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    print("✅ No regressions")
+    return 0
+
+
+def add_common_arguments(parser) -> None:
+    parser.add_argument("--seed", type=int, default=42, help="synthetic data seed")
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed slowdown before a result counts as a regression (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs per measurement")
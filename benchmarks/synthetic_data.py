@@ -0,0 +1,182 @@
+# File: benchmarks/synthetic_data.py
+import datetime
+import os
+import random
+import shutil
+import tempfile
+from typing import Dict, Optional
+
+from backend.data import storage_config
+from backend.data.memory_store import stop_memory_store
+from backend.data.migrations import initialize_databases
+from backend.database_handlers.connection_manager import close_all_connections, get_connection
+from backend.database_handlers.query_utils import insert_many
+from backend.database_handlers.vaccinations_db_handler import VaccinationDB
+from backend.database_handlers.vet_visits_db_handler import VetVisitDB
+from backend.database_handlers.feeding_logs_db_handler import FeedingLogDB
+from backend.controllers.grooming_controller import GroomingLogsController
+from backend.models.vaccination import Vaccination
+
+# Named dataset sizes: (owners, pets, records of all four types together)
+VOLUMES = {
+    "tiny": (20, 100, 1_000),
+    "small": (200, 1_000, 20_000),
+    "medium": (2_000, 10_000, 200_000),
+    "large": (10_000, 50_000, 1_000_000),
+}
+
+# Share of the records going to each record type
+RECORD_MIX = {"vaccinations": 0.3, "vet_visits": 0.3, "feeding_logs": 0.2, "grooming_logs": 0.2}
+
+FIRST_NAMES = ["Ana", "Ben", "Carla", "Dante", "Elena", "Felix", "Gina", "Hugo", "Iris", "Jose",
+               "Kara", "Leo", "Mika", "Nina", "Oscar", "Pia", "Quinn", "Rosa", "Sam", "Tala"]
+LAST_NAMES = ["Santos", "Reyes", "Cruz", "Bautista", "Garcia", "Mendoza", "Torres", "Flores",
+              "Villanueva", "Ramos", "Aquino", "Castro", "Rivera", "Navarro", "Dela Cruz"]
+PET_NAMES = ["Bantay", "Brownie", "Choco", "Max", "Luna", "Bella", "Coco", "Milo", "Rocky", "Daisy",
+             "Mochi", "Tiger", "Snow", "Buddy", "Lucky", "Princess", "Oreo", "Peanut", "Shadow", "Kitkat"]
+BREEDS = ["Aspin", "Puspin", "Shih Tzu", "Labrador", "Poodle", "Beagle", "Persian", "Siamese",
+          "Golden Retriever", "Chihuahua", ""]
+VET_REASONS = ["Checkup", "Vaccination", "Dental Cleaning", "Injury Treatment", "Surgery",
+               "Skin Problem", "Eye/Ear Issue", "Digestive Issue", "Post-Op Follow-up", "Other"]
+GROOM_TYPES = list(GroomingLogsController.PRICE_MAP)
+GROOMERS = ["Liza", "Mark", "Joy", "Paolo"]
+
+# Rows per executemany, so a million records never sit in memory at once
+CHUNK_SIZE = 50_000
+
+
+class SyntheticDataset:
+    """
+    Fills a temporary data directory with seeded, reproducible fake data and
+    points the storage configuration at it.
+
+    The same seed and volumes always produce the same rows, so timings of two
+    runs (or two commits) are comparable. Use as a context manager, or call
+    ``create()`` and ``cleanup()``.
+    """
+
+    def __init__(self, owners: int, pets: int, records: int, seed: int = 42,
+                 layout: str = storage_config.LAYOUT_SPLIT, profile: str = storage_config.DEFAULT_PROFILE,
+                 data_dir: Optional[str] = None, mode: str = storage_config.MODE_DISK):
+        if owners < 1 or pets < owners:
+            raise ValueError("Need at least one owner and no fewer pets than owners")
+        self.owners = owners
+        self.pets = pets
+        self.records = records
+        self.seed = seed
+        self.layout = layout
+        self.profile = profile
+        self.mode = mode
+        self._own_dir = data_dir is None
+        self.data_dir = data_dir or tempfile.mkdtemp(prefix="pettrackr-bench-")
+        self.counts: Dict[str, int] = {}
+
+    @classmethod
+    def from_volume(cls, volume: str, **kwargs) -> "SyntheticDataset":
+        owners, pets, records = VOLUMES[volume]
+        return cls(owners, pets, records, **kwargs)
+
+    def __enter__(self) -> "SyntheticDataset":
+        return self.create()
+
+    def __exit__(self, *exc) -> None:
+        self.cleanup()
+
+    # Building
+
+    def create(self) -> "SyntheticDataset":
+        # No periodic snapshots in the memory mode: they would land in the middle of the timings
+        self.config = storage_config.configure(data_dir=self.data_dir, layout=self.layout, profile=self.profile,
+                                               mode=self.mode, snapshot_seconds=0)
+        initialize_databases(verbose=False)
+        rng = random.Random(self.seed)
+        self._insert_owners(rng)
+        self._insert_pets(rng)
+        self._insert_records(rng)
+        return self
+
+    def cleanup(self) -> None:
+        """Closes the connections, restores the default configuration and removes the files."""
+        close_all_connections()
+        stop_memory_store(snapshot=False)
+        storage_config.configure()
+        if self._own_dir:
+            shutil.rmtree(self.data_dir, ignore_errors=True)
+
+    def _insert_owners(self, rng: random.Random) -> None:
+        # Owners get ids 1..owners in the fresh database
+        rows = ((f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}", f"09{i:09d}", f"{rng.randint(1, 999)} Rizal St.")
+                for i in range(1, self.owners + 1))
+        self._insert("pets", "INSERT INTO owner (name, contact_number, address) VALUES (?, ?, ?)", rows)
+        self.counts["owners"] = self.owners
+
+    def _insert_pets(self, rng: random.Random) -> None:
+        def rows():
+            for i in range(self.pets):
+                # Every owner gets a pet first, the rest go to random owners
+                owner_id = i + 1 if i < self.owners else rng.randint(1, self.owners)
+                yield (rng.choice(PET_NAMES), rng.choice(BREEDS), _date(rng, 2008, 2024), owner_id)
+        self._insert("pets", "INSERT INTO pets (name, breed, birthdate, owner_id) VALUES (?, ?, ?, ?)", rows())
+        self.counts["pets"] = self.pets
+
+    def _insert_records(self, rng: random.Random) -> None:
+        writers = {
+            "vaccinations": (VaccinationDB.INSERT_SQL, self._vaccination),
+            "vet_visits": (VetVisitDB.INSERT_SQL, self._vet_visit),
+            "feeding_logs": (FeedingLogDB.INSERT_SQL, self._feeding_log),
+            "grooming_logs": (GroomingLogsController.INSERT_SQL, self._grooming_log),
+        }
+        for record_type, share in RECORD_MIX.items():
+            count = int(self.records * share)
+            sql, make_row = writers[record_type]
+            # Squaring skews the pet ids low: early pets get long histories, later ones few or none
+            rows = (make_row(rng, int(self.pets * rng.random() ** 2) + 1) for _ in range(count))
+            self._insert(record_type, sql, rows)
+            self.counts[record_type] = count
+
+    def _insert(self, db_name: str, sql: str, rows) -> None:
+        conn = get_connection(self.config.db_path(db_name))
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= CHUNK_SIZE:
+                insert_many(conn, sql, chunk)
+                chunk = []
+        insert_many(conn, sql, chunk)
+
+    # Rows, in the column order of each INSERT_SQL
+
+    @staticmethod
+    def _vaccination(rng: random.Random, pet_id: int) -> tuple:
+        name = rng.choice(list(Vaccination.VACCINE_PRICES))
+        given = _date(rng, 2018, 2025)
+        due = (datetime.date.fromisoformat(given) + datetime.timedelta(days=365)).isoformat()
+        return (pet_id, name, given, due, Vaccination.VACCINE_PRICES[name], "")
+
+    @staticmethod
+    def _vet_visit(rng: random.Random, pet_id: int) -> tuple:
+        return (pet_id, _date(rng, 2018, 2025), rng.choice(VET_REASONS), "", float(rng.randint(3, 60) * 50))
+
+    @staticmethod
+    def _feeding_log(rng: random.Random, pet_id: int) -> tuple:
+        plan = rng.randint(0, 3)
+        return (pet_id, _date(rng, 2018, 2025), rng.randint(1, 14), int(plan == 1), int(plan == 2), int(plan == 3), "")
+
+    @staticmethod
+    def _grooming_log(rng: random.Random, pet_id: int) -> tuple:
+        groom_type = rng.choice(GROOM_TYPES)
+        return (pet_id, groom_type, GroomingLogsController.PRICE_MAP[groom_type], rng.choice(GROOMERS), "")
+
+    def describe(self) -> dict:
+        """What was generated; two runs are comparable when this matches."""
+        return {"seed": self.seed, "layout": self.layout, "profile": self.profile, "mode": self.mode,
+                "rows": dict(self.counts)}
+
+    def size_bytes(self) -> int:
+        return sum(os.path.getsize(path) for path in set(self.config.db_paths().values()) if os.path.exists(path))
+
+
+def _date(rng: random.Random, first_year: int, last_year: int) -> str:
+    start = datetime.date(first_year, 1, 1).toordinal()
+    end = datetime.date(last_year, 12, 31).toordinal()
+    return datetime.date.fromordinal(rng.randint(start, end)).isoformat()
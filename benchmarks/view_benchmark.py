@@ -0,0 +1,257 @@
+# File: benchmarks/view_benchmark.py
+#   python -m benchmarks.view_benchmark --sizes 100,1000,5000 --output views.json --baseline benchmarks/baseline_views.json
+import argparse
+import contextlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.bench_utils import add_common_arguments, environment, finish_run, load_json, summarize
+from benchmarks.synthetic_data import SyntheticDataset
+from backend.database_handlers.query_trace import configure_tracing
+from backend.services.query_cache import disable_query_cache
+
+DEFAULT_SIZES = "100,1000,5000"
+# Owners and records per dataset, relative to its pet count
+OWNERS_PER_PET = 0.2
+RECORDS_PER_PET = 20
+
+SCREEN = "1600x900x24"
+READY_TIMEOUT = 120.0
+
+PHASES = ("build", "first_idle", "ready")
+
+
+@contextlib.contextmanager
+def virtual_display(force: bool = False, screen: str = SCREEN):
+    """
+    Runs the block with ``DISPLAY`` pointing at a private Xvfb server.
+
+    An existing display is used as is unless ``force`` is set. Xvfb picks a free
+    display number itself (``-displayfd``) and is stopped afterwards.
+    """
+    if os.environ.get("DISPLAY") and not force:
+        yield os.environ["DISPLAY"]
+        return
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        raise RuntimeError("No display available and Xvfb is not installed (e.g. apt install xvfb)")
+    read_fd, write_fd = os.pipe()
+    process = subprocess.Popen([xvfb, "-displayfd", str(write_fd), "-screen", "0", screen, "-nolisten", "tcp"],
+                               pass_fds=(write_fd,), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.close(write_fd)
+    previous = os.environ.get("DISPLAY")
+    try:
+        # Xvfb writes the display number once it accepts connections
+        with os.fdopen(read_fd, "r") as f:
+            number = f.readline().strip()
+        if not number:
+            raise RuntimeError(f"Xvfb exited with code {process.wait()} before opening a display")
+        os.environ["DISPLAY"] = f":{number}"
+        yield os.environ["DISPLAY"]
+    finally:
+        if previous is None:
+            os.environ.pop("DISPLAY", None)
+        else:
+            os.environ["DISPLAY"] = previous
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def count_widgets(widget) -> int:
+    """Widgets below ``widget``, itself not included."""
+    return sum(1 + count_widgets(child) for child in widget.winfo_children())
+
+
+def rss_kb() -> Optional[int]:
+    """Resident memory of this process, or None where it cannot be read."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Peak rather than current, but still catches a view that keeps growing
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class ViewBench:
+    """One view to time: ``build(container)`` plus what "ready" means for it."""
+
+    def __init__(self, name: str, build: Callable, rendered: Optional[str] = None):
+        self.name = name
+        self.build = build
+        # ProgressiveRenderer name the view renders its cards under, if any
+        self.rendered = rendered
+
+
+def make_views() -> List[ViewBench]:
+    # Imported here so every handler picks up the dataset's storage configuration
+    from backend.services.pet_dossier import PetDossier
+    from frontend.views.view_pets_tab import create_view_pets_tab
+    from frontend.views.vaccination_visits_tab import VaccinationVisitsTab
+    from frontend.views.pet_profile_tab import create_pet_profile_tab
+
+    show_frame = lambda *args, **kwargs: None
+    # Pet ids are skewed low, so pet 1 has the longest history: the heaviest profile
+    dossier = PetDossier.load(1)
+    return [
+        ViewBench("view_pets", lambda container: create_view_pets_tab(container, show_frame)),
+        ViewBench("vaccination_visits", lambda container: VaccinationVisitsTab.create(container, show_frame),
+                  rendered="vaccination_visits"),
+        ViewBench("pet_profile", lambda container: create_pet_profile_tab(container, dossier, show_frame)),
+    ]
+
+
+def wait_until_ready(root, executor, view: ViewBench, timeout: float = READY_TIMEOUT) -> None:
+    """Runs the event loop until the view's background loads and progressive rendering are done."""
+    from frontend.progressive_renderer import render_timings
+
+    deadline = time.perf_counter() + timeout
+    while executor.pending_count() or (view.rendered and view.rendered not in render_timings):
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"{view.name} was not ready after {timeout:.0f} s")
+        root.update()
+        time.sleep(0.001)
+    root.update_idletasks()
+
+
+def time_view(root, executor, view: ViewBench, repeat: int) -> dict:
+    """
+    Builds the view ``repeat`` times (after one warm-up build), each time into a
+    fresh container, and times three phases from the start of the build:
+    ``build`` (the create call), ``first_idle`` (first pass of the event loop,
+    the skeleton on screen) and ``ready`` (data loaded and every card built).
+    """
+    from frontend.progressive_renderer import render_timings
+    import customtkinter as ctk
+
+    samples: Dict[str, List[float]] = {phase: [] for phase in PHASES}
+    widgets = rss_before = rss_after = None
+    for run in range(repeat + 1):
+        container = ctk.CTkFrame(root, fg_color="#F0F8FF")
+        container.pack(fill="both", expand=True)
+        root.update()
+        render_timings.pop(view.rendered, None)
+        rss_before = rss_kb()
+
+        started = time.perf_counter()
+        view.build(container)
+        built = time.perf_counter()
+        root.update_idletasks()
+        root.update()
+        first_idle = time.perf_counter()
+        wait_until_ready(root, executor, view)
+        ready = time.perf_counter()
+
+        rss_after = rss_kb()
+        widgets = count_widgets(container)
+        container.destroy()
+        root.update()
+        if run:
+            samples["build"].append((built - started) * 1000)
+            samples["first_idle"].append((first_idle - started) * 1000)
+            samples["ready"].append((ready - started) * 1000)
+
+    results = {phase: summarize(values) for phase, values in samples.items()}
+    results["ready"].update(widgets=widgets, rss_kb=rss_after,
+                            rss_growth_kb=None if rss_before is None else rss_after - rss_before)
+    return results
+
+
+def run_benchmarks(sizes: List[int], repeat: int = 3, seed: int = 42) -> Tuple[Dict[str, dict], List[dict]]:
+    """
+    Times every view at every dataset size. Returns the results, keyed
+    ``<pets>.<view>.<phase>``, and the description of each dataset.
+    """
+    import customtkinter as ctk
+    from frontend.task_executor import init_task_executor
+
+    results = {}
+    datasets = []
+    ctk.set_appearance_mode("light")
+    root = ctk.CTk()
+    root.geometry("1600x900+0+0")
+    executor = init_task_executor(root)
+    try:
+        for pets in sizes:
+            dataset = SyntheticDataset(max(1, int(pets * OWNERS_PER_PET)), pets, pets * RECORDS_PER_PET, seed=seed)
+            print(f"🧪 {dataset.pets} pets, {dataset.owners} owners, {dataset.records} records...")
+            dataset.create()
+            try:
+                datasets.append(dataset.describe())
+                for view in make_views():
+                    for phase, result in time_view(root, executor, view, repeat).items():
+                        results[f"{pets}.{view.name}.{phase}"] = result
+            finally:
+                dataset.cleanup()
+    finally:
+        executor.shutdown()
+        root.destroy()
+    return results, datasets
+
+
+def widget_growth(results: Dict[str, dict], baseline_path: Optional[str], tolerance: float) -> List[str]:
+    """Views that now build more widgets than the baseline allows; counts do not depend on timing noise."""
+    if not baseline_path or not os.path.exists(baseline_path):
+        return []
+    baseline = load_json(baseline_path)["results"]
+    grown = []
+    for name, result in results.items():
+        before = baseline.get(name, {}).get("widgets")
+        if before and result.get("widgets") and result["widgets"] > before * (1 + tolerance):
+            print(f"❌ {name}: {result['widgets']} widgets vs {before}")
+            grown.append(name)
+    return grown
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="PetTrackr view-build benchmarks under a virtual display")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="comma-separated pet counts, one dataset each")
+    parser.add_argument("--xvfb", action="store_true", help="start Xvfb even when DISPLAY is set")
+    add_common_arguments(parser)
+    parser.set_defaults(repeat=3)
+    args = parser.parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+
+    # Every build queries the database, as a first visit after a write would
+    disable_query_cache()
+    configure_tracing(enabled=False, slow_log_path=None)
+
+    try:
+        with virtual_display(force=args.xvfb) as display:
+            print(f"🖥️ Building views on display {display}")
+            results, datasets = run_benchmarks(sizes, args.repeat, args.seed)
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 2
+
+    report = {
+        "benchmark": "views",
+        "dataset": datasets,
+        "environment": environment(),
+        "results": results,
+    }
+    for name, result in results.items():
+        extra = f"   {result['widgets']} widgets, {result['rss_kb']} kB RSS" if "widgets" in result else ""
+        print(f"   {name:<40} median {result['median_ms']:>10.2f} ms   min {result['min_ms']:>10.2f} ms{extra}")
+    status = finish_run(report, args.output, args.baseline, args.save_baseline, args.tolerance)
+    if not args.save_baseline and widget_growth(results, args.baseline, args.tolerance):
+        status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
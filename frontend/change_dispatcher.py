@@ -0,0 +1,107 @@
+# File: frontend/change_dispatcher.py
+import threading
+from collections import deque
+from typing import Callable, Iterable, List, Optional
+
+from backend.services.event_bus import ChangeEvent, EventBus, event_bus
+
+
+class ChangeDispatcher:
+    """
+    Hands event-bus changes to the GUI on the Tk main thread.
+
+    Events published on the main thread are delivered at the next idle point;
+    events from worker threads are picked up by a slow ``after()`` poll, since
+    Tk must not be called from those threads. Either way, all events that
+    arrived since the last delivery go to each listener as one list, so a save
+    that writes a pet and several records patches the views once.
+    """
+
+    def __init__(self, root, bus: EventBus = event_bus, poll_ms: int = 250):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._events = deque()
+        self._listeners = []
+        self._flush_id = None
+        self._poll_id = None
+        self._main_thread = threading.current_thread()
+        self._unsubscribe = bus.subscribe(self._on_event)
+        self.deliveries = 0
+        self._schedule_poll()
+
+    def add_listener(self, callback: Callable[[List[ChangeEvent]], None],
+                     entities: Optional[Iterable[str]] = None, widget=None) -> Callable[[], None]:
+        """
+        Calls ``callback(events)`` on the main thread with every batch of changes.
+
+        Args:
+            entities: Only deliver changes to these entities.
+            widget: Drop the listener once this widget is destroyed.
+
+        Returns:
+            A function that removes the listener.
+        """
+        listener = (callback, frozenset(entities) if entities is not None else None, widget)
+        self._listeners.append(listener)
+        return lambda: listener in self._listeners and self._listeners.remove(listener)
+
+    def _on_event(self, event: ChangeEvent):
+        # Runs on the publishing thread
+        self._events.append(event)
+        if threading.current_thread() is self._main_thread and self._flush_id is None:
+            self._flush_id = self.root.after_idle(self._flush)
+
+    def _schedule_poll(self):
+        self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        if self._events and self._flush_id is None:
+            self._flush()
+        self._schedule_poll()
+
+    def _flush(self):
+        self._flush_id = None
+        events = []
+        while self._events:
+            events.append(self._events.popleft())
+        if not events:
+            return
+        self.deliveries += 1
+        for listener in list(self._listeners):
+            callback, entities, widget = listener
+            if widget is not None and not widget.winfo_exists():
+                self._listeners.remove(listener)
+                continue
+            matching = events if entities is None else [e for e in events if e.entity in entities]
+            if not matching:
+                continue
+            try:
+                callback(matching)
+            except Exception as e:
+                print(f"⚠️ Could not apply changes {matching}: {e}")
+
+    def shutdown(self):
+        self._unsubscribe()
+        for after_id in (self._flush_id, self._poll_id):
+            if after_id is not None:
+                try:
+                    self.root.after_cancel(after_id)
+                except Exception:
+                    pass
+        self._flush_id = self._poll_id = None
+
+
+_dispatcher: Optional[ChangeDispatcher] = None
+
+
+def init_change_dispatcher(root, **kwargs) -> ChangeDispatcher:
+    """Creates the application's dispatcher. Called once by ``launch_gui``."""
+    global _dispatcher
+    _dispatcher = ChangeDispatcher(root, **kwargs)
+    return _dispatcher
+
+
+def get_change_dispatcher() -> ChangeDispatcher:
+    if _dispatcher is None:
+        raise RuntimeError("Change dispatcher not initialized; call init_change_dispatcher(root) first")
+    return _dispatcher
@@ -1,7 +1,9 @@
 import os
 import random
-from PIL import Image
 import customtkinter as ctk
+from frontend.image_cache import get_cached_image
+from backend.data.storage_config import get_image_path
+from frontend.placeholder_assets import get_placeholder_image
 from frontend.style.style import (
     create_label,
     create_frame,
@@ -26,7 +28,7 @@ def generate_pastel_color():
 
 class PetCard(ctk.CTkFrame):
 
-    def __init__(self, master, pet, image_store, owner=None, on_click=None, *args, **kwargs):
+    def __init__(self, master, pet, owner=None, on_click=None, *args, **kwargs):
         # Generate a random pastel color for the card background
         pastel_color = generate_pastel_color()
         super().__init__(
@@ -40,7 +42,8 @@ class PetCard(ctk.CTkFrame):
         )
         self.pet = pet
         self.owner = owner
-        self.image_store = image_store
+        # The one thumbnail this card shows; recycling the card lets go of the previous one
+        self._thumb = None
         self.on_click = on_click
         self.configure(width=260)
         self.columnconfigure(0, weight=1)
@@ -75,21 +78,21 @@ class PetCard(ctk.CTkFrame):
         image_frame = create_frame(container, self._original_fg_color)
         image_frame.pack(pady=(0, 10))
 
-        label_image = ctk.CTkLabel(
+        self._image_label = ctk.CTkLabel(
             image_frame,
             image=thumbnail,
             text="",
             compound="top"
         )
-        label_image.pack(pady=(10, 10))
-        # Show message if image is missing
-        if hasattr(self, '_missing_image') and self._missing_image:
-            ctk.CTkLabel(
-                image_frame,
-                text="Oh no! I can't see your pet's cuteness",
-                font=get_card_detail_font(),
-                text_color="#888888"
-            ).pack(pady=(8, 0))
+        self._image_label.pack(pady=(10, 10))
+        # Message shown while the image is missing
+        self._missing_label = ctk.CTkLabel(
+            image_frame,
+            text="Oh no! I can't see your pet's cuteness",
+            font=get_card_detail_font(),
+            text_color="#888888"
+        )
+        self._show_missing_message()
 
         # Info section
         info_frame = create_frame(container, self._original_fg_color)
@@ -103,12 +106,12 @@ class PetCard(ctk.CTkFrame):
             text="🐾",
             font=get_card_icon_font(),
         ).pack(side="left", padx=(0, 5))
-        label_name = create_label(
+        self._name_label = create_label(
             name_frame,
             self.pet.name,
             font=get_card_title_font()
         )
-        label_name.pack(side="left")
+        self._name_label.pack(side="left")
 
         # Details with icon-text pairs
         details_frame = create_frame(info_frame, self._original_fg_color)
@@ -124,12 +127,13 @@ class PetCard(ctk.CTkFrame):
             width=24,
             anchor="w"
         ).pack(side="left")
-        create_label(
+        self._breed_label = create_label(
             breed_row,
             self.pet.breed or "Unknown",
             font=get_card_detail_font(),
             anchor="w"
-        ).pack(side="left", padx=5)
+        )
+        self._breed_label.pack(side="left", padx=5)
 
         # Birthdate row
         birth_row = create_frame(details_frame, self._original_fg_color)
@@ -141,12 +145,13 @@ class PetCard(ctk.CTkFrame):
             width=24,
             anchor="w"
         ).pack(side="left")
-        create_label(
+        self._birth_label = create_label(
             birth_row,
             self.pet.birthdate,
             font=get_card_detail_font(),
             anchor="w"
-        ).pack(side="left", padx=5)
+        )
+        self._birth_label.pack(side="left", padx=5)
 
         # Age row
         age_row = create_frame(details_frame, self._original_fg_color)
@@ -158,57 +163,74 @@ class PetCard(ctk.CTkFrame):
             width=24,
             anchor="w"
         ).pack(side="left")
-        create_label(
+        self._age_label = create_label(
             age_row,
             self.pet.age(),
             font=get_card_detail_font(),
             anchor="w"
-        ).pack(side="left", padx=5)
+        )
+        self._age_label.pack(side="left", padx=5)
 
-        # Owner row (only if owner exists)
+        # Owner row (only shown if owner exists)
+        self._owner_row = create_frame(details_frame, self._original_fg_color)
+        ctk.CTkLabel(
+            self._owner_row,
+            text="👤",
+            font=get_card_icon_font(),
+            width=24,
+            anchor="w"
+        ).pack(side="left")
+        self._owner_label = create_label(
+            self._owner_row,
+            self._owner_text(),
+            font=get_card_detail_font(),
+            anchor="w"
+        )
+        self._owner_label.pack(side="left", padx=5)
         if self.owner:
-            owner_row = create_frame(details_frame, self._original_fg_color)
-            owner_row.pack(fill="x", pady=3)
-            ctk.CTkLabel(
-                owner_row,
-                text="👤",
-                font=get_card_icon_font(),
-                width=24,
-                anchor="w"
-            ).pack(side="left")
-            create_label(
-                owner_row,
-                f"{self.owner.name} ({self.owner.contact_number})",
-                font=get_card_detail_font(),
-                anchor="w"
-            ).pack(side="left", padx=5)
+            self._owner_row.pack(fill="x", pady=3)
+
+    def _owner_text(self):
+        return f"{self.owner.name} ({self.owner.contact_number})" if self.owner else ""
+
+    def _show_missing_message(self):
+        if getattr(self, '_missing_image', False):
+            self._missing_label.pack(pady=(8, 0))
+        else:
+            self._missing_label.pack_forget()
+
+    def set_pet(self, pet, owner=None):
+        """
+        Shows another pet in this card without rebuilding its widgets. Used by
+        VirtualPetGrid when a card scrolled out of view is recycled.
+        """
+        self.pet = pet
+        self.owner = owner
+        self._image_label.configure(image=self._get_pet_thumbnail())
+        self._show_missing_message()
+        self._name_label.configure(text=pet.name)
+        self._breed_label.configure(text=pet.breed or "Unknown")
+        self._birth_label.configure(text=pet.birthdate)
+        self._age_label.configure(text=pet.age())
+        self._owner_label.configure(text=self._owner_text())
+        if owner:
+            self._owner_row.pack(fill="x", pady=3)
+        else:
+            self._owner_row.pack_forget()
 
     def _get_pet_thumbnail(self):
         try:
             if not self.pet.image_path:
                 raise FileNotFoundError
-            img_path = os.path.join("backend", "data", self.pet.image_path)
+            img_path = get_image_path(self.pet.image_path)
             if not os.path.exists(img_path):
                 raise FileNotFoundError
-            image = Image.open(img_path).resize((140, 140))  # Larger image
-            thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
-            self.image_store.append(thumb)
-            return thumb
+            thumb = get_cached_image(img_path, (140, 140))
+            if thumb is None:
+                raise FileNotFoundError
+            self._missing_image = False
         except Exception:
-            # Try to use the fallback image
-            try:
-                fallback_path = os.path.join("frontend", "assets", "no-pet-image.png")
-                if os.path.exists(fallback_path):
-                    image = Image.open(fallback_path).resize((140, 140))
-                    thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
-                    self.image_store.append(thumb)
-                    self._missing_image = True
-                    return thumb
-            except Exception:
-                pass
-            # Fallback to blank/gray image
-            image = Image.new("RGB", (140, 140), color="lightgray")
-            thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
-            self.image_store.append(thumb)
+            thumb = get_placeholder_image((140, 140))
             self._missing_image = True
-            return thumb
+        self._thumb = thumb
+        return thumb
@@ -1,7 +1,9 @@
 import os
 import random
-from PIL import Image
 import customtkinter as ctk
+from frontend.image_cache import get_cached_image
+from backend.data.storage_config import get_image_path
+from frontend.placeholder_assets import get_placeholder_image
 from backend.controllers.grooming_controller import GroomingLogsController
 from frontend.style.style import (
     create_label,
@@ -13,12 +15,14 @@ from frontend.style.style import (
 )
 
 class PetCardWithGroomingLogs(ctk.CTkFrame):
-    def __init__(self, master, pet, image_store, owner=None, on_click=None, *args, **kwargs):
+    def __init__(self, master, pet, image_store, owner=None, on_click=None,
+                 grooming_logs=None, *args, **kwargs):
         self.pet = pet
         self.owner = owner
         self.image_store = image_store
         self.on_click = on_click
-        self.grooming_logs = GroomingLogsController().get_grooming_logs_for_pet(pet.id)
+        # Tabs pass logs fetched in bulk; fall back to a per-pet query otherwise
+        self.grooming_logs = grooming_logs if grooming_logs is not None else GroomingLogsController().get_grooming_logs_for_pet(pet.id)
 
         self._pastel_color = self.generate_pastel_color()
         super().__init__(
@@ -63,26 +67,16 @@ class PetCardWithGroomingLogs(ctk.CTkFrame):
         try:
             if not self.pet.image_path:
                 raise FileNotFoundError
-            img_path = os.path.join("backend", "data", self.pet.image_path)
+            img_path = get_image_path(self.pet.image_path)
             if not os.path.exists(img_path):
                 raise FileNotFoundError
-            image = Image.open(img_path).resize((140, 140))
-            thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
+            thumb = get_cached_image(img_path, (140, 140))
+            if thumb is None:
+                raise FileNotFoundError
             self.image_store.append(thumb)
             return thumb
         except Exception:
-            try:
-                fallback_path = os.path.join("frontend", "assets", "no-pet-image.png")
-                if os.path.exists(fallback_path):
-                    image = Image.open(fallback_path).resize((140, 140))
-                    thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
-                    self.image_store.append(thumb)
-                    self._missing_image = True
-                    return thumb
-            except Exception:
-                pass
-            image = Image.new("RGB", (140, 140), color="lightgray")
-            thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
+            thumb = get_placeholder_image((140, 140))
             self.image_store.append(thumb)
             self._missing_image = True
             return thumb
@@ -1,7 +1,9 @@
 import os
 import random
-from PIL import Image
 import customtkinter as ctk
+from frontend.image_cache import get_cached_image
+from backend.data.storage_config import get_image_path
+from frontend.placeholder_assets import get_placeholder_image
 from backend.controllers.vaccination_controller import VaccinationController
 from backend.controllers.vet_visit_controller import VetVisitController
 
@@ -24,13 +26,15 @@ def get_card_icon_font():
     return ("Arial", 12)
 
 class PetCardWithRecords(ctk.CTkFrame):
-    def __init__(self, master, pet, image_store, owner=None, on_click=None, *args, **kwargs):
+    def __init__(self, master, pet, image_store, owner=None, on_click=None,
+                 vaccinations=None, vet_visits=None, *args, **kwargs):
         self.pet = pet
         self.owner = owner
         self.image_store = image_store
         self.on_click = on_click
-        self.vaccinations = VaccinationController().get_by_pet_id(pet.id)
-        self.vet_visits = VetVisitController().get_by_pet_id(pet.id)
+        # Tabs pass records fetched in bulk; fall back to a per-pet query otherwise
+        self.vaccinations = vaccinations if vaccinations is not None else VaccinationController().get_by_pet_id(pet.id)
+        self.vet_visits = vet_visits if vet_visits is not None else VetVisitController().get_by_pet_id(pet.id)
 
         # Generate a random pastel color for the card background
         self._pastel_color = self.generate_pastel_color()
@@ -80,26 +84,16 @@ class PetCardWithRecords(ctk.CTkFrame):
         try:
             if not self.pet.image_path:
                 raise FileNotFoundError
-            img_path = os.path.join("backend", "data", self.pet.image_path)
+            img_path = get_image_path(self.pet.image_path)
             if not os.path.exists(img_path):
                 raise FileNotFoundError
-            image = Image.open(img_path).resize((140, 140))
-            thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
+            thumb = get_cached_image(img_path, (140, 140))
+            if thumb is None:
+                raise FileNotFoundError
             self.image_store.append(thumb)
             return thumb
         except Exception:
-            try:
-                fallback_path = os.path.join("frontend", "assets", "no-pet-image.png")
-                if os.path.exists(fallback_path):
-                    image = Image.open(fallback_path).resize((140, 140))
-                    thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
-                    self.image_store.append(thumb)
-                    self._missing_image = True
-                    return thumb
-            except Exception:
-                pass
-            image = Image.new("RGB", (140, 140), color="lightgray")
-            thumb = ctk.CTkImage(light_image=image, dark_image=image, size=(140, 140))
+            thumb = get_placeholder_image((140, 140))
             self.image_store.append(thumb)
             self._missing_image = True
             return thumb
@@ -0,0 +1,117 @@
+import bisect
+from frontend.style.style import create_label
+from frontend.task_executor import run_in_background
+from backend.services.pet_dossier import PetDossier
+from backend.services.event_bus import DELETE
+
+
+class RecordCardGrid:
+    """
+    Keeps track of the cards of a record tab by pet id so that change events
+    patch single cards instead of rebuilding the tab.
+
+    ``make_card(dossier)`` builds a card for one pet and ``qualifies(dossier)``
+    decides whether the pet belongs on the tab (e.g. has grooming logs). Cards
+    are kept in pet id order, ``columns`` per row.
+    """
+
+    def __init__(self, frame, make_card, qualifies, columns=3, empty_text="", group=None):
+        self.frame = frame
+        self.make_card = make_card
+        self.qualifies = qualifies
+        self.columns = columns
+        self.empty_text = empty_text
+        self.group = group
+        self.cards = {}          # pet id -> card
+        self.order = []          # pet ids, ascending
+        self._empty_label = None
+
+    # Initial build
+
+    def add(self, dossier):
+        """Builds the card of a pet, unless a change already brought in a newer one."""
+        if dossier.pet.id not in self.cards:
+            self._insert(dossier)
+
+    def show_empty(self):
+        if self._empty_label is None:
+            self._empty_label = create_label(self.frame, self.empty_text)
+            self._empty_label.grid(row=0, column=0, columnspan=self.columns, pady=40)
+
+    # Patching
+
+    def handle_changes(self, events):
+        """
+        ``on_change`` view hook: reloads the dossiers of the pets touched by
+        ``events`` on a worker thread, then replaces, adds or drops their cards.
+        """
+        affected = set()
+        for event in events:
+            if event.entity == "pets" and event.action == DELETE:
+                for pet_id in event.ids:
+                    self._remove(pet_id)
+            elif event.entity == "owners":
+                owner_ids = set(event.ids)
+                affected.update(pid for pid, card in self.cards.items() if card.pet.owner_id in owner_ids)
+            else:
+                affected.update(event.pet_ids)
+        if affected:
+            run_in_background(self._load, sorted(affected), on_success=self._apply, group=self.group)
+
+    @staticmethod
+    def _load(pet_ids):
+        # An owner edit can touch many cards: one batched read instead of five queries per pet
+        return PetDossier.load_many(pet_ids)
+
+    def _apply(self, dossiers):
+        if not self.frame.winfo_exists():
+            return
+        for pet_id, dossier in dossiers.items():
+            if dossier is None or not self.qualifies(dossier):
+                self._remove(pet_id)
+            elif pet_id in self.cards:
+                index = self.order.index(pet_id)
+                self.cards[pet_id].destroy()
+                self._place(index, self.make_card(dossier), pet_id)
+            else:
+                self._insert(dossier)
+
+    def _insert(self, dossier):
+        self._hide_empty()
+        pet_id = dossier.pet.id
+        index = bisect.bisect_left(self.order, pet_id)
+        self.order.insert(index, pet_id)
+        self._regrid(index + 1)
+        self._place(index, self.make_card(dossier), pet_id)
+
+    def _remove(self, pet_id):
+        card = self.cards.pop(pet_id, None)
+        if card is None:
+            return
+        index = self.order.index(pet_id)
+        self.order.pop(index)
+        card.destroy()
+        self._regrid(index)
+        if not self.order:
+            self.show_empty()
+
+    # Layout
+
+    def _place(self, index, card, pet_id):
+        self.cards[pet_id] = card
+        row, col = divmod(index, self.columns)
+        card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
+        self.frame.rowconfigure(row, weight=1)
+
+    def _regrid(self, start):
+        # Cards after an inserted or removed one shift by one cell
+        for index in range(start, len(self.order)):
+            pet_id = self.order[index]
+            if pet_id in self.cards:
+                row, col = divmod(index, self.columns)
+                self.cards[pet_id].grid_configure(row=row, column=col)
+
+    def _hide_empty(self):
+        if self._empty_label is not None:
+            self._empty_label.destroy()
+            self._empty_label = None
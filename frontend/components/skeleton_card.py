@@ -0,0 +1,62 @@
+import customtkinter as ctk
+from frontend.style.style import get_card_detail_font
+
+
+class SkeletonCard(ctk.CTkFrame):
+    """Grey placeholder shown in a card grid while its data is loading."""
+
+    def __init__(self, master, width=260, height=300, *args, **kwargs):
+        super().__init__(
+            master,
+            fg_color="#ececec",
+            corner_radius=16,
+            border_width=2,
+            border_color="#e0e0e0",
+            width=width,
+            height=height,
+            *args,
+            **kwargs
+        )
+        self.pack_propagate(False)
+        ctk.CTkFrame(self, fg_color="#dcdcdc", corner_radius=12, width=140, height=140).pack(pady=(24, 16))
+        for bar_width in (150, 190, 120):
+            ctk.CTkFrame(self, fg_color="#dcdcdc", corner_radius=6, width=bar_width, height=14).pack(pady=5)
+
+
+def show_skeleton_grid(parent, columns, count=None, text="Loading pets..."):
+    """
+    Fills ``parent`` with one row of skeleton cards plus a loading caption.
+
+    Returns the created widgets so the caller can destroy them once the real
+    cards are ready.
+    """
+    count = count or columns
+    widgets = []
+    caption = ctk.CTkLabel(parent, text=f"⏳ {text}", font=get_card_detail_font(), text_color="#888888")
+    caption.grid(row=0, column=0, columnspan=columns, pady=(10, 0))
+    widgets.append(caption)
+    for idx in range(count):
+        row, col = divmod(idx, columns)
+        card = SkeletonCard(parent)
+        card.grid(row=row + 1, column=col, padx=12, pady=12, sticky="nsew")
+        widgets.append(card)
+    return widgets
+
+
+def clear_skeleton(widgets):
+    for widget in widgets:
+        if widget.winfo_exists():
+            widget.destroy()
+
+
+def show_load_error(parent, widgets, columns, error):
+    """Replaces the skeleton with an error message when loading failed."""
+    if not parent.winfo_exists():
+        return
+    clear_skeleton(widgets)
+    ctk.CTkLabel(
+        parent,
+        text=f"❌ Could not load pets: {error}",
+        font=get_card_detail_font(),
+        text_color="#c0392b"
+    ).grid(row=0, column=0, columnspan=columns, pady=40)
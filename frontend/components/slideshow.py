@@ -117,6 +117,8 @@ class Slideshow(ctk.CTkFrame):
         """Start the slideshow thread"""
         if self.original_images:
             self.is_running = True
+            if getattr(self, "slideshow_thread", None) and self.slideshow_thread.is_alive():
+                return  # Resumed before the previous loop noticed it was stopped
             self.slideshow_thread = threading.Thread(target=self.slideshow_loop, daemon=True)
             self.slideshow_thread.start()
     
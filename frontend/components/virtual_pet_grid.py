@@ -0,0 +1,349 @@
+import bisect
+import customtkinter as ctk
+from frontend.components.pet_card import PetCard
+from frontend.task_executor import run_in_background
+
+
+class VirtualPetGrid(ctk.CTkFrame):
+    """
+    Scrollable grid of PetCards that only builds cards for the visible rows.
+
+    Cards live as canvas windows at fixed row positions. When the view scrolls,
+    cards that left the visible rows (plus ``buffer_rows`` above and below) are
+    moved back to a pool and reused for the rows coming into view through
+    ``PetCard.set_pet``, so the widget count stays proportional to the window
+    size rather than to the number of pets.
+
+    With a ``load_page`` function the pets themselves are fetched on demand too,
+    a page at a time and by position: ``count`` sizes the scroll region for every
+    pet, and the pages under the visible rows (plus half a page either way) are
+    requested in the background, so dragging the scrollbar to the bottom of a
+    long list fetches the last page straight away. Requests for pages scrolled
+    past before they ran are cancelled, and pages more than ``keep_pages`` away
+    from the visible ones are dropped, so memory stays flat however far the
+    list is scrolled.
+    """
+
+    def __init__(self, master, columns=4, row_height=420, buffer_rows=1, on_click=None,
+                 bg_color="#F0F8FF", card_padding=12, load_page=None, count=None, page_size=120,
+                 keep_pages=2, group=None, **kwargs):
+        """
+        Args:
+            load_page: Called as ``load_page(position, limit)`` on a worker thread;
+                returns ``(pets, owners)``, up to ``limit`` pets starting at the
+                0-based ``position`` in the listing.
+            count: Called on a worker thread; returns the number of pets. Required
+                with ``load_page``.
+            page_size: Pets fetched per page.
+            keep_pages: Loaded pages kept on either side of the visible ones.
+            group: TaskExecutor group of the page loads.
+        """
+        if load_page is not None and count is None:
+            raise ValueError("A paged VirtualPetGrid needs count to size its scroll region")
+        super().__init__(master, fg_color=bg_color, **kwargs)
+        self.columns = columns
+        self.row_height = row_height
+        self.buffer_rows = buffer_rows
+        self.on_click = on_click
+        self.card_padding = card_padding
+        self.load_page = load_page
+        self.count = count
+        self.page_size = page_size
+        self.keep_pages = keep_pages
+        self.group = group
+        self.total = 0           # pets the grid scrolls over
+        self._pages = {}         # page index -> list of (pet, owner)
+        self._requested = {}     # page index -> TaskHandle of its fetch
+        self._visible = {}       # item index -> (card, canvas window id)
+        self._pool = []          # (card, canvas window id) not showing any pet
+        self._refresh_pending = False
+        self._generation = 0     # bumped by load(), so late pages of an old load are dropped
+
+        self.canvas = ctk.CTkCanvas(self, bg=bg_color, highlightthickness=0)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.pack(side="left", fill="both", expand=True, padx=(0, 4))
+        self.scrollbar.pack(side="right", fill="y", padx=(0, 8))
+
+        self.canvas.bind("<Configure>", lambda e: self._relayout())
+        for seq, func in [("<MouseWheel>", self._on_mousewheel), ("<Button-4>", self._on_linux_scroll), ("<Button-5>", self._on_linux_scroll)]:
+            self.canvas.bind_all(seq, func)
+        self.bind("<Destroy>", self._on_destroy)
+
+    # Data
+
+    @property
+    def items(self):
+        """The loaded ``(pet, owner)`` pairs, in listing order."""
+        return [pair for page in sorted(self._pages) for pair in self._pages[page]]
+
+    def item(self, index):
+        """The ``(pet, owner)`` pair at ``index``, or None while its page is not loaded."""
+        page = self._pages.get(index // self.page_size)
+        offset = index % self.page_size
+        return page[offset] if page is not None and offset < len(page) else None
+
+    def set_items(self, pets, owners, keep_scroll=False):
+        """
+        Shows exactly these pets, without paging, and scrolls back to the top
+        unless ``keep_scroll``.
+        """
+        self._show_all(list(zip(pets, owners)), keep_scroll)
+
+    def _show_all(self, pairs, keep_scroll):
+        size = self.page_size
+        pages = {start // size: pairs[start:start + size] for start in range(0, len(pairs), size)}
+        self._set_pages(pages, len(pairs), keep_scroll)
+
+    def _set_pages(self, pages, total, keep_scroll):
+        self._pages = pages
+        self.total = total
+        if not keep_scroll:
+            self.canvas.yview_moveto(0)
+        self._rebind()
+
+    def upsert_items(self, pairs):
+        """
+        Adds or replaces pets (``(pet, owner)`` pairs), updating only the visible
+        cards whose pet changed. When paging, a pet that is not loaded may shift
+        the positions of the others, so the loaded pages are fetched again.
+        """
+        missing = []
+        for pet, owner in pairs:
+            location = self._locate(pet.id)
+            if location:
+                page, offset = location
+                self._pages[page][offset] = (pet, owner)
+            else:
+                missing.append((pet, owner))
+        if missing and self.load_page:
+            self.load(keep_scroll=True)
+        elif missing:
+            # Without paging every pet is loaded, in id order
+            items = self.items
+            for pet, owner in missing:
+                index = bisect.bisect_left([p.id for p, _ in items], pet.id)
+                items.insert(index, (pet, owner))
+            self._show_all(items, keep_scroll=True)
+            return
+        self._rebind()
+
+    def remove_pets(self, pet_ids):
+        """Drops the given pets from the grid."""
+        if self.load_page:
+            self.load(keep_scroll=True)
+            return
+        pet_ids = set(pet_ids)
+        self._show_all([(pet, owner) for pet, owner in self.items if pet.id not in pet_ids], keep_scroll=True)
+
+    def update_owner(self, owner):
+        """Shows an updated owner on every loaded pet of that owner."""
+        for page in self._pages.values():
+            page[:] = [(pet, owner if pet.owner_id == owner.id else o) for pet, o in page]
+        self._rebind()
+
+    def _locate(self, pet_id):
+        for page, pairs in self._pages.items():
+            for offset, (pet, _) in enumerate(pairs):
+                if pet.id == pet_id:
+                    return page, offset
+        return None
+
+    def _rebind(self):
+        # Cards keep their positions; only those now showing a different pet or owner are set again
+        for index in list(self._visible):
+            card, window_id = self._visible[index]
+            pair = self.item(index) if index < self.total else None
+            if pair is None:
+                self._release(index)
+            elif card.pet is not pair[0] or card.owner is not pair[1]:
+                card.set_pet(*pair)
+        self._relayout()
+
+    @property
+    def row_count(self):
+        return (self.total + self.columns - 1) // self.columns
+
+    # Paging
+
+    def load(self, keep_scroll=False, on_loaded=None, on_error=None):
+        """
+        (Re)loads the pets through ``load_page`` and the total through ``count``.
+
+        Fetches the first page, or with ``keep_scroll`` the pages in view now, in
+        one request, so a refresh leaves the view where it was. ``on_loaded`` is
+        called before they are shown, ``on_error`` with the exception if they
+        could not be loaded.
+        """
+        self._generation += 1
+        generation = self._generation
+        for handle in self._requested.values():
+            handle.cancel()
+        self._requested.clear()
+        pages = (self._wanted_pages() if keep_scroll else None) or range(1)
+
+        def loaded(result):
+            if generation != self._generation or not self.winfo_exists():
+                return
+            pets, owners, total = result
+            if on_loaded:
+                on_loaded()
+            pairs = list(zip(pets, owners))
+            size = self.page_size
+            self._set_pages({page: pairs[i * size:(i + 1) * size] for i, page in enumerate(pages)},
+                            total, keep_scroll)
+
+        run_in_background(self._fetch, pages.start, len(pages), True, on_success=loaded,
+                          on_error=lambda e: self._page_failed(generation, e, on_error), group=self.group)
+
+    def _request_page(self, page):
+        if self.load_page is None or page in self._pages or page in self._requested:
+            return
+        generation = self._generation
+
+        def loaded(result):
+            if generation != self._generation or not self.winfo_exists():
+                return
+            self._requested.pop(page, None)
+            pets, owners, _ = result
+            self._pages[page] = list(zip(pets, owners))
+            self._schedule_refresh()
+
+        def failed(error):
+            if generation == self._generation:
+                self._requested.pop(page, None)
+            self._page_failed(generation, error)
+
+        self._requested[page] = run_in_background(self._fetch, page, 1, False, on_success=loaded,
+                                                  on_error=failed, group=self.group)
+
+    def _fetch(self, first_page, pages, with_count):
+        # Runs on a worker thread
+        pets, owners = self.load_page(first_page * self.page_size, pages * self.page_size)
+        total = self.count() if with_count else None
+        return pets, owners, total
+
+    def _wanted_pages(self):
+        """Pages under the visible rows, plus half a page either way."""
+        wanted = self.visible_range()
+        if not wanted:
+            return range(0)
+        margin = self.page_size // 2
+        first = max(0, wanted.start - margin) // self.page_size
+        last = (min(self.total, wanted.stop + margin) - 1) // self.page_size
+        return range(first, last + 1)
+
+    def _drop_distant_pages(self, wanted):
+        keep = range(max(0, wanted.start - self.keep_pages), wanted.stop + self.keep_pages)
+        for page in [p for p in self._pages if p not in keep]:
+            del self._pages[page]
+        # Pages scrolled past before their fetch started are not needed any more
+        for page in [p for p in self._requested if p not in wanted]:
+            self._requested.pop(page).cancel()
+
+    def _page_failed(self, generation, error, on_error=None):
+        if generation != self._generation:
+            return
+        if on_error:
+            on_error(error)
+        else:
+            print(f"❌ Could not load pets: {error}")
+
+    # Scrolling
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_refresh()
+
+    def _on_mousewheel(self, event):
+        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+
+    def _on_linux_scroll(self, event):
+        if event.num in (4, 5):
+            self.canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+                self.canvas.unbind_all(seq)
+
+    # Layout
+
+    def _column_width(self):
+        return max(1, self.canvas.winfo_width() // self.columns)
+
+    def _relayout(self):
+        width = self.canvas.winfo_width()
+        self.canvas.configure(
+            scrollregion=(0, 0, width, self.row_count * self.row_height),
+            yscrollincrement=self.row_height // 8
+        )
+        # Column width changed: move and resize the cards already shown
+        for index, (card, window_id) in self._visible.items():
+            self._place(index, window_id)
+        self._refresh()
+
+    def _place(self, index, window_id):
+        row, col = divmod(index, self.columns)
+        col_width = self._column_width()
+        pad = self.card_padding
+        self.canvas.coords(window_id, col * col_width + pad, row * self.row_height + pad)
+        self.canvas.itemconfigure(window_id, width=col_width - 2 * pad, height=self.row_height - 2 * pad)
+
+    def _schedule_refresh(self):
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.after_idle(self._refresh)
+
+    def visible_range(self):
+        """Indexes of the items that should currently have a card, loaded or not."""
+        if not self.total:
+            return range(0)
+        top = self.canvas.canvasy(0)
+        bottom = top + max(self.canvas.winfo_height(), self.row_height)
+        first_row = max(0, int(top // self.row_height) - self.buffer_rows)
+        last_row = min(self.row_count - 1, int(bottom // self.row_height) + self.buffer_rows)
+        return range(first_row * self.columns, min(self.total, (last_row + 1) * self.columns))
+
+    def _refresh(self):
+        self._refresh_pending = False
+        if not self.winfo_exists():
+            return
+        wanted = self.visible_range()
+        for index in [i for i in self._visible if i not in wanted]:
+            self._release(index)
+        for index in wanted:
+            # Rows whose page is still loading stay empty until it arrives
+            if index not in self._visible and self.item(index) is not None:
+                self._acquire(index)
+        if self.load_page:
+            pages = self._wanted_pages()
+            for page in pages:
+                self._request_page(page)
+            if pages:
+                self._drop_distant_pages(pages)
+
+    def _acquire(self, index):
+        pet, owner = self.item(index)
+        if self._pool:
+            card, window_id = self._pool.pop()
+            card.set_pet(pet, owner)
+        else:
+            card = PetCard(self.canvas, pet, owner=owner, on_click=self._handle_click)
+            window_id = self.canvas.create_window(0, 0, window=card, anchor="nw")
+        self._visible[index] = (card, window_id)
+        self._place(index, window_id)
+
+    def _release(self, index):
+        card, window_id = self._visible.pop(index)
+        # Park the card above the scroll region until it is reused
+        self.canvas.coords(window_id, 0, -10 * self.row_height)
+        self._pool.append((card, window_id))
+
+    def _handle_click(self, pet, owner):
+        if self.on_click:
+            self.on_click(pet, owner)
+
+    def widget_count(self):
+        """Number of PetCards built so far (visible plus pooled)."""
+        return len(self._visible) + len(self._pool)
@@ -6,8 +6,16 @@ from frontend.views.pet_profile_tab import create_pet_profile_tab
 from frontend.views.vaccination_visits_tab import VaccinationVisitsTab
 from frontend.views.view_feeding_logs_tab import create_view_feeding_logs_tab
 from frontend.views.grooming_logs_tab import create_grooming_logs_tab
+from frontend.views.diagnostics_view import open_diagnostics_window
 from frontend.style.style import configure_table_style, apply_uniform_layout_style
-from backend.controllers.grooming_controller import GroomingLogsController
+from backend.services.pet_dossier import PetDossier
+from backend.database_handlers.connection_manager import close_all_connections
+from backend.data.memory_store import stop_memory_store
+from backend.services.query_cache import enable_query_cache
+from backend.services.write_queue import close_write_queue
+from frontend.task_executor import init_task_executor
+from frontend.view_cache import ViewCache, set_view_hooks
+from frontend.change_dispatcher import init_change_dispatcher
 
 def launch_gui():
     """Initializes the main application window and sets up dynamic view navigation."""
@@ -26,56 +34,103 @@ def launch_gui():
     root.configure(fg_color="#F0F8FF")  # Light gray background
 
     navigation_stack = []
+    # Tabs share controller query results until a write invalidates them
+    enable_query_cache()
+    executor = init_task_executor(root)
+    # Evicted views no longer need the results of their pending queries
+    view_cache = ViewCache(root, on_evict=lambda key: executor.cancel_group(":".join(str(k) for k in key)))
+    # Controller writes patch the cached views instead of rebuilding them
+    dispatcher = init_change_dispatcher(root)
+    dispatcher.add_listener(view_cache.notify)
 
-    def show_frame(name: str, from_back=False, **kwargs):
-        """Show different frames based on the name."""
-        if not from_back:
-            navigation_stack.append((name, kwargs.copy()))
+    def build_pet_profile(container, pet, dossier=None):
+        key = ("pet_profile", pet.id)
 
-        # Clear the current frame
-        for widget in root.winfo_children():
-            if isinstance(widget, ctk.CTkFrame):
-                widget.destroy()
-
-        if name == "dashboard":
-            create_dashboard(root, show_frame)
-        elif name == "add_pet":
-            create_add_pet_view(root, show_frame)
-        elif name == "view_pets":
-            create_view_pets_tab(root, show_frame)
-        elif name == "pet_profile":
-            pet = kwargs.get("pet")
-            grooming_logs = GroomingLogsController().get_grooming_logs_for_pet(pet.id) if pet else []
-
-            def go_back():
-                if len(navigation_stack) > 1:
-                    navigation_stack.pop()  # Remove current
-                    prev_name, prev_kwargs = navigation_stack[-1]
-                    show_frame(prev_name, from_back=True, **prev_kwargs)
-                else:
-                    show_frame("dashboard", from_back=True)
+        def go_back():
+            if len(navigation_stack) > 1:
+                navigation_stack.pop()  # Remove current
+                prev_name, prev_kwargs = navigation_stack[-1]
+                show_frame(prev_name, from_back=True, **prev_kwargs)
+            else:
+                show_frame("dashboard", from_back=True)
 
+        def show_profile(dossier):
+            if dossier is None:
+                # The pet was deleted since the list was built
+                if navigation_stack and navigation_stack[-1][0] == "pet_profile":
+                    navigation_stack.pop()
+                show_frame("view_pets", from_back=True)
+                view_cache.invalidate(key)
+                return
             create_pet_profile_tab(
-                root,
-                pet=pet,
-                owner=kwargs.get("owner"),
-                vet_visits=kwargs.get("vet_visits", []),
-                vaccinations=kwargs.get("vaccinations", []),
-                feeding_logs=kwargs.get("feeding_logs", []),
-                grooming_logs=grooming_logs,
+                container,
+                dossier=dossier,
                 show_frame=show_frame,
                 go_back=go_back
             )
+            # When the databases change, reload the dossier instead of reusing the passed one
+            reload = lambda: build_pet_profile(container, pet)
+            set_view_hooks(
+                container,
+                refresh=reload,
+                # Only writes to this pet, its records or its owner
+                on_change=lambda events: any(e.touches_pet(pet.id, pet.owner_id) for e in events) and reload()
+            )
+
+        # Views that already fetched the records pass a ready dossier
+        if dossier is not None:
+            show_profile(dossier)
+        else:
+            [w.destroy() for w in container.winfo_children()]
+            loading = apply_uniform_layout_style(container)
+            ctk.CTkLabel(loading, text="⏳ Loading pet profile...").pack(expand=True)
+            executor.submit(PetDossier.load, pet.id, on_success=show_profile, group=f"pet_profile:{pet.id}")
+
+    def build_view(name, container, kwargs):
+        if name == "dashboard":
+            create_dashboard(container, show_frame)
+        elif name == "add_pet":
+            create_add_pet_view(container, show_frame)
+        elif name == "view_pets":
+            create_view_pets_tab(container, show_frame)
+        elif name == "pet_profile":
+            build_pet_profile(container, kwargs["pet"], kwargs.get("dossier"))
         elif name == "vaccination_visits":
-            VaccinationVisitsTab.create(root, show_frame)
+            VaccinationVisitsTab.create(container, show_frame)
         elif name == "view_feeding_logs":
-            create_view_feeding_logs_tab(root, show_frame)
+            create_view_feeding_logs_tab(container, show_frame)
         elif name == "grooming_logs":
-            create_grooming_logs_tab(root, show_frame)
+            create_grooming_logs_tab(container, show_frame)
+
+    def show_frame(name: str, from_back=False, **kwargs):
+        """Show different frames based on the name, reusing cached views when possible."""
+        if not from_back:
+            navigation_stack.append((name, kwargs.copy()))
+
+        key = (name, kwargs["pet"].id) if name == "pet_profile" else (name,)
+        view_cache.show(
+            key,
+            lambda container: build_view(name, container, kwargs),
+            # The add-pet form always starts empty
+            cacheable=name != "add_pet",
+            data_dependent=name != "dashboard"
+        )
 
     configure_table_style()
+    # Hidden maintenance window with query timings and storage settings
+    root.bind("<Control-Shift-D>", lambda event: open_diagnostics_window(root))
     show_frame("dashboard")
-    root.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        # Saves still waiting in the write-behind queue are committed before exit
+        close_write_queue()
+        dispatcher.shutdown()
+        executor.shutdown()
+        # Release the pooled SQLite connections on exit
+        close_all_connections()
+        # In the memory mode, write the databases back to disk
+        stop_memory_store()
 
 if __name__ == "__main__":
     launch_gui()
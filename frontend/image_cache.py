@@ -0,0 +1,106 @@
+# File: frontend/image_cache.py
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import customtkinter as ctk
+
+from backend.services.thumbnail_service import load_thumbnail
+from backend.services.diagnostics import register_diagnostics_provider
+from backend.services.event_bus import ChangeEvent, subscribe_changes
+
+
+class ImageCache:
+    """
+    Process-wide LRU of decoded ``CTkImage`` objects keyed by (image path, size).
+
+    Every card and the profile view share it, so navigating back and forth does
+    not decode the same photo again. Entries remember the source's mtime and
+    size and are reloaded if the file changes.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _key(path: str, size: Tuple[int, int]):
+        return os.path.normcase(os.path.abspath(path)), tuple(size)
+
+    def get(self, path: str, size: Tuple[int, int]) -> Optional[ctk.CTkImage]:
+        """
+        Returns the cached CTkImage for ``path`` at ``size``, decoding it (from the
+        disk thumbnail cache) on a miss. Returns None if the file does not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        key = self._key(path, size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        image = load_thumbnail(path, size)
+        if image is None:
+            return None
+        ctk_image = ctk.CTkImage(light_image=image, dark_image=image, size=tuple(size))
+
+        with self._lock:
+            self._entries[key] = (version, ctk_image)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return ctk_image
+
+    def invalidate(self, path: str) -> None:
+        """Drops every cached size of ``path``."""
+        normalized = os.path.normcase(os.path.abspath(path))
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == normalized]:
+                del self._entries[key]
+
+    def on_change(self, event: ChangeEvent) -> None:
+        """Event-bus listener: drops the photo of a pet that was written."""
+        image_path = event.details.get("image_path")
+        if image_path:
+            self.invalidate(image_path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Hit/miss/eviction counters for diagnostics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+image_cache = ImageCache()
+subscribe_changes(image_cache.on_change, entities=("pets",))
+register_diagnostics_provider("image_cache", image_cache.stats)
+
+
+def get_cached_image(path: str, size: Tuple[int, int]) -> Optional[ctk.CTkImage]:
+    """Shortcut for ``image_cache.get(path, size)``."""
+    return image_cache.get(path, size)
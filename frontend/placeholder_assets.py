@@ -0,0 +1,84 @@
+# File: frontend/placeholder_assets.py
+import os
+import threading
+from typing import Dict, Tuple
+
+import customtkinter as ctk
+from PIL import Image
+
+NO_PET_IMAGE_PATH = os.path.join("frontend", "assets", "no-pet-image.png")
+
+# Every size a placeholder is drawn at: card thumbnails and the profile photo
+PLACEHOLDER_SIZES = ((140, 140), (300, 300))
+
+
+class PlaceholderAssets:
+    """
+    Pre-rendered stand-ins for pets without a usable photo.
+
+    The first request decodes ``no-pet-image.png`` once and renders it, plus the
+    plain grey placeholder, at every size in ``PLACEHOLDER_SIZES``. Later requests
+    return the same CTkImage objects.
+    """
+
+    def __init__(self, source_path: str = NO_PET_IMAGE_PATH, sizes=PLACEHOLDER_SIZES):
+        self.source_path = source_path
+        self.sizes = tuple(tuple(size) for size in sizes)
+        self._no_pet: Dict[Tuple[int, int], ctk.CTkImage] = {}
+        self._grey: Dict[Tuple[int, int], ctk.CTkImage] = {}
+        self._lock = threading.Lock()
+        self._rendered = False
+
+    def _render(self):
+        with self._lock:
+            if self._rendered:
+                return
+            source = None
+            try:
+                if os.path.exists(self.source_path):
+                    with Image.open(self.source_path) as original:
+                        source = original.convert("RGBA")
+            except Exception as e:
+                print(f"⚠️ Could not load placeholder image {self.source_path}: {e}")
+            for size in self.sizes:
+                self._add(size, source)
+            self._rendered = True
+
+    def _add(self, size, source):
+        grey = Image.new("RGB", size, color="lightgray")
+        self._grey[size] = ctk.CTkImage(light_image=grey, dark_image=grey, size=size)
+        if source is not None:
+            image = source.resize(size, Image.Resampling.LANCZOS)
+            self._no_pet[size] = ctk.CTkImage(light_image=image, dark_image=image, size=size)
+
+    def _ensure(self, size):
+        if not self._rendered:
+            self._render()
+        if size not in self._grey:
+            # Sizes outside PLACEHOLDER_SIZES are rendered on demand
+            with self._lock:
+                if size not in self._grey:
+                    source = None
+                    if os.path.exists(self.source_path):
+                        with Image.open(self.source_path) as original:
+                            source = original.convert("RGBA")
+                    self._add(size, source)
+
+    def no_pet_image(self, size: Tuple[int, int]) -> ctk.CTkImage:
+        """The "no pet image" artwork at ``size``, or the grey box if the asset is missing."""
+        size = tuple(size)
+        self._ensure(size)
+        return self._no_pet.get(size) or self._grey[size]
+
+    def grey(self, size: Tuple[int, int]) -> ctk.CTkImage:
+        size = tuple(size)
+        self._ensure(size)
+        return self._grey[size]
+
+
+placeholder_assets = PlaceholderAssets()
+
+
+def get_placeholder_image(size: Tuple[int, int]) -> ctk.CTkImage:
+    """Shortcut for ``placeholder_assets.no_pet_image(size)``."""
+    return placeholder_assets.no_pet_image(size)
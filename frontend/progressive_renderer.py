@@ -0,0 +1,111 @@
+# File: frontend/progressive_renderer.py
+import time
+from collections import deque
+from typing import Callable, Iterable, Optional
+
+from backend.services.diagnostics import register_diagnostics_provider
+
+# Most recent timings per view name, for diagnostics
+render_timings = {}
+register_diagnostics_provider("render_timings", lambda: dict(render_timings))
+
+
+class ProgressiveRenderer:
+    """
+    Builds widgets for a list of items in time-sliced chunks.
+
+    Each chunk runs inside one Tk callback and stops once ``budget_ms`` is spent,
+    then yields to the event loop with ``after()`` so the window repaints between
+    chunks. The first chunk runs immediately, so the first screenful of cards
+    appears without waiting for the rest.
+    """
+
+    def __init__(self, widget, items: Iterable, build_item: Callable[[int, object], None],
+                 budget_ms: float = 12.0, name: str = "view",
+                 on_complete: Optional[Callable[["ProgressiveRenderer"], None]] = None,
+                 started_at: Optional[float] = None):
+        """
+        Args:
+            widget: Widget whose ``after()`` schedules the chunks; rendering stops
+                if it is destroyed.
+            items: Items to render, in display order.
+            build_item: Called as ``build_item(index, item)`` for every item.
+            budget_ms: Time allowed per chunk; at least one item is built per chunk.
+            name: Label used in the timing report.
+            on_complete: Called once the last item is built.
+            started_at: ``time.perf_counter()`` value the timings are measured from
+                (e.g. when the view started loading). Defaults to ``start()``.
+        """
+        self.widget = widget
+        self.queue = deque(enumerate(items))
+        self.total = len(self.queue)
+        self.build_item = build_item
+        self.budget = budget_ms / 1000
+        self.name = name
+        self.on_complete = on_complete
+        self.started_at = started_at
+        self.time_to_first_ms = None
+        self.time_to_last_ms = None
+        self.chunks = 0
+        self._after_id = None
+        self._cancelled = False
+
+    def start(self) -> "ProgressiveRenderer":
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+        self._step()
+        return self
+
+    def cancel(self):
+        self._cancelled = True
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    @property
+    def done(self) -> bool:
+        return not self.queue
+
+    def _step(self):
+        self._after_id = None
+        if self._cancelled or not self.widget.winfo_exists():
+            return
+
+        deadline = time.perf_counter() + self.budget
+        self.chunks += 1
+        while self.queue:
+            index, item = self.queue.popleft()
+            self.build_item(index, item)
+            if self.time_to_first_ms is None:
+                self.time_to_first_ms = (time.perf_counter() - self.started_at) * 1000
+            if time.perf_counter() >= deadline:
+                break
+
+        if self.queue:
+            # after(1) rather than after_idle so pending redraws and input run first
+            self._after_id = self.widget.after(1, self._step)
+        else:
+            self._finish()
+
+    def _finish(self):
+        self.time_to_last_ms = (time.perf_counter() - self.started_at) * 1000
+        render_timings[self.name] = self.timings()
+        if self.on_complete:
+            self.on_complete(self)
+
+    def timings(self) -> dict:
+        return {
+            "items": self.total,
+            "chunks": self.chunks,
+            "budget_ms": self.budget * 1000,
+            "time_to_first_ms": self.time_to_first_ms,
+            "time_to_last_ms": self.time_to_last_ms,
+        }
+
+
+def render_progressively(widget, items, build_item, **kwargs) -> ProgressiveRenderer:
+    """Creates and starts a ProgressiveRenderer."""
+    return ProgressiveRenderer(widget, items, build_item, **kwargs).start()
@@ -0,0 +1,179 @@
+# File: frontend/task_executor.py
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class TaskHandle:
+    """Handle for a submitted task. Cancelling it drops the result callback."""
+
+    def __init__(self, group: Optional[str] = None):
+        self.group = group
+        self._cancelled = threading.Event()
+        self.done = False
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+
+class TaskExecutor:
+    """
+    Runs blocking work (database queries, image decoding) off the Tk main thread.
+
+    Workers put their results on a queue; the main thread drains it with
+    ``root.after`` polling and calls ``on_success``/``on_error`` there, so the
+    callbacks may touch widgets. Polling only runs while tasks are outstanding.
+    """
+
+    def __init__(self, root, max_workers: int = 4, poll_ms: int = 25):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pettrackr-task")
+        self._results = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._poll_id = None
+        self._shutdown = False
+
+    def submit(self, fn: Callable, *args, on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               group: Optional[str] = None, **kwargs) -> TaskHandle:
+        """
+        Runs ``fn(*args, **kwargs)`` on a worker thread.
+
+        Args:
+            on_success: Called on the main thread with the return value.
+            on_error: Called on the main thread with the exception. Errors are
+                printed when no handler is given.
+            group: Optional label (e.g. the view name) for ``cancel_group``.
+
+        Returns:
+            A TaskHandle whose ``cancel()`` suppresses both callbacks.
+        """
+        handle = TaskHandle(group)
+        with self._lock:
+            self._pending.add(handle)
+        self._pool.submit(self._run, handle, fn, args, kwargs, on_success, on_error)
+        self._schedule_poll()
+        return handle
+
+    def watch(self, future: Future, on_success: Optional[Callable[[Any], None]] = None,
+              on_error: Optional[Callable[[Exception], None]] = None,
+              group: Optional[str] = None) -> TaskHandle:
+        """
+        Calls ``on_success``/``on_error`` on the main thread once a future from
+        another executor (e.g. the write queue) completes, like ``submit`` does
+        for its own tasks.
+        """
+        handle = TaskHandle(group)
+        with self._lock:
+            self._pending.add(handle)
+
+        def deliver(done: Future):
+            if done.cancelled():
+                self._results.put((handle, None, None, None))
+            elif done.exception() is not None:
+                self._results.put((handle, on_error, None, done.exception()))
+            else:
+                self._results.put((handle, on_success, done.result(), None))
+
+        future.add_done_callback(deliver)
+        self._schedule_poll()
+        return handle
+
+    def _run(self, handle, fn, args, kwargs, on_success, on_error):
+        if handle.cancelled:
+            self._results.put((handle, None, None, None))
+            return
+        try:
+            self._results.put((handle, on_success, fn(*args, **kwargs), None))
+        except Exception as e:
+            self._results.put((handle, on_error, None, e))
+
+    def _schedule_poll(self):
+        # after() must be called from the main thread; submit() is only used there
+        if self._poll_id is None and not self._shutdown:
+            self._poll_id = self.root.after(self.poll_ms, self._poll)
+
+    def _poll(self):
+        self._poll_id = None
+        while True:
+            try:
+                handle, callback, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            handle.done = True
+            with self._lock:
+                self._pending.discard(handle)
+            if handle.cancelled:
+                continue
+            if error is not None:
+                if callback:
+                    callback(error)
+                else:
+                    print(f"❌ Background task failed: {error}")
+            elif callback:
+                callback(result)
+
+        with self._lock:
+            outstanding = bool(self._pending)
+        if outstanding:
+            self._schedule_poll()
+
+    def pending_count(self) -> int:
+        """Tasks whose callbacks have not run yet, including cancelled ones still on a worker."""
+        with self._lock:
+            return len(self._pending)
+
+    def cancel_group(self, group: str) -> int:
+        """Cancels every outstanding task submitted with ``group``."""
+        with self._lock:
+            handles = [h for h in self._pending if h.group == group]
+        for handle in handles:
+            handle.cancel()
+        return len(handles)
+
+    def cancel_all(self) -> int:
+        """Cancels every outstanding task, e.g. when the view is torn down."""
+        with self._lock:
+            handles = list(self._pending)
+        for handle in handles:
+            handle.cancel()
+        return len(handles)
+
+    def shutdown(self):
+        self._shutdown = True
+        self.cancel_all()
+        if self._poll_id is not None:
+            try:
+                self.root.after_cancel(self._poll_id)
+            except Exception:
+                pass
+            self._poll_id = None
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+
+_executor: Optional[TaskExecutor] = None
+
+
+def init_task_executor(root, **kwargs) -> TaskExecutor:
+    """Creates the application's executor. Called once by ``launch_gui``."""
+    global _executor
+    _executor = TaskExecutor(root, **kwargs)
+    return _executor
+
+
+def get_task_executor() -> TaskExecutor:
+    if _executor is None:
+        raise RuntimeError("Task executor not initialized; call init_task_executor(root) first")
+    return _executor
+
+
+def run_in_background(fn: Callable, *args, **kwargs) -> TaskHandle:
+    """Shortcut for ``get_task_executor().submit(...)``."""
+    return get_task_executor().submit(fn, *args, **kwargs)
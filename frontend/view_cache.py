@@ -0,0 +1,292 @@
+# File: frontend/view_cache.py
+import os
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional
+
+import customtkinter as ctk
+
+from backend.data.storage_config import get_storage_config
+from backend.services.event_bus import ChangeEvent
+
+# Global bindings the tabs install with bind_all for canvas scrolling
+SCROLL_SEQUENCES = ("<MouseWheel>", "<Button-4>", "<Button-5>")
+
+
+def set_view_hooks(container, on_show: Optional[Callable] = None, on_hide: Optional[Callable] = None,
+                   refresh: Optional[Callable] = None, on_change: Optional[Callable] = None):
+    """
+    Lets a view react to the view cache.
+
+    Args:
+        container: The frame the view was built in (the ``parent`` it received).
+        on_show: Called when the cached view is shown again.
+        on_hide: Called when the view is hidden (e.g. to pause animations).
+        refresh: Reloads the view's data in place when the databases changed.
+            Views without one are rebuilt instead.
+        on_change: Called with a list of ``ChangeEvent`` after this process wrote
+            to the databases, to patch only the affected cards. Views without one
+            are refreshed instead.
+    """
+    container._view_hooks = {"on_show": on_show, "on_hide": on_hide, "refresh": refresh, "on_change": on_change}
+
+
+def _hook(container, name):
+    return getattr(container, "_view_hooks", {}).get(name)
+
+
+class CachedView:
+    def __init__(self, key, frame, build, data_dependent):
+        self.key = key
+        self.frame = frame
+        self.build = build
+        self.data_dependent = data_dependent
+        self.signature = None
+        self.scroll = {}
+        self.bindings = {}
+        self.widget_count = 0
+        self.pending_changes = []
+
+
+class ViewCache:
+    """
+    Keeps recently used views alive as hidden frames.
+
+    Each view is built inside its own container frame on the root. Navigating away
+    hides the container (``pack_forget``) instead of destroying it; navigating back
+    re-packs it, restores its scroll positions and scroll bindings, and refreshes
+    it only if the database files changed since it was last shown. The least
+    recently used hidden views are destroyed once there are more than
+    ``max_views`` or their widgets exceed ``max_widgets``, a proxy for memory.
+
+    Writes made by this process arrive through ``notify``: the visible view
+    patches itself right away, hidden views collect the changes and apply them
+    when shown again. A hidden view that collected more than
+    ``max_pending_changes`` is refreshed as a whole instead.
+    """
+
+    def __init__(self, root, max_views: int = 6, max_widgets: int = 8000,
+                 on_evict: Optional[Callable[[Hashable], None]] = None, max_pending_changes: int = 200):
+        self.root = root
+        self.max_views = max_views
+        self.max_widgets = max_widgets
+        self.max_pending_changes = max_pending_changes
+        self.on_evict = on_evict
+        self._views = OrderedDict()
+        self.current: Optional[CachedView] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.refreshes = 0
+        self.patches = 0
+
+    @staticmethod
+    def data_signature():
+        """
+        Modification time and size of every database file (and WAL) in use. In
+        the memory mode there are no files to stat: only this process writes,
+        and its writes arrive through ``notify``.
+        """
+        signature = []
+        for path in sorted(set(get_storage_config().db_paths().values())):
+            for name in (path, path + "-wal"):
+                try:
+                    stat = os.stat(name)
+                    signature.append((name, stat.st_mtime_ns, stat.st_size))
+                except OSError:
+                    signature.append((name, None, None))
+        return tuple(signature)
+
+    def show(self, key: Hashable, build: Callable[[ctk.CTkFrame], None], cacheable: bool = True,
+             data_dependent: bool = True):
+        """
+        Shows the view identified by ``key``, building it with ``build(container)``
+        if it is not cached.
+        """
+        self._hide_current()
+
+        view = self._views.get(key) if cacheable else None
+        if view is not None:
+            self.hits += 1
+            self._views.move_to_end(key)
+            self.current = view
+            view.frame.pack(fill="both", expand=True)
+            self._restore_bindings(view)
+            if view.pending_changes:
+                self._apply_changes(view, view.pending_changes)
+            if view.data_dependent and view.signature != self.data_signature():
+                self._refresh(view)
+            self._restore_scroll(view)
+            on_show = _hook(view.frame, "on_show")
+            if on_show:
+                on_show()
+            return view
+
+        self.misses += 1
+        frame = ctk.CTkFrame(self.root, fg_color="transparent", corner_radius=0)
+        frame.pack(fill="both", expand=True)
+        view = CachedView(key, frame, build, data_dependent)
+        view.signature = self.data_signature()
+        build(frame)
+        self.current = view
+        if cacheable:
+            self._views[key] = view
+            self._views.move_to_end(key)
+            self._enforce_limits()
+        return view
+
+    def invalidate(self, key: Hashable = None):
+        """Forgets one cached view, or all hidden ones, so they are rebuilt next time."""
+        keys = [key] if key is not None else list(self._views)
+        for k in keys:
+            view = self._views.get(k)
+            if view is not None and view is not self.current:
+                self._evict(k)
+
+    def notify(self, events: List[ChangeEvent]):
+        """
+        Passes changes written by this process to the cached views (a
+        ``ChangeDispatcher`` listener, called on the main thread).
+        """
+        signature = self.data_signature()
+        views = list(self._views.values())
+        if self.current is not None and self.current not in views:
+            views.append(self.current)
+        for view in views:
+            if not view.data_dependent or view.signature is None or not view.frame.winfo_exists():
+                # signature None: already due for a full refresh
+                continue
+            if view is self.current:
+                self._apply_changes(view, events)
+            else:
+                view.pending_changes.extend(events)
+                if len(view.pending_changes) > self.max_pending_changes:
+                    # Too much to patch: drop the changes and refresh on show
+                    view.pending_changes = []
+                    view.signature = None
+                    continue
+            # The files changed because of these writes, which the view now accounts for
+            view.signature = signature
+
+    def stats(self) -> dict:
+        return {
+            "views": len(self._views),
+            "max_views": self.max_views,
+            "widgets": sum(v.widget_count for v in self._views.values() if v is not self.current),
+            "max_widgets": self.max_widgets,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "refreshes": self.refreshes,
+            "patches": self.patches,
+        }
+
+    # Internals
+
+    def _hide_current(self):
+        view = self.current
+        self.current = None
+        if view is None or not view.frame.winfo_exists():
+            return
+        if view.key not in self._views or self._views[view.key] is not view:
+            # Not cacheable: destroy it as show_frame always did
+            view.frame.destroy()
+            if self.on_evict:
+                self.on_evict(view.key)
+            return
+        on_hide = _hook(view.frame, "on_hide")
+        if on_hide:
+            on_hide()
+        view.scroll = self._save_scroll(view.frame)
+        view.bindings = {seq: self.root.bind_all(seq) for seq in SCROLL_SEQUENCES}
+        view.widget_count = self._count_widgets(view.frame)
+        view.frame.pack_forget()
+
+    def _refresh(self, view: CachedView):
+        self.refreshes += 1
+        refresh = _hook(view.frame, "refresh")
+        if refresh:
+            refresh()
+        else:
+            # The rebuilt view installs its own hooks
+            set_view_hooks(view.frame)
+            view.build(view.frame)
+        view.signature = self.data_signature()
+
+    def _apply_changes(self, view: CachedView, events: List[ChangeEvent]):
+        view.pending_changes = []
+        on_change = _hook(view.frame, "on_change")
+        if on_change:
+            self.patches += 1
+            on_change(list(events))
+        else:
+            self._refresh(view)
+
+    def _enforce_limits(self):
+        bindings = {seq: self.root.bind_all(seq) for seq in SCROLL_SEQUENCES}
+        evicted = False
+        while True:
+            hidden = [k for k, v in self._views.items() if v is not self.current]
+            if not hidden:
+                break
+            widgets = sum(self._views[k].widget_count for k in hidden)
+            if len(self._views) <= self.max_views and widgets <= self.max_widgets:
+                break
+            self._evict(hidden[0])
+            evicted = True
+        # Destroying a view runs its <Destroy> cleanup, which unbinds the scroll keys
+        if evicted:
+            for seq, script in bindings.items():
+                if script:
+                    self.root.bind_all(seq, script)
+
+    def _evict(self, key):
+        view = self._views.pop(key)
+        self.evictions += 1
+        if view.frame.winfo_exists():
+            view.frame.destroy()
+        if self.on_evict:
+            self.on_evict(key)
+
+    def _restore_bindings(self, view: CachedView):
+        for seq in SCROLL_SEQUENCES:
+            script = view.bindings.get(seq)
+            if script:
+                self.root.bind_all(seq, script)
+            else:
+                self.root.unbind_all(seq)
+
+    @staticmethod
+    def _scroll_canvases(frame):
+        """Canvases driving a scrollbar, without descending into their content."""
+        found, stack = [], [frame]
+        while stack:
+            widget = stack.pop()
+            if widget.winfo_class() == "Canvas":
+                try:
+                    if widget.cget("yscrollcommand"):
+                        found.append(widget)
+                        continue
+                except Exception:
+                    pass
+            stack.extend(widget.winfo_children())
+        return found
+
+    def _save_scroll(self, frame):
+        return {str(canvas): canvas.yview()[0] for canvas in self._scroll_canvases(frame)}
+
+    def _restore_scroll(self, view: CachedView):
+        if not view.scroll:
+            return
+        for canvas in self._scroll_canvases(view.frame):
+            position = view.scroll.get(str(canvas))
+            if position is not None:
+                canvas.yview_moveto(position)
+
+    @staticmethod
+    def _count_widgets(frame):
+        count, stack = 0, [frame]
+        while stack:
+            widget = stack.pop()
+            count += 1
+            stack.extend(widget.winfo_children())
+        return count
@@ -8,9 +8,8 @@ from backend.models.vet_visit import VetVisit
 from backend.models.vaccination import Vaccination
 from backend.models.feeding_log import FeedingLog
 from backend.controllers.pet_controller import PetController
-from backend.controllers.vet_visit_controller import VetVisitController
-from backend.controllers.vaccination_controller import VaccinationController
-from backend.controllers.feeding_log_controller import FeedingLogController
+from backend.services.write_queue import submit_write
+from frontend.task_executor import get_task_executor
 from frontend.components.floating_placeholder_entry import FloatingPlaceholderEntry
 from frontend.components.copyright import get_copyright_label
 from frontend.components.image_uploader import ImageUploader
@@ -71,7 +70,8 @@ class AddPetView:
         btn_frame.pack(pady=(10, 30), fill="x")
         btn_frame.grid_columnconfigure((0, 1), weight=1, uniform="buttons")
         create_back_button(btn_frame, text="BACK", command=lambda: self.show_frame("dashboard"), width=100).grid(row=0, column=0, padx=(0, 5), sticky="ew")
-        create_button(btn_frame, text="SAVE", command=self.save_pet, width=100).grid(row=0, column=1, padx=(5, 0), sticky="ew")
+        self.save_button = create_button(btn_frame, text="SAVE", command=self.save_pet, width=100)
+        self.save_button.grid(row=0, column=1, padx=(5, 0), sticky="ew")
 
     def _build_pet_tab(self, tab):
         self.name_entry = FloatingPlaceholderEntry(tab, "Pet Name")
@@ -391,50 +391,48 @@ class AddPetView:
             if not contact_number.isdigit():
                 messagebox.showerror("Invalid Contact Number", "Contact number must contain only digits (no spaces or letters). Please enter a valid number.")
                 return
-            pet_controller = PetController()
-            # Make image optional
+            # The pet, its owner, its photo and every queued record are saved together or not at all
+            unit = PetController().unit_of_work()
             image_path = self.image_uploader.get_image_path()
-            pet_id = pet_controller.add_pet_with_owner(
+            staged_pet = unit.add_pet(
                 Pet(0, required["pet"][0], self.breed_entry.get(), required["pet"][1]),
                 Owner(0, required["owner"][0], contact_number, self.owner_address_entry.get()),
                 image_path if image_path else None
             )
-            controllers = {
-                "vet_visits": (VetVisitController, VetVisit),
-                "vaccinations": (VaccinationController, Vaccination),
-                "feeding_logs": (FeedingLogController, FeedingLog),
-                "groomings": (None, None),  # NEW
-            }
-            for record_type, (ctrl_cls, model_cls) in controllers.items():
-                if record_type == "groomings":
-                    from backend.controllers.grooming_controller import GroomingLogsController
-                    from backend.models.grooming_log import GroomingLog
-                    ctrl = GroomingLogsController()
-                    for record in self.records[record_type]:
-                        model_instance = GroomingLog(
-                            id=0,
-                            pet_id=pet_id,
-                            groom_date="",  # DB will auto-generate
-                            groom_type=record["groom_type"],
-                            price=record["price"],
-                            groomer_name=record["groomer_name"],
-                            notes=record["notes"]
-                        )
-                        ctrl.add_grooming_log(
-                            pet_id=pet_id,
-                            groom_type=record["groom_type"],
-                            groomer_name=record["groomer_name"],
-                            notes=record["notes"]
-                        )
-                else:
-                    ctrl = ctrl_cls()
-                    for record in self.records[record_type]:
-                        model_instance = model_cls(pet_id=pet_id, **record)
-                        ctrl.db_handler.insert(model_instance)
-            messagebox.showinfo("Saved", f"{required['pet'][0]} and all records added successfully!")
-            self.records = {k: [] for k in self.records}
+            for record_type in ("vet_visits", "vaccinations", "feeding_logs"):
+                unit.add_records(record_type, self.records[record_type], pet=staged_pet)
+            unit.add_records("grooming_logs", [
+                {
+                    "groom_type": record["groom_type"],
+                    "groomer_name": record["groomer_name"],
+                    "notes": record["notes"],
+                }
+                for record in self.records["groomings"]
+            ], pet=staged_pet)
+            # The writer thread commits it; the form stays responsive meanwhile
+            future = submit_write(unit)
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
+        submitted, self.records = self.records, {k: [] for k in self.records}
+        self.save_button.configure(state="disabled", text="SAVING...")
+
+        def on_saved(pet_ids):
+            self._saving_done()
+            messagebox.showinfo("Saved", f"{required['pet'][0]} and all records added successfully!")
+
+        def on_failed(error):
+            self._saving_done()
+            # Put the records back so they can be saved again
+            for record_type, records in submitted.items():
+                self.records[record_type][:0] = records
+            messagebox.showerror("Error", str(error))
+
+        get_task_executor().watch(future, on_success=on_saved, on_error=on_failed)
+
+    def _saving_done(self):
+        if self.save_button.winfo_exists():
+            self.save_button.configure(state="normal", text="SAVE")
 
 def create_add_pet_view(parent, show_frame):
     AddPetView(parent, show_frame).parent
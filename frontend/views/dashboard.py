@@ -1,6 +1,7 @@
 import customtkinter as ctk
 from frontend.components.copyright import get_copyright_label
 from frontend.components.slideshow import Slideshow
+from frontend.view_cache import set_view_hooks
 from frontend.components.welcome_intro import create_welcome_intro
 from frontend.style.style import (
     create_label,
@@ -46,6 +47,8 @@ def create_dashboard(parent, show_frame):
     
     slideshow = Slideshow(slideshow_frame)
     slideshow.pack(expand=True, fill="both")
+    # Pause the slideshow while the dashboard is hidden in the view cache
+    set_view_hooks(parent, on_show=slideshow.start_slideshow, on_hide=slideshow.stop_slideshow)
 
     # Right column: Buttons
     button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
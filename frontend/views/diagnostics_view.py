@@ -0,0 +1,64 @@
+# File: frontend/views/diagnostics_view.py
+import os
+import time
+import customtkinter as ctk
+from tkinter import filedialog, messagebox
+from backend.services.diagnostics import collect_diagnostics, format_diagnostics, write_diagnostics
+from backend.database_handlers.query_trace import query_tracer
+from frontend.style.style import create_button, create_frame
+from frontend.task_executor import run_in_background
+
+_window = None
+
+
+def open_diagnostics_window(root):
+    """
+    Hidden maintenance window (Ctrl+Shift+D): storage settings, lock counters,
+    per-statement query timings, the slow-query log and the card render
+    timings of the running app.
+    """
+    global _window
+    if _window is not None and _window.winfo_exists():
+        _window.focus()
+        return _window
+
+    window = _window = ctk.CTkToplevel(root)
+    window.title("PetTrackr Diagnostics")
+    window.geometry("1000x640")
+
+    text = ctk.CTkTextbox(window, font=("Consolas", 12), wrap="none")
+    text.pack(fill="both", expand=True, padx=10, pady=(10, 0))
+
+    def show(report):
+        if not text.winfo_exists():
+            return
+        text.configure(state="normal")
+        text.delete("0.0", "end")
+        text.insert("0.0", format_diagnostics(report))
+        text.configure(state="disabled")
+
+    def refresh():
+        run_in_background(collect_diagnostics, on_success=show,
+                          on_error=lambda e: messagebox.showerror("Diagnostics", str(e), parent=window))
+
+    def reset():
+        query_tracer.reset()
+        refresh()
+
+    def dump():
+        path = filedialog.asksaveasfilename(
+            parent=window, defaultextension=".json", filetypes=[("JSON", "*.json")],
+            initialfile=f"pettrackr-diagnostics-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        )
+        if path:
+            run_in_background(write_diagnostics, path, on_success=lambda p: messagebox.showinfo(
+                "Diagnostics", f"Saved {os.path.basename(p)}", parent=window))
+
+    buttons = create_frame(window)
+    buttons.pack(fill="x", padx=10, pady=10)
+    create_button(buttons, text="Refresh", command=refresh, width=120).pack(side="left", padx=(0, 8))
+    create_button(buttons, text="Reset timings", command=reset, width=120).pack(side="left", padx=(0, 8))
+    create_button(buttons, text="Save dump...", command=dump, width=120).pack(side="left")
+
+    refresh()
+    return window
@@ -1,5 +1,7 @@
 import customtkinter as ctk
-from PIL import Image
+from frontend.image_cache import get_cached_image
+from backend.data.storage_config import get_image_path
+from frontend.placeholder_assets import get_placeholder_image
 import os
 from frontend.components.copyright import get_copyright_label
 from frontend.style.style import (
@@ -9,14 +11,15 @@ from frontend.style.style import (
 from backend.services.daycare_prices import compute_total_fee
 
 class PetProfileTab:
-    def __init__(self, parent, pet, owner, vet_visits, vaccinations, feeding_logs, grooming_logs, show_frame, go_back):
+    def __init__(self, parent, dossier, show_frame, go_back):
         self.parent = parent
-        self.pet = pet
-        self.owner = owner
-        self.vet_visits = vet_visits
-        self.vaccinations = vaccinations
-        self.feeding_logs = feeding_logs
-        self.grooming_logs = grooming_logs
+        self.dossier = dossier
+        self.pet = dossier.pet
+        self.owner = dossier.owner
+        self.vet_visits = dossier.vet_visits
+        self.vaccinations = dossier.vaccinations
+        self.feeding_logs = dossier.feeding_logs
+        self.grooming_logs = dossier.grooming_logs
         self.show_frame = show_frame
         self.go_back = go_back
         self._build()
@@ -70,8 +73,7 @@ class PetProfileTab:
         panel.grid_propagate(False)
         panel.configure(width=340, height=420)
 
-        img = self._get_image()
-        image_label = ctk.CTkLabel(panel, image=ctk.CTkImage(light_image=img, dark_image=img, size=(300, 300)), text="")
+        image_label = ctk.CTkLabel(panel, image=self._get_image(), text="")
         image_label.pack(pady=(20, 10))
         
         # Show message if image is missing
@@ -102,26 +104,18 @@ class PetProfileTab:
         try:
             if not self.pet.image_path:
                 raise FileNotFoundError
-            img_path = os.path.join("backend", "data", self.pet.image_path)
+            img_path = get_image_path(self.pet.image_path)
             if not os.path.exists(img_path):
                 raise FileNotFoundError
-            image = Image.open(img_path).resize((300, 300))
+            image = get_cached_image(img_path, (300, 300))
+            if image is None:
+                raise FileNotFoundError
             self._missing_image = False
             return image
         except Exception:
-            # Try to use the fallback image
-            try:
-                fallback_path = os.path.join("frontend", "assets", "no-pet-image.png")
-                if os.path.exists(fallback_path):
-                    image = Image.open(fallback_path).resize((300, 300))
-                    self._missing_image = True
-                    return image
-            except Exception:
-                pass
-            # Fallback to blank/gray image
-            image = Image.new("RGB", (300, 300), color="lightgray")
+            # Fall back to the pre-rendered no-pet image
             self._missing_image = True
-            return image
+            return get_placeholder_image((300, 300))
 
     def _content_panel(self, parent):
         scrollable_frame = ctk.CTkScrollableFrame(parent, fg_color="#f5f7fa", corner_radius=18, border_width=2, border_color="#d0d4db")
@@ -130,6 +124,14 @@ class PetProfileTab:
         content = ctk.CTkFrame(scrollable_frame, fg_color="transparent")
         content.pack(fill="both", expand=True, padx=24, pady=24)
 
+        totals = self.dossier.totals
+        create_label1(
+            content,
+            f"💰 Total spent: ₱{totals['overall']:,.2f} across {totals['record_count']} record(s)",
+            font=get_card_detail_font(),
+            justify="left"
+        ).pack(anchor="w", pady=(0, 16))
+
         self._records_section(content, "🩺 Vet Visits", self.vet_visits, self._vet_visit_item, top=0)
         self._records_section(content, "💉 Vaccinations", self.vaccinations, self._vaccine_item, top=20, empty="No vaccination records available")
         self._records_section(content, "🍖 Feeding Logs", self.feeding_logs, self._feeding_item, top=20, empty="No feeding records available")
@@ -247,10 +249,10 @@ class PetProfileTab:
         btn.pack(side="bottom", pady=16)
 
 
-def create_pet_profile_tab(parent, pet, owner, vet_visits, vaccinations, feeding_logs, grooming_logs, show_frame, go_back=None):
+def create_pet_profile_tab(parent, dossier, show_frame, go_back=None):
     """
-    Factory function to create and display a PetProfileTab.
+    Factory function to create and display a PetProfileTab from a PetDossier.
     """
-    PetProfileTab(parent, pet, owner, vet_visits, vaccinations, feeding_logs, grooming_logs, show_frame, go_back)
+    PetProfileTab(parent, dossier, show_frame, go_back)
     return parent
 
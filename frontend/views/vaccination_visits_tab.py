@@ -1,21 +1,100 @@
+import time
 import customtkinter as ctk
 from frontend.style.style import create_label, create_frame, create_back_button, get_title_font, apply_uniform_layout_style, create_styled_back_button
 from frontend.components.pet_card_with_records import PetCardWithRecords
 from backend.controllers.pet_controller import PetController
 from backend.controllers.vaccination_controller import VaccinationController
 from backend.controllers.vet_visit_controller import VetVisitController
-from backend.database_handlers.vaccinations_db_handler import VaccinationDB
-from backend.database_handlers.vet_visits_db_handler import VetVisitDB
+from backend.controllers.feeding_log_controller import FeedingLogController
+from backend.controllers.grooming_controller import GroomingLogsController
+from backend.services.pet_dossier import PetDossier
 from frontend.components.copyright import get_copyright_label
+from frontend.components.skeleton_card import show_skeleton_grid, clear_skeleton, show_load_error
+from frontend.task_executor import run_in_background
+from frontend.progressive_renderer import render_progressively
+from frontend.components.record_card_grid import RecordCardGrid
+from frontend.view_cache import set_view_hooks
 
 class VaccinationVisitsTab:
     @staticmethod
-    def filter_pets_with_records(pet_list, vaccination_records, vet_visit_records):
-        pet_ids = {rec.pet_id for rec in vaccination_records} | {rec.pet_id for rec in vet_visit_records}
-        return [pet for pet in pet_list if pet.id in pet_ids]
+    def filter_pets_with_records(pet_list, vaccinations_by_pet, vet_visits_by_pet):
+        return [pet for pet in pet_list if vaccinations_by_pet.get(pet.id) or vet_visits_by_pet.get(pet.id)]
+
+    @classmethod
+    def load_data(cls):
+        """Runs on a worker thread: one query per record type for all pets."""
+        pet_ctrl = PetController()
+        vacc_ctrl = VaccinationController()
+        vet_ctrl = VetVisitController()
+        feeding_ctrl = FeedingLogController()
+        grooming_ctrl = GroomingLogsController()
+        pets, owners = pet_ctrl.get_pets_with_owners()
+        pet_ids = [pet.id for pet in pets]
+        vaccinations_by_pet = vacc_ctrl.get_by_pet_ids(pet_ids)
+        vet_visits_by_pet = vet_ctrl.get_by_pet_ids(pet_ids)
+
+        pets_with_records = cls.filter_pets_with_records(pets, vaccinations_by_pet, vet_visits_by_pet)
+        record_pet_ids = [pet.id for pet in pets_with_records]
+        return {
+            "pets": pets_with_records,
+            "owner_lookup": {owner.id: owner for owner in owners if owner},
+            "vaccinations_by_pet": vaccinations_by_pet,
+            "vet_visits_by_pet": vet_visits_by_pet,
+            "feeding_logs_by_pet": feeding_ctrl.get_by_pet_ids(record_pet_ids) if record_pet_ids else {},
+            "grooming_logs_by_pet": grooming_ctrl.get_grooming_logs_for_pets(record_pet_ids) if record_pet_ids else {},
+        }
+
+    @staticmethod
+    def make_card(scrollable_frame, dossier, image_store, show_frame):
+        return PetCardWithRecords(
+            scrollable_frame, dossier.pet, image_store, owner=dossier.owner,
+            on_click=lambda pet: show_frame("pet_profile", pet=pet, owner=dossier.owner, dossier=dossier),
+            vaccinations=dossier.vaccinations,
+            vet_visits=dossier.vet_visits
+        )
+
+    @staticmethod
+    def populate(scrollable_frame, data, image_store, show_frame, started_at=None):
+        """
+        Builds the pet cards on the main thread, in time-sliced chunks, from ``load_data`` results.
+
+        Returns the RecordCardGrid holding the cards, whose ``handle_changes`` patches them later.
+        """
+        pets_with_records = data["pets"]
+        owner_lookup = data["owner_lookup"]
+        vaccinations_by_pet = data["vaccinations_by_pet"]
+        vet_visits_by_pet = data["vet_visits_by_pet"]
+        feeding_logs_by_pet = data["feeding_logs_by_pet"]
+        grooming_logs_by_pet = data["grooming_logs_by_pet"]
+
+        cards = RecordCardGrid(
+            scrollable_frame,
+            make_card=lambda dossier: VaccinationVisitsTab.make_card(scrollable_frame, dossier, image_store, show_frame),
+            qualifies=lambda dossier: bool(dossier.vaccinations or dossier.vet_visits),
+            empty_text="No pets with vaccination or vet visit records.",
+            group="vaccination_visits"
+        )
+        if not pets_with_records:
+            cards.show_empty()
+            return cards
+
+        def build_card(idx, pet):
+            cards.add(PetDossier(
+                pet,
+                owner_lookup.get(pet.owner_id),
+                vet_visits_by_pet.get(pet.id, []),
+                vaccinations_by_pet.get(pet.id, []),
+                feeding_logs_by_pet.get(pet.id, []),
+                grooming_logs_by_pet.get(pet.id, [])
+            ))
+
+        render_progressively(scrollable_frame, pets_with_records, build_card, name="vaccination_visits", started_at=started_at)
+        return cards
 
     @classmethod
     def create(cls, parent, show_frame):
+        started_at = time.perf_counter()
+
         # Clear existing widgets
         [w.destroy() for w in parent.winfo_children()]
 
@@ -62,47 +141,23 @@ class VaccinationVisitsTab:
         canvas.pack(side="left", fill="both", expand=True, padx=(0, 4))
         scrollbar.pack(side="right", fill="y", padx=(0, 8))
 
-        # Fetch data here
-        pet_ctrl = PetController()
-        vacc_ctrl = VaccinationController()
-        vet_ctrl = VetVisitController()
-        pets, owners = pet_ctrl.get_pets_with_owners()
-        vacc_db = VaccinationDB()
-        vet_db = VetVisitDB()
-        vaccinations = vacc_db.get_all()
-        vet_visits = vet_db.get_all()
-        image_store = []  # Or fetch as needed
-        owner_lookup = {owner.id: owner for owner in owners if owner}
-
-        pets_with_records = cls.filter_pets_with_records(pets, vaccinations, vet_visits)
-
-        if not pets_with_records:
-            create_label(scrollable_frame, "No pets with vaccination or vet visit records.").pack(pady=40)
-        else:
-            for idx, pet in enumerate(pets_with_records):
-                owner = owner_lookup.get(pet.owner_id)
-                vet_visits = vet_ctrl.get_by_pet_id(pet.id)
-                vaccinations = vacc_ctrl.get_by_pet_id(pet.id)
-                from backend.controllers.feeding_log_controller import FeedingLogController
-                from backend.controllers.grooming_controller import GroomingLogsController
-                feeding_logs = FeedingLogController().get_by_pet_id(pet.id)
-                grooming_logs = GroomingLogsController().get_grooming_logs_for_pet(pet.id)
-                card = PetCardWithRecords(
-                    scrollable_frame, pet, image_store, owner=owner,
-                    on_click=lambda pet=pet, owner=owner, vet_visits=vet_visits, vaccinations=vaccinations, feeding_logs=feeding_logs, grooming_logs=grooming_logs:
-                        show_frame(
-                            "pet_profile",
-                            pet=pet,
-                            owner=owner,
-                            vet_visits=vet_visits,
-                            vaccinations=vaccinations,
-                            feeding_logs=feeding_logs,
-                            grooming_logs=grooming_logs
-                        )
-                )
-                row, col = divmod(idx, 3)
-                card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
-                scrollable_frame.rowconfigure(row, weight=1)
+        # Show placeholders now; the queries run on a worker thread
+        image_store = []
+        skeleton = show_skeleton_grid(scrollable_frame, columns=3)
+
+        def populate(data):
+            if not scrollable_frame.winfo_exists():
+                return
+            clear_skeleton(skeleton)
+            cards = cls.populate(scrollable_frame, data, image_store, show_frame, started_at)
+            set_view_hooks(parent, on_change=cards.handle_changes)
+
+        run_in_background(
+            cls.load_data,
+            on_success=populate,
+            on_error=lambda e: show_load_error(scrollable_frame, skeleton, 3, e),
+            group="vaccination_visits"
+        )
 
         # Create a styled back button
         btn_wrapper = create_frame(main_frame, fg_color="transparent")
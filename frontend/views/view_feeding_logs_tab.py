@@ -1,14 +1,44 @@
+import time
 import customtkinter as ctk
 from backend.controllers.pet_controller import PetController
+from backend.services.pet_dossier import PetDossier
 from backend.controllers.vaccination_controller import VaccinationController
 from backend.controllers.vet_visit_controller import VetVisitController
 from backend.controllers.feeding_log_controller import FeedingLogController
 from backend.controllers.grooming_controller import GroomingLogsController
 from frontend.components.pet_card_with_feeding_logs import PetCardWithFeedingLogs
 from frontend.components.copyright import get_copyright_label
+from frontend.components.skeleton_card import show_skeleton_grid, clear_skeleton, show_load_error
+from frontend.task_executor import run_in_background
+from frontend.progressive_renderer import render_progressively
+from frontend.components.record_card_grid import RecordCardGrid
+from frontend.view_cache import set_view_hooks
 from frontend.style.style import create_label, create_frame, get_title_font, apply_uniform_layout_style, create_styled_back_button
 
+def load_feeding_logs_data():
+    """Runs on a worker thread: pets with feeding logs and all their records."""
+    pet_controller = PetController()
+    vacc_ctrl = VaccinationController()
+    vet_ctrl = VetVisitController()
+    feeding_ctrl = FeedingLogController()
+    grooming_ctrl = GroomingLogsController()
+
+    pets, owners = pet_controller.get_pets_with_feeding_logs()
+
+    # One query per record type for every listed pet
+    pet_ids = [pet.id for pet in pets]
+    return {
+        "pets": pets,
+        "owner_lookup": {owner.id: owner for owner in owners if owner},
+        "vet_visits_by_pet": vet_ctrl.get_by_pet_ids(pet_ids),
+        "vaccinations_by_pet": vacc_ctrl.get_by_pet_ids(pet_ids),
+        "feeding_logs_by_pet": feeding_ctrl.get_by_pet_ids(pet_ids),
+        "grooming_logs_by_pet": grooming_ctrl.get_grooming_logs_for_pets(pet_ids),
+    }
+
 def create_view_feeding_logs_tab(master, show_frame):
+    started_at = time.perf_counter()
+
     # Clear the master frame
     [w.destroy() for w in master.winfo_children()]
 
@@ -55,46 +85,57 @@ def create_view_feeding_logs_tab(master, show_frame):
     canvas.pack(side="left", fill="both", expand=True, padx=(0, 4))
     scrollbar.pack(side="right", fill="y", padx=(0, 8))
 
-    # Fetch all data
-    pet_controller = PetController()
-    vacc_ctrl = VaccinationController()
-    vet_ctrl = VetVisitController()
-    feeding_ctrl = FeedingLogController()
-    grooming_ctrl = GroomingLogsController()
-
-    pets, owners = pet_controller.get_pets_with_feeding_logs()
+    # Show placeholders now; the queries run on a worker thread
     image_store = []
-    owner_lookup = {owner.id: owner for owner in owners if owner}
-
-    if not pets:
-        no_pets_label = create_label(scrollable_frame, "No pets with feeding logs found.")
-        no_pets_label.grid(row=0, column=0, pady=40)
-    else:
-        for idx, pet in enumerate(pets):
-            owner = owner_lookup.get(pet.owner_id)
-            vet_visits = vet_ctrl.get_by_pet_id(pet.id)
-            vaccinations = vacc_ctrl.get_by_pet_id(pet.id)
-            feeding_logs = feeding_ctrl.get_by_pet_id(pet.id)
-            grooming_logs = grooming_ctrl.get_grooming_logs_for_pet(pet.id)
-            def on_card_click(
-                pet=pet, owner=owner, vet_visits=vet_visits, vaccinations=vaccinations,
-                feeding_logs=feeding_logs, grooming_logs=grooming_logs
-            ):
-                show_frame(
-                    "pet_profile",
-                    pet=pet,
-                    owner=owner,
-                    vet_visits=vet_visits,
-                    vaccinations=vaccinations,
-                    feeding_logs=feeding_logs,
-                    grooming_logs=grooming_logs
-                )
-            card = PetCardWithFeedingLogs(
-                scrollable_frame, pet, image_store, owner=owner, on_click=on_card_click
+    skeleton = show_skeleton_grid(scrollable_frame, columns=3)
+
+    def populate(data):
+        if not scrollable_frame.winfo_exists():
+            return
+        clear_skeleton(skeleton)
+        pets = data["pets"]
+        owner_lookup = data["owner_lookup"]
+        vet_visits_by_pet = data["vet_visits_by_pet"]
+        vaccinations_by_pet = data["vaccinations_by_pet"]
+        feeding_logs_by_pet = data["feeding_logs_by_pet"]
+        grooming_logs_by_pet = data["grooming_logs_by_pet"]
+
+        def make_card(dossier):
+            return PetCardWithFeedingLogs(
+                scrollable_frame, dossier.pet, image_store, owner=dossier.owner,
+                on_click=lambda pet: show_frame("pet_profile", pet=pet, owner=dossier.owner, dossier=dossier),
+                feeding_logs=dossier.feeding_logs
             )
-            row, col = divmod(idx, 3)
-            card.grid(row=row, column=col, padx=12, pady=12, sticky="nsew")
-            scrollable_frame.rowconfigure(row, weight=1)
+
+        cards = RecordCardGrid(
+            scrollable_frame, make_card,
+            qualifies=lambda dossier: bool(dossier.feeding_logs),
+            empty_text="No pets with feeding logs found.",
+            group="view_feeding_logs"
+        )
+        set_view_hooks(master, on_change=cards.handle_changes)
+
+        if not pets:
+            cards.show_empty()
+        else:
+            def build_card(idx, pet):
+                cards.add(PetDossier(
+                    pet,
+                    owner_lookup.get(pet.owner_id),
+                    vet_visits_by_pet.get(pet.id, []),
+                    vaccinations_by_pet.get(pet.id, []),
+                    feeding_logs_by_pet.get(pet.id, []),
+                    grooming_logs_by_pet.get(pet.id, [])
+                ))
+
+            render_progressively(scrollable_frame, pets, build_card, name="view_feeding_logs", started_at=started_at)
+
+    run_in_background(
+        load_feeding_logs_data,
+        on_success=populate,
+        on_error=lambda e: show_load_error(scrollable_frame, skeleton, 3, e),
+        group="view_feeding_logs"
+    )
 
     # Create a styled back button
     btn_wrapper = create_frame(main_frame, fg_color="transparent")
@@ -16,9 +16,15 @@ def install_requirements():
 
 def run_pettrackr():
     """Launch the PetTrackr application."""
+    from backend.data.migrations import initialize_databases
     from frontend.gui import launch_gui
 
     print("🐾 Starting PetTrackr...")
+    try:
+        initialize_databases()
+    except RuntimeError as e:
+        print(f"❌ Failed to open the databases: {e}")
+        sys.exit(1)
     launch_gui()
 
 if __name__ == "__main__":
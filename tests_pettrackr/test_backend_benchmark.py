@@ -0,0 +1,48 @@
+# File: tests_pettrackr/test_backend_benchmark.py
+# Smoke test of the benchmark suite on the tiny dataset.
+# Run with: python -m pytest tests_pettrackr/test_backend_benchmark.py
+import sqlite3
+
+from benchmarks import backend_benchmark
+from benchmarks.bench_utils import compare_to_baseline, load_json
+from benchmarks.synthetic_data import SyntheticDataset
+
+
+def _rows(dataset, db_name, table):
+    with sqlite3.connect(dataset.config.db_path(db_name)) as conn:
+        return conn.execute(f"SELECT * FROM {table} ORDER BY id").fetchall()
+
+
+def test_generator_is_reproducible():
+    with SyntheticDataset(5, 20, 200, seed=7) as first:
+        pets, grooming = _rows(first, "pets", "pets"), _rows(first, "grooming_logs", "grooming_logs")
+        counts = first.describe()["rows"]
+    with SyntheticDataset(5, 20, 200, seed=7) as second:
+        assert _rows(second, "pets", "pets") == pets
+        # groom_date defaults to the insert time, so compare the generated columns
+        assert [row[:2] + row[3:] for row in _rows(second, "grooming_logs", "grooming_logs")] == \
+               [row[:2] + row[3:] for row in grooming]
+    assert counts == {"owners": 5, "pets": 20, "vaccinations": 60, "vet_visits": 60,
+                      "feeding_logs": 40, "grooming_logs": 40}
+
+
+def test_benchmark_run_and_baseline(tmp_path):
+    baseline = str(tmp_path / "baseline.json")
+    args = ["--volume", "tiny", "--repeat", "1", "--sample", "10", "--saves", "2", "--baseline", baseline]
+    assert backend_benchmark.main(args + ["--save-baseline"]) == 0
+    report = load_json(baseline)
+    assert report["dataset"]["rows"]["pets"] == 100
+    assert {"get_pets_with_owners", "per_pet.dossier", "save_pet", "save_pet.write_queue",
+            "export_pets_txt", "import_pets_txt"} <= set(report["results"])
+    # The same code against its own baseline, with room for a noisy machine
+    assert backend_benchmark.main(args + ["--tolerance", "100"]) == 0
+
+
+def test_regressions_are_flagged():
+    baseline = {"fast": {"min_ms": 10.0}, "noisy": {"min_ms": 0.5}, "gone": {"min_ms": 1.0}}
+    results = {"fast": {"min_ms": 20.0}, "noisy": {"min_ms": 1.5}, "new": {"min_ms": 3.0}}
+    comparison = {entry["name"]: entry for entry in compare_to_baseline(results, baseline, tolerance=0.25)}
+    assert set(comparison) == {"fast", "noisy"}
+    assert comparison["fast"]["regression"]
+    # Tripled, but by less than the noise floor
+    assert not comparison["noisy"]["regression"]
@@ -0,0 +1,100 @@
+# File: tests_pettrackr/test_concurrent_writes.py
+# Several processes writing to one data directory at once, like two front-desk
+# machines on a shared folder. Run with: python -m pytest tests_pettrackr/test_concurrent_writes.py
+import multiprocessing
+import sqlite3
+
+import pytest
+
+from backend.data import storage_config
+from backend.data.migrations import initialize_databases
+
+WORKERS = 4
+ROUNDS = 25
+
+
+def _hammer(data_dir: str, layout: str, profile: str, worker: int) -> dict:
+    """Worker process: every kind of write the app makes, ROUNDS times."""
+    storage_config.configure(data_dir=data_dir, layout=layout, profile=profile)
+    # Imported after configure() so the handlers pick up the temporary files
+    from backend.controllers.pet_controller import PetController
+    from backend.controllers.grooming_controller import GroomingLogsController
+    from backend.database_handlers.vaccinations_db_handler import VaccinationDB
+    from backend.database_handlers.vet_visits_db_handler import VetVisitDB
+    from backend.database_handlers.write_retry import get_lock_stats
+    from backend.models.pet import Pet, Owner
+    from backend.models.vaccination import Vaccination
+    from backend.models.vet_visit import VetVisit
+
+    pets, vaccinations, visits, grooming = PetController(), VaccinationDB(), VetVisitDB(), GroomingLogsController()
+    pet_ids = []
+    for i in range(ROUNDS):
+        pet_id = pets.add_pet_with_owner(
+            Pet(id=None, name=f"Pet {worker}-{i}", breed="Mixed", birthdate="2020-01-01"),
+            Owner(id=None, name=f"Owner {worker}", contact_number=f"0917{worker:07d}", address="Clinic"),
+        )
+        pet_ids.append(pet_id)
+        vaccinations.insert(Vaccination(pet_id, "Rabies", "2024-01-01", "2025-01-01", 500))
+        visits.insert_many([VetVisit(pet_id, "2024-02-01", "Checkup"), VetVisit(pet_id, "2024-03-01", "Follow-up")])
+        grooming.add_grooming_log(pet_id, "basic", f"Groomer {worker}")
+
+        unit = pets.unit_of_work()
+        staged = unit.add_pet(Pet(id=None, name=f"Unit {worker}-{i}", breed="Mixed", birthdate="2021-01-01"),
+                              Owner(id=None, name=f"Owner {worker}", contact_number=f"0917{worker:07d}",
+                                    address="Clinic"))
+        unit.add_records("feeding_logs", [{"start_date": "2024-04-01", "num_days": 3}], staged)
+        unit.add_records("grooming_logs", [{"groom_type": "premium", "groomer_name": "Unit"}], staged)
+        pet_ids.extend(unit.commit())
+    return {"pet_ids": pet_ids, "locks": get_lock_stats()}
+
+
+def _count(path: str, table: str) -> int:
+    with sqlite3.connect(path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+@pytest.mark.parametrize("layout,profile", [
+    ("split", "balanced"),
+    ("split", "durable"),
+    ("single", "balanced"),
+])
+def test_concurrent_writers_lose_nothing(tmp_path, layout, profile):
+    data_dir = str(tmp_path)
+    config = storage_config.configure(data_dir=data_dir, layout=layout, profile=profile)
+    try:
+        initialize_databases(verbose=False)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(WORKERS) as pool:
+            results = pool.starmap(_hammer, [(data_dir, layout, profile, w) for w in range(WORKERS)])
+    finally:
+        storage_config.configure()
+
+    pet_ids = [pet_id for result in results for pet_id in result["pet_ids"]]
+    expected_pets = WORKERS * ROUNDS * 2
+    assert len(pet_ids) == len(set(pet_ids)) == expected_pets
+    assert _count(config.db_path("pets"), "pets") == expected_pets
+    assert _count(config.db_path("pets"), "owner") == WORKERS
+    assert _count(config.db_path("vaccinations"), "vaccinations") == WORKERS * ROUNDS
+    assert _count(config.db_path("vet_visits"), "vet_visits") == WORKERS * ROUNDS * 2
+    assert _count(config.db_path("feeding_logs"), "daycare_enrollments") == WORKERS * ROUNDS
+    assert _count(config.db_path("grooming_logs"), "grooming_logs") == WORKERS * ROUNDS * 2
+
+    # Every write went through the retry layer and none gave up
+    assert all(result["locks"]["failures"] == 0 for result in results)
+    assert sum(result["locks"]["transactions"] for result in results) == WORKERS * ROUNDS * 5
+
+
+def test_journal_mode_switch_fails_while_another_process_has_the_file(tmp_path):
+    try:
+        config = storage_config.configure(data_dir=str(tmp_path), profile="balanced")
+        initialize_databases(verbose=False)
+        # Another front desk still has pets.db open in WAL mode
+        other = sqlite3.connect(config.db_path("pets"), timeout=0.1)
+        other.execute("SELECT COUNT(*) FROM pets").fetchone()
+        durable = storage_config.StorageConfig(data_dir=str(tmp_path), profile="durable")
+        with sqlite3.connect(config.db_path("pets"), timeout=0.1) as conn:
+            with pytest.raises(RuntimeError, match="journal_mode"):
+                storage_config.apply_storage_profile(conn, durable)
+        other.close()
+    finally:
+        storage_config.configure()
@@ -0,0 +1,38 @@
+# File: tests_pettrackr/test_consolidate_databases.py
+# Consolidating the split database files into one keeps ids and AUTOINCREMENT counters.
+# Run with: python -m pytest tests_pettrackr/test_consolidate_databases.py
+import sqlite3
+
+from backend.data.consolidate_databases import consolidate_databases
+from backend.database_handlers.connection_manager import close_all_connections
+from benchmarks.synthetic_data import SyntheticDataset
+
+
+def test_deleted_ids_are_not_reused_after_consolidating(tmp_path):
+    with SyntheticDataset(2, 10, 40, seed=5) as dataset:
+        sources = dataset.config.file_paths()
+        close_all_connections()
+        # Drop the newest pets and vaccinations, so each counter is ahead of max(id)
+        with sqlite3.connect(sources["vaccinations"]) as conn:
+            last_vaccination = conn.execute("SELECT MAX(id) FROM vaccinations").fetchone()[0]
+            conn.execute("DELETE FROM vaccinations WHERE id > ? OR pet_id > 7", (last_vaccination - 2,))
+        for name in ("vet_visits", "feeding_logs", "grooming_logs"):
+            table = {"feeding_logs": "daycare_enrollments"}.get(name, name)
+            with sqlite3.connect(sources[name]) as conn:
+                conn.execute(f"DELETE FROM {table} WHERE pet_id > 7")
+        with sqlite3.connect(sources["pets"]) as conn:
+            conn.execute("DELETE FROM pets WHERE id > 7")
+
+        result = consolidate_databases(sources, str(tmp_path / "pettrackr.db"))
+        assert result["copied"]["pets"] == 7
+        assert not result["foreign_key_violations"]
+
+        with sqlite3.connect(result["target_path"]) as conn:
+            counters = conn.execute("SELECT name, seq FROM sqlite_sequence ORDER BY name").fetchall()
+            names = [name for name, _ in counters]
+            assert len(names) == len(set(names))
+            assert dict(counters)["pets"] == 10
+            assert dict(counters)["vaccinations"] == last_vaccination
+            new_id = conn.execute("INSERT INTO pets (name, breed, birthdate, owner_id) "
+                                  "VALUES ('New', 'Aspin', '2024-01-01', 1) RETURNING id").fetchone()[0]
+            assert new_id == 11
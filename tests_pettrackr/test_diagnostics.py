@@ -0,0 +1,27 @@
+# File: tests_pettrackr/test_diagnostics.py
+# Report sections the frontend registers with the diagnostics report.
+# Run with: python -m pytest tests_pettrackr/test_diagnostics.py
+from backend.services.diagnostics import collect_diagnostics, format_diagnostics
+from benchmarks.synthetic_data import SyntheticDataset
+
+
+def test_render_timings_are_reported():
+    from frontend.progressive_renderer import render_timings
+    render_timings["vaccination_visits"] = {"items": 40, "chunks": 3, "budget_ms": 12.0,
+                                            "time_to_first_ms": 8.5, "time_to_last_ms": 61.25}
+    try:
+        with SyntheticDataset(1, 2, 4):
+            report = collect_diagnostics()
+        assert report["render_timings"]["vaccination_visits"]["items"] == 40
+        assert "vaccination_visits: first card 8.5 ms, last card 61.2 ms (40 cards, 3 chunks)" \
+            in format_diagnostics(report)
+    finally:
+        render_timings.pop("vaccination_visits", None)
+
+
+def test_image_cache_counters_are_reported():
+    from frontend.image_cache import image_cache
+    with SyntheticDataset(1, 2, 4):
+        report = collect_diagnostics()
+    assert report["image_cache"] == image_cache.stats()
+    assert f"{report['image_cache']['evictions']} evictions" in format_diagnostics(report)
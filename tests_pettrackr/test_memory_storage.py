@@ -0,0 +1,111 @@
+# File: tests_pettrackr/test_memory_storage.py
+# In-memory storage mode: data lives in RAM and survives through the snapshot files.
+# Run with: python -m pytest tests_pettrackr/test_memory_storage.py
+import os
+import sqlite3
+import threading
+
+import pytest
+
+from backend.data import storage_config
+from backend.data.memory_store import get_memory_store, stop_memory_store
+from backend.data.migrations import initialize_databases
+from backend.database_handlers.connection_manager import close_all_connections
+from backend.models.pet import Pet, Owner
+
+
+@pytest.fixture
+def memory_storage(tmp_path):
+    def start(**kwargs):
+        close_all_connections()
+        config = storage_config.configure(data_dir=str(tmp_path), mode=storage_config.MODE_MEMORY,
+                                          snapshot_seconds=0, **kwargs)
+        initialize_databases(verbose=False)
+        return config
+    yield start
+    close_all_connections()
+    stop_memory_store(snapshot=False)
+    storage_config.configure()
+
+
+def _add_pet(i):
+    from backend.controllers.pet_controller import PetController
+    from backend.controllers.vaccination_controller import VaccinationController
+    pet_id = PetController().add_pet_with_owner(Pet(0, f"Pet {i}", "Aspin", "2020-01-01"),
+                                                Owner(0, f"Owner {i}", f"0917{i:07d}", "Somewhere"))
+    VaccinationController().create({"pet_id": pet_id, "vaccine_name": "Rabies",
+                                    "date_administered": "2024-01-01", "next_due": "2025-01-01"})
+    return pet_id
+
+
+@pytest.mark.parametrize("layout", [storage_config.LAYOUT_SPLIT, storage_config.LAYOUT_SINGLE])
+def test_data_survives_a_restart_through_snapshots(memory_storage, layout):
+    config = memory_storage(layout=layout)
+    assert all(path.startswith("file:") for path in config.db_paths().values())
+    pet_id = _add_pet(1)
+    # Nothing reaches the files until a snapshot is taken
+    assert not os.path.exists(config.file_path("pets"))
+    close_all_connections()
+    stop_memory_store()
+
+    with sqlite3.connect(config.file_path("vaccinations")) as conn:
+        assert conn.execute("SELECT pet_id FROM vaccinations").fetchall() == [(pet_id,)]
+
+    memory_storage(layout=layout)
+    from backend.controllers.pet_controller import PetController
+    pets, owners = PetController().get_pets_with_owners()
+    assert [(pet.id, owner.name) for pet, owner in zip(pets, owners)] == [(pet_id, "Owner 1")]
+
+
+def test_concurrent_writers_and_snapshots(memory_storage):
+    config = memory_storage()
+    errors = []
+
+    def worker(first):
+        try:
+            for i in range(first, first + 20):
+                _add_pet(i)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(n * 100,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        assert get_memory_store().snapshot()
+    for thread in threads:
+        thread.join()
+    assert not errors
+    get_memory_store().snapshot()
+    with sqlite3.connect(config.file_path("pets")) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM pets").fetchone() == (80,)
+
+
+def test_saved_photos_resolve_under_the_configured_data_dir(memory_storage, tmp_path):
+    from PIL import Image
+    from backend.controllers.pet_controller import PetController
+    from backend.data.storage_config import get_image_path
+    memory_storage()
+    source = tmp_path / "upload.png"
+    Image.new("RGB", (8, 8)).save(source)
+    controller = PetController()
+    pet_id = controller.add_pet_with_owner(Pet(0, "Photo", "Aspin", "2020-01-01"),
+                                           Owner(0, "Owner", "09170000000", "Somewhere"), str(source))
+    pet, _ = controller.get_pet_by_id(pet_id)
+    assert not os.path.isabs(pet.image_path)
+    assert os.path.isfile(get_image_path(pet.image_path))
+    assert get_image_path(pet.image_path).startswith(str(tmp_path))
+
+
+def test_query_cache_watches_the_in_memory_databases(memory_storage, tmp_path, monkeypatch):
+    from backend.services.query_cache import QueryCache
+    config = memory_storage()
+    monkeypatch.chdir(tmp_path)
+    cache = QueryCache()
+    try:
+        cache._read_version(config.db_path("pets"))
+        # Opened as a URI, not as a file named after it
+        assert not [name for name in os.listdir(tmp_path) if name.startswith("file:")]
+        assert cache._watchers[config.db_path("pets")].execute("SELECT COUNT(*) FROM pets").fetchone() == (0,)
+    finally:
+        cache.close()
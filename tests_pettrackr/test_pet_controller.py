@@ -65,36 +65,56 @@ class PetTrackrCLI:
         except Exception as e:
             print(f"❌ Error saving pet: {e}")
 
-    def list_pets(self, pets=None, owners=None, title="📋 All Pets with Owners"):
-        if pets is None or owners is None:
-            pets, owners = self.controller.get_pets_with_owners()
+    def _pet_pages(self, pets=None, owners=None, page_size=20):
+        """Yields pages of (pet, owner) pairs; from the database, one query per page, unless pets are given."""
+        if pets is not None and owners is not None:
+            pairs = list(zip(pets, owners))
+            for start in range(0, len(pairs), page_size):
+                yield pairs[start:start + page_size], start + page_size >= len(pairs)
+            return
+        after_id = None
+        while True:
+            # One extra pet tells whether another page follows
+            page_pets, page_owners = self.controller.page_pets(after_id, page_size + 1)
+            page = list(zip(page_pets, page_owners))[:page_size]
+            yield page, len(page_pets) <= page_size
+            if len(page_pets) <= page_size:
+                return
+            after_id = page[-1][0].id
 
+    def list_pets(self, pets=None, owners=None, title="📋 All Pets with Owners", page_size=20):
         print(f"\n{title}:")
         try:
-            if not pets:
-                print("No pets found in database")
-                return
-
-            for i, (pet, owner) in enumerate(zip(pets, owners), 1):
-                print(f"\n{i}. {pet}\n   Owner: {owner if owner else 'No owner information'}")
-
-            while True:
-                choice = input("\nEnter pet number to view profile (or 'back' to return): ").strip().lower()
-                if choice == 'back':
+            shown = 0
+            for page, last in self._pet_pages(pets, owners, page_size):
+                if not page and not shown:
+                    print("No pets found in database")
                     return
 
-                try:
-                    idx = int(choice) - 1
-                    if 0 <= idx < len(pets):
-                        self.view_pet_profile(pets[idx].id)
+                for i, (pet, owner) in enumerate(page, shown + 1):
+                    print(f"\n{i}. {pet}\n   Owner: {owner if owner else 'No owner information'}")
+
+                more = "" if last else "'n' for the next page, "
+                while True:
+                    choice = input(f"\nEnter pet number to view profile (or {more}'back' to return): ").strip().lower()
+                    if choice == 'back':
                         return
-                    print("❌ Invalid pet number")
-                except ValueError:
-                    print("❌ Please enter a valid number or 'back'")
+                    if choice == 'n' and not last:
+                        break
+
+                    try:
+                        idx = int(choice) - 1 - shown
+                        if 0 <= idx < len(page):
+                            self.view_pet_profile(page[idx][0].id)
+                            return
+                        print("❌ Invalid pet number (only this page's pets can be chosen)")
+                    except ValueError:
+                        print("❌ Please enter a valid number or 'back'")
+                shown += len(page)
         except Exception as e:
             print(f"❌ Error retrieving pets: {e}")
 
-    def _add_vet_visit(self, pet_id):
+    def _prompt_vet_visit(self, pet_id):
         print("\n🩺 Add Vet Visit")
 
         VET_VISIT_REASONS = {
@@ -130,11 +150,9 @@ class PetTrackrCLI:
             cost=cost
         )
 
-        data = vet_visit.to_dict()
-        self.vet_visit_controller.create(data)
-        print("✅ Vet Visit saved.")
+        return vet_visit.to_dict()
 
-    def _add_vaccination(self, pet_id):
+    def _prompt_vaccination(self, pet_id):
         print("\n💉 Add Vaccination")
 
         predefined_vaccines = {
@@ -164,11 +182,9 @@ class PetTrackrCLI:
 
         data = vax.to_dict()
         data.pop("is_due", None)
+        return data
 
-        self.vaccination_controller.create(data)
-        print("✅ Vaccination saved.")
-
-    def _add_feeding_log(self, pet_id):
+    def _prompt_feeding_log(self, pet_id):
         print("\n🍖 Add Feeding Log")
         data = {
             "pet_id": pet_id,
@@ -178,10 +194,9 @@ class PetTrackrCLI:
             "feed_twice": input("Feed Twice Daily? (y/n): ").lower() == 'y',
             "feed_thrice": input("Feed Thrice Daily? (y/n): ").lower() == 'y'
         }
-        self.feeding_log_controller.create(data)
-        print("✅ Feeding Log saved.")
+        return data
 
-    def _add_grooming_log(self, pet_id):
+    def _prompt_grooming_log(self, pet_id):
         print("\n✂️ Add Grooming Log")
         groom_types = {
             '1': ('basic', 1000),
@@ -199,17 +214,35 @@ class PetTrackrCLI:
             groom_choice = '1'
 
         groom_type, price = groom_types[groom_choice]
-        groomer_name = input("Groomer Name: ")
-        notes = input("Notes (optional): ")
+        return {
+            "pet_id": pet_id,
+            "groom_type": groom_type,
+            "groomer_name": input("Groomer Name: "),
+            "notes": input("Notes (optional): ")
+        }
 
-        inserted_id = self.grooming_controller.add_grooming_log(
-            pet_id=pet_id,
-            groom_type=groom_type,
-            groomer_name=groomer_name,
-            notes=notes,
-            price=price
-        )
-        print(f"✅ Grooming Log saved with ID: {inserted_id}")
+    def _add_records(self, pet_id, label, prompt, save_many):
+        """Prompts for one or more records, then saves them all in one transaction."""
+        records = []
+        while True:
+            records.append(prompt(pet_id))
+            if input(f"Add another {label}? (y/n): ").strip().lower() != 'y':
+                break
+        inserted_ids = save_many(records)
+        print(f"✅ {len(inserted_ids)} {label}(s) saved with ID(s): {', '.join(map(str, inserted_ids))}")
+        return inserted_ids
+
+    def _add_vet_visit(self, pet_id):
+        return self._add_records(pet_id, "Vet Visit", self._prompt_vet_visit, self.vet_visit_controller.create_many)
+
+    def _add_vaccination(self, pet_id):
+        return self._add_records(pet_id, "Vaccination", self._prompt_vaccination, self.vaccination_controller.create_many)
+
+    def _add_feeding_log(self, pet_id):
+        return self._add_records(pet_id, "Feeding Log", self._prompt_feeding_log, self.feeding_log_controller.create_many)
+
+    def _add_grooming_log(self, pet_id):
+        return self._add_records(pet_id, "Grooming Log", self._prompt_grooming_log, self.grooming_controller.insert_many)
 
 
     def view_pet_profile(self, pet_id):
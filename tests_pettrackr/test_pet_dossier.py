@@ -0,0 +1,22 @@
+# File: tests_pettrackr/test_pet_dossier.py
+# Batched dossier loads return what the per-pet load returns.
+# Run with: python -m pytest tests_pettrackr/test_pet_dossier.py
+from backend.services.pet_dossier import PetDossier
+from benchmarks.synthetic_data import SyntheticDataset
+
+
+def _summary(dossier):
+    return (dossier.pet.id, dossier.owner.id, dossier.totals,
+            [vars(r) for name in ("vet_visits", "vaccinations", "feeding_logs", "grooming_logs")
+             for r in getattr(dossier, name)])
+
+
+def test_load_many_matches_load():
+    with SyntheticDataset(4, 30, 300, seed=9):
+        pet_ids = [3, 1, 17, 30, 999, 3]
+        dossiers = PetDossier.load_many(pet_ids)
+        assert list(dossiers) == [3, 1, 17, 30, 999]
+        assert dossiers[999] is None
+        for pet_id in (1, 3, 17, 30):
+            assert _summary(dossiers[pet_id]) == _summary(PetDossier.load(pet_id))
+        assert PetDossier.load_many([998]) == {998: None}
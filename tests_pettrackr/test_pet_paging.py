@@ -0,0 +1,56 @@
+# File: tests_pettrackr/test_pet_paging.py
+# Keyset pages and the streaming pet listing against a small synthetic dataset.
+# Run with: python -m pytest tests_pettrackr/test_pet_paging.py
+import pytest
+
+from benchmarks.synthetic_data import SyntheticDataset
+
+
+@pytest.fixture(scope="module")
+def controller():
+    with SyntheticDataset(10, 230, 0, seed=11):
+        from backend.controllers.pet_controller import PetController
+        yield PetController()
+
+
+def _walk(controller, sort, limit):
+    pairs, after_id = [], None
+    while True:
+        pets, owners = controller.page_pets(after_id, limit, sort)
+        pairs += zip(pets, owners)
+        if len(pets) < limit:
+            return pairs
+        after_id = pets[-1].id
+
+
+def test_pages_by_id_match_the_full_listing(controller):
+    pets, owners = controller.get_pets_with_owners()
+    expected = [(pet.id, owner.id) for pet, owner in zip(pets, owners)]
+    assert [(pet.id, owner.id) for pet, owner in _walk(controller, "id", 17)] == expected
+    assert [(pet.id, owner.id) for pet, owner in controller.iter_pets_with_owners(batch_size=50)] == expected
+    assert controller.count_pets() == len(expected)
+
+
+def test_pages_by_name_cover_every_pet_once(controller):
+    # Only 20 distinct names, so most pages start in the middle of a run of equal names
+    pets = [pet for pet, _ in _walk(controller, "name", 9)]
+    assert len({pet.id for pet in pets}) == 230
+    assert [(pet.name.lower(), pet.id) for pet in pets] == sorted((pet.name.lower(), pet.id) for pet in pets)
+    assert [pet.id for pet, _ in controller.iter_pets_with_owners(batch_size=9, sort="name")] == [pet.id for pet in pets]
+
+
+@pytest.mark.parametrize("sort", ["id", "name"])
+def test_pages_by_position_match_the_keyset_walk(controller, sort):
+    expected = [pet.id for pet, _ in _walk(controller, sort, 50)]
+    for position in (0, 1, 17, 120, 229):
+        pets, owners = controller.page_pets_at(position, 25, sort)
+        assert [pet.id for pet in pets] == expected[position:position + 25]
+        assert len(owners) == len(pets)
+    assert controller.page_pets_at(230, 25, sort) == ([], [])
+
+
+def test_unknown_sort_is_rejected(controller):
+    with pytest.raises(ValueError):
+        controller.page_pets(sort="breed")
+    with pytest.raises(ValueError):
+        controller.page_pets_at(10, sort="breed")
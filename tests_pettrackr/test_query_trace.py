@@ -0,0 +1,68 @@
+# File: tests_pettrackr/test_query_trace.py
+# Query tracing: what the recent list keeps, and reading it while other threads query.
+# Run with: python -m pytest tests_pettrackr/test_query_trace.py
+import sqlite3
+import threading
+
+import pytest
+
+from backend.database_handlers.connection_manager import get_connection
+from backend.database_handlers.query_trace import TracedConnection, configure_tracing, query_tracer
+from benchmarks.synthetic_data import SyntheticDataset
+
+
+@pytest.fixture
+def traced_dataset():
+    enabled, slow_log_path = query_tracer.enabled, query_tracer.slow_log_path
+    configure_tracing(enabled=True, slow_log_path=None)
+    query_tracer.reset()
+    with SyntheticDataset(3, 20, 0, seed=3) as dataset:
+        yield dataset
+    configure_tracing(enabled=enabled, slow_log_path=slow_log_path)
+    query_tracer.reset()
+
+
+def test_recent_statements_keep_no_parameter_values(traced_dataset):
+    from backend.controllers.pet_controller import PetController
+    pet, owner = PetController().get_pet_by_id(7)
+    recent = [entry["sql"] for entry in query_tracer.snapshot()["recent"]]
+    assert any("WHERE p.id = ?" in sql for sql in recent)
+    assert not any(owner.contact_number in sql or owner.name in sql for sql in recent)
+
+
+def test_snapshot_while_other_threads_query(traced_dataset):
+    from backend.controllers.pet_controller import PetController
+    stop = threading.Event()
+    errors = []
+
+    def worker():
+        controller = PetController()
+        try:
+            while not stop.is_set():
+                controller.page_pets(limit=5)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    try:
+        for _ in range(300):
+            query_tracer.snapshot()
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+    assert not errors
+
+
+def test_connections_are_plain_while_tracing_is_off(tmp_path):
+    enabled = query_tracer.enabled
+    configure_tracing(enabled=False)
+    try:
+        conn = get_connection(str(tmp_path / "plain.db"))
+        assert type(conn) is sqlite3.Connection
+        configure_tracing(enabled=True)
+        assert isinstance(get_connection(str(tmp_path / "traced.db")), TracedConnection)
+    finally:
+        configure_tracing(enabled=enabled)
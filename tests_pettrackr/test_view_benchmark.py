@@ -0,0 +1,30 @@
+# File: tests_pettrackr/test_view_benchmark.py
+# Smoke test of the view benchmark; needs a display or Xvfb.
+# Run with: python -m pytest tests_pettrackr/test_view_benchmark.py
+import os
+import shutil
+
+import pytest
+
+from benchmarks import view_benchmark
+from benchmarks.bench_utils import load_json
+
+needs_display = pytest.mark.skipif(not os.environ.get("DISPLAY") and not shutil.which("Xvfb"),
+                                   reason="no display and Xvfb is not installed")
+
+
+def test_rss_is_reported():
+    rss = view_benchmark.rss_kb()
+    assert rss is None or rss > 0
+
+
+@needs_display
+def test_view_benchmark_run_and_baseline(tmp_path):
+    baseline = str(tmp_path / "baseline.json")
+    args = ["--sizes", "40", "--repeat", "1", "--baseline", baseline]
+    assert view_benchmark.main(args + ["--save-baseline"]) == 0
+    results = load_json(baseline)["results"]
+    assert {f"40.{view}.{phase}" for view in ("view_pets", "vaccination_visits", "pet_profile")
+            for phase in view_benchmark.PHASES} == set(results)
+    assert all(results[f"40.{view}.ready"]["widgets"] > 0 for view in ("view_pets", "vaccination_visits", "pet_profile"))
+    assert view_benchmark.main(args + ["--tolerance", "100"]) == 0
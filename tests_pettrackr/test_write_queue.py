@@ -0,0 +1,45 @@
+# File: tests_pettrackr/test_write_queue.py
+# Closing the write-behind queue while other threads are still submitting.
+# Run with: python -m pytest tests_pettrackr/test_write_queue.py
+import threading
+
+from backend.services.write_queue import WriteQueue
+from benchmarks.synthetic_data import SyntheticDataset
+
+
+class _Touch:
+    """Smallest command the writer accepts."""
+
+    def apply(self, cursor):
+        cursor.execute("SELECT COUNT(*) FROM pets")
+
+    def undo(self):
+        pass
+
+    def finish(self):
+        return "written"
+
+
+def test_close_never_strands_a_submitted_command():
+    with SyntheticDataset(1, 1, 0):
+        for _ in range(400):
+            write_queue = WriteQueue(coalesce_window=0)
+            futures, refused = [], []
+
+            def submitter():
+                for _ in range(50):
+                    try:
+                        futures.append(write_queue.submit(_Touch()))
+                    except RuntimeError:
+                        refused.append(True)
+                        return
+
+            threads = [threading.Thread(target=submitter) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            write_queue.close(timeout=10)
+            for thread in threads:
+                thread.join()
+            # Everything accepted before close() is written; flush() returns
+            assert all(future.result(timeout=5) == "written" for future in futures)
+            write_queue.flush()